@@ -0,0 +1,11 @@
+# benchmarks
+# Performance benchmarks for the confire module
+#
+# For license information, see LICENSE.txt
+
+"""
+Performance benchmarks for the confire module. Each module in this package
+can be run directly, e.g. `python -m benchmarks.access`. The regression
+suite in `benchmarks.suite` times all of the hot paths over a grid of
+synthetic configurations and saves the results to `benchmarks/results`.
+"""
@@ -0,0 +1,110 @@
+# benchmarks.access
+# Microbenchmarks for the Configuration lookup methods
+#
+# For license information, see LICENSE.txt
+
+"""
+Microbenchmarks for the Configuration lookup methods. Compares the options
+index lookup against the previous hasattr/getattr based lookup for hits,
+misses and get() with a default, and a compiled accessor against nested
+item access.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import timeit
+
+from confire import Configuration
+
+##########################################################################
+## Benchmark Configurations
+##########################################################################
+
+class DatabaseConfiguration(Configuration):
+
+    host = "localhost"
+    port = 5432
+
+
+class BenchConfiguration(Configuration):
+
+    CONF_PATHS = []
+
+    debug    = True
+    testing  = False
+    workers  = 8
+    database = DatabaseConfiguration()
+
+
+def legacy_getitem(config, key):
+    """
+    The hasattr/getattr based lookup used before the options index.
+    """
+    key = key.lower()
+    if hasattr(config, key):
+        attr = getattr(config, key)
+        if not callable(attr) and not key.startswith('_'):
+            return attr
+    raise KeyError(key)
+
+
+def legacy_get(config, key, default=None):
+    try:
+        return legacy_getitem(config, key)
+    except KeyError:
+        return default
+
+
+def legacy_options(config):
+    """
+    The copy and sort based options iteration used before the cache.
+    """
+    keys = config.__class__.__dict__.copy()
+    keys.update(config.__dict__)
+    for opt in sorted(keys.keys()):
+        val = legacy_get(config, opt)
+        if val is not None:
+            yield opt, val
+
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+def run(number=200000):
+    config = BenchConfiguration.load()
+    config.configure(dict(("key{}".format(idx), idx) for idx in range(1000)))
+
+    cases = (
+        ("getitem hit", lambda: config['workers'], lambda: legacy_getitem(config, 'workers')),
+        ("get hit", lambda: config.get('workers'), lambda: legacy_get(config, 'workers')),
+        ("get miss", lambda: config.get('missing', 1), lambda: legacy_get(config, 'missing', 1)),
+        ("get method", lambda: config.get('load', 1), lambda: legacy_get(config, 'load', 1)),
+    )
+
+    port = config.accessor('database.port')
+    cases += (
+        ("nested", lambda: port(), lambda: legacy_getitem(legacy_getitem(config, 'database'), 'port')),
+        ("attribute", lambda: config.database.port, lambda: config.database.port),
+    )
+
+    options = (
+        "options", lambda: list(config.options()), lambda: list(legacy_options(config)),
+    )
+
+    print("{:<12} {:>10} {:>10} {:>8}".format("case", "legacy", "index", "speedup"))
+    for name, current, legacy in cases:
+        told = min(timeit.repeat(legacy, number=number, repeat=3))
+        tnew = min(timeit.repeat(current, number=number, repeat=3))
+        print("{:<12} {:>9.3f}s {:>9.3f}s {:>7.2f}x".format(name, told, tnew, told / tnew))
+
+    name, current, legacy = options
+    told = min(timeit.repeat(legacy, number=number // 1000, repeat=3))
+    tnew = min(timeit.repeat(current, number=number // 1000, repeat=3))
+    print("{:<12} {:>9.3f}s {:>9.3f}s {:>7.2f}x".format(name, told, tnew, told / tnew))
+
+
+if __name__ == '__main__':
+    run()
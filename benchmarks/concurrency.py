@@ -0,0 +1,125 @@
+# benchmarks.concurrency
+# Benchmarks for reading a configuration while it is being updated
+#
+# For license information, see LICENSE.txt
+
+"""
+Benchmarks for reader threads that read a pair of related options while a
+writer thread updates them. Compares configuring a shared configuration in
+place (fast, but readers see torn updates), guarding it with a lock, and
+publishing snapshots with confire.snapshot. Reports the read throughput
+and the number of inconsistent reads for each.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import threading
+
+from confire import Configuration
+from confire.snapshot import Published
+
+##########################################################################
+## Benchmark Configurations
+##########################################################################
+
+class DatabaseConfiguration(Configuration):
+
+    host = "db0"
+    port = 0
+
+
+class BenchConfiguration(Configuration):
+
+    database = DatabaseConfiguration()
+
+
+def update(idx):
+    return {"database": {"host": "db{}".format(idx), "port": idx}}
+
+##########################################################################
+## Strategies
+##########################################################################
+
+def in_place():
+    config = BenchConfiguration()
+    read = lambda: (config.database.host, config.database.port)
+    write = lambda idx: config.configure(update(idx))
+    return read, write
+
+
+def locked():
+    config = BenchConfiguration()
+    lock = threading.Lock()
+
+    def read():
+        with lock:
+            return config.database.host, config.database.port
+
+    def write(idx):
+        with lock:
+            config.configure(update(idx))
+    return read, write
+
+
+def published():
+    snapshots = Published(BenchConfiguration())
+
+    def read():
+        settings = snapshots.current
+        return settings.database.host, settings.database.port
+
+    write = lambda idx: snapshots.update(update(idx))
+    return read, write
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+def measure(strategy, readers=8, duration=1.0):
+    """
+    Runs the reader threads and a writer for the duration and returns the
+    reads per second and the number of inconsistent reads.
+    """
+    read, write = strategy()
+    stopped = threading.Event()
+    counts, torn = [], []
+
+    def reader():
+        count = bad = 0
+        while not stopped.is_set():
+            host, port = read()
+            if host != "db{}".format(port):
+                bad += 1
+            count += 1
+        counts.append(count)
+        torn.append(bad)
+
+    def writer():
+        idx = 0
+        while not stopped.is_set():
+            idx += 1
+            write(idx)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stopped.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / duration, sum(torn)
+
+
+def run(readers=8, duration=1.0):
+    print("{} readers and 1 writer for {}s".format(readers, duration))
+    for name, strategy in (("in place", in_place), ("locked", locked), ("published", published)):
+        rate, torn = measure(strategy, readers, duration)
+        print("{:<12} {:>12,.0f} reads/s {:>8} torn reads".format(name, rate, torn))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,48 @@
+# benchmarks.environ
+# Benchmarks for reading settings from the environment
+#
+# For license information, see LICENSE.txt
+
+"""
+Benchmarks for reading settings from the environment, comparing a single
+environ_overlay scan against one environ_setting lookup per setting.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import timeit
+
+from confire import environ_setting, environ_overlay
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+def run(variables=10000, settings=500, number=20):
+    names = ["BENCH_SECTION{}__KEY{}".format(idx % 50, idx) for idx in range(settings)]
+    noise = ["NOISE_VARIABLE_{}".format(idx) for idx in range(variables - settings)]
+
+    original = os.environ.copy()
+    try:
+        for name in names + noise:
+            os.environ[name] = "value"
+
+        lookups = lambda: [environ_setting(name) for name in names]
+        overlay = lambda: environ_overlay("BENCH")
+
+        tlookups = min(timeit.repeat(lookups, number=number, repeat=3)) / number
+        toverlay = min(timeit.repeat(overlay, number=number, repeat=3)) / number
+    finally:
+        os.environ.clear()
+        os.environ.update(original)
+
+    print("{} variables, {} settings".format(variables, settings))
+    print("{:<16} {:>9.5f}s".format("environ_setting", tlookups))
+    print("{:<16} {:>9.5f}s {:>7.2f}x".format("environ_overlay", toverlay, tlookups / toverlay))
+
+
+if __name__ == '__main__':
+    run()
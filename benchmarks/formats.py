@@ -0,0 +1,96 @@
+# benchmarks.formats
+# Benchmarks for loading the same configuration from different formats
+#
+# For license information, see LICENSE.txt
+
+"""
+Benchmarks for loading the same generated CONF_PATHS stack from YAML, JSON,
+TOML and msgpack files, using the loaders registered by extension. Formats
+whose parser (or, for the benchmark, whose writer) is not installed are
+skipped.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import yaml
+import timeit
+
+from confire import Configuration, loaders
+from benchmarks.generators import config_files
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+##########################################################################
+## Writers
+##########################################################################
+
+def dump_yaml(data, f):
+    yaml.safe_dump(data, f, default_flow_style=False)
+
+
+def dump_json(data, f):
+    json.dump(data, f)
+
+
+def dump_toml(data, f, prefix=""):
+    """
+    Writes the generated configurations (scalars, lists and nested tables)
+    as TOML, since the standard library cannot write TOML.
+    """
+    tables = []
+    for key, value in data.items():
+        if isinstance(value, dict):
+            tables.append((key, value))
+        else:
+            f.write("{} = {}\n".format(key, json.dumps(value)))
+
+    for key, value in tables:
+        name = prefix + key
+        f.write("\n[{}]\n".format(name))
+        dump_toml(value, f, name + ".")
+
+
+def dump_msgpack(data, f):
+    f.buffer.write(msgpack.packb(data))
+
+
+FORMATS = [
+    ("yaml", ".yaml", dump_yaml),
+    ("json", ".json", dump_json),
+]
+
+if loaders.tomllib is not None:
+    FORMATS.append(("toml", ".toml", dump_toml))
+
+if msgpack is not None:
+    FORMATS.append(("msgpack", ".msgpack", dump_msgpack))
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+class BenchConfiguration(Configuration):
+
+    CONF_PATHS = []
+
+
+def run(files=3, keys=5000, depth=2, number=3):
+    print("loading {} files with {} keys at depth {}".format(files, keys, depth))
+    baseline = None
+    for name, ext, dump in FORMATS:
+        with config_files(files=files, keys=keys, depth=depth, ext=ext, dump=dump) as paths:
+            BenchConfiguration.CONF_PATHS = paths
+            elapsed = min(timeit.repeat(BenchConfiguration.load, number=number, repeat=3)) / number
+
+        baseline = baseline or elapsed
+        print("{:<12} {:>9.3f}s {:>7.2f}x".format(name, elapsed, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,68 @@
+# benchmarks.generators
+# Synthetic configuration generators for the benchmarks
+#
+# For license information, see LICENSE.txt
+
+"""
+Synthetic configuration generators for the benchmarks.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import yaml
+import shutil
+import tempfile
+
+from contextlib import contextmanager
+
+##########################################################################
+## Generators
+##########################################################################
+
+def make_config(keys=1000, depth=1, seed=0):
+    """
+    Returns a dictionary with the given number of leaf keys, nested to the
+    specified depth. The seed varies the values so that multiple generated
+    files override each other rather than being identical.
+    """
+    conf = {}
+    for idx in range(keys):
+        node = conf
+        for level in range(depth - 1):
+            node = node.setdefault("level{}_{}".format(level, idx % 10), {})
+
+        key = "key{}".format(idx)
+        if idx % 4 == 0:
+            node[key] = "value {} {}".format(idx, seed)
+        elif idx % 4 == 1:
+            node[key] = idx + seed
+        elif idx % 4 == 2:
+            node[key] = [idx, seed, "item"]
+        else:
+            node[key] = bool((idx + seed) % 2)
+    return conf
+
+
+@contextmanager
+def config_files(files=3, keys=1000, depth=1, ext=".yaml", dump=None):
+    """
+    Writes the specified number of generated configuration files to a
+    temporary directory and yields the list of paths, in CONF_PATHS order.
+    The directory is removed when the context exits.
+    """
+    dump = dump or (lambda data, f: yaml.safe_dump(data, f, default_flow_style=False))
+    tmpdir = tempfile.mkdtemp(prefix="confire_bench_")
+
+    try:
+        paths = []
+        for seed in range(files):
+            path = os.path.join(tmpdir, "conf{}{}".format(seed, ext))
+            with open(path, 'w') as f:
+                dump(make_config(keys, depth, seed), f)
+            paths.append(path)
+        yield paths
+    finally:
+        shutil.rmtree(tmpdir)
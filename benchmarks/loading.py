@@ -0,0 +1,243 @@
+# benchmarks.loading
+# Benchmarks for loading a CONF_PATHS stack from disk
+#
+# For license information, see LICENSE.txt
+
+"""
+Benchmarks for loading a CONF_PATHS stack from disk, comparing the libyaml
+CSafeLoader against the pure-Python SafeLoader, and sequential against
+parallel parsing when file reads are slow (e.g. on a network mount), the
+peak memory of streaming a file into the configuration, loading only the
+declared options of a strict configuration, how long loading blocks an
+asyncio event loop, and the startup time of a command that never reads
+its settings when they are loaded lazily.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import sys
+import time
+import yaml
+import subprocess
+import asyncio
+import timeit
+import tracemalloc
+
+from confire import Configuration, loaders
+from benchmarks.generators import config_files
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+class BenchConfiguration(Configuration):
+
+    CONF_PATHS = []
+
+
+def time_load(Loader, number=3):
+    """
+    Times Configuration.load with the loaders module patched to use Loader.
+    """
+    original = loaders.YAMLLoader
+    loaders.YAMLLoader = Loader
+    try:
+        return min(timeit.repeat(BenchConfiguration.load, number=number, repeat=3)) / number
+    finally:
+        loaders.YAMLLoader = original
+
+
+class slow_open(object):
+    """
+    Wraps open to add latency to every read, simulating a slow mount.
+    """
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+
+    def __call__(self, *args, **kwargs):
+        time.sleep(self.latency)
+        return open(*args, **kwargs)
+
+
+def time_parallel(parallel, latency=0.05, number=3):
+    """
+    Times Configuration.load with slow file reads.
+    """
+    loaders.open = slow_open(latency)
+    try:
+        load = lambda: BenchConfiguration.load(parallel=parallel)
+        return min(timeit.repeat(load, number=number, repeat=3)) / number
+    finally:
+        del loaders.open
+
+
+def run_parallel(files=8, keys=500, latency=0.05):
+    with config_files(files=files, keys=keys) as paths:
+        BenchConfiguration.CONF_PATHS = paths
+        print("loading {} files with {}s read latency".format(files, latency))
+
+        tseq = time_parallel(False, latency)
+        print("{:<12} {:>9.3f}s".format("sequential", tseq))
+
+        tpar = time_parallel(True, latency)
+        print("{:<12} {:>9.3f}s {:>7.2f}x".format("parallel", tpar, tseq / tpar))
+
+
+def run_loaders(files=6, keys=5000):
+    with config_files(files=files, keys=keys, depth=3) as paths:
+        BenchConfiguration.CONF_PATHS = paths
+        print("loading {} files with {} keys each".format(files, keys))
+
+        tpure = time_load(yaml.SafeLoader)
+        print("{:<12} {:>9.3f}s".format("SafeLoader", tpure))
+
+        if not yaml.__with_libyaml__:
+            print("CSafeLoader unavailable, PyYAML is not built with libyaml")
+            return
+
+        tfast = time_load(yaml.CSafeLoader)
+        print("{:<12} {:>9.3f}s {:>7.2f}x".format("CSafeLoader", tfast, tpure / tfast))
+
+
+def peak(func):
+    """
+    Returns the peak bytes allocated while calling func.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_streaming(keys=20000):
+    with config_files(files=1, keys=keys, depth=1) as paths:
+        BenchConfiguration.CONF_PATHS = paths
+        print("loading 1 file with {} keys".format(keys))
+
+        for name, streaming in (("load", False), ("streaming", True)):
+            load = lambda: BenchConfiguration.load(streaming=streaming)
+            elapsed = min(timeit.repeat(load, number=1, repeat=3))
+            print("{:<12} {:>9.3f}s {:>12} peak bytes".format(name, elapsed, peak(load)))
+
+
+class StrictConfiguration(Configuration):
+
+    CONF_PATHS = []
+    STRICT_OPTIONS = True
+
+    key0 = None
+    key1 = None
+    key2 = None
+
+
+def run_strict(keys=20000):
+    with config_files(files=1, keys=keys, depth=1) as paths:
+        BenchConfiguration.CONF_PATHS = paths
+        StrictConfiguration.CONF_PATHS = paths
+        print("loading 3 declared options from 1 file with {} keys".format(keys))
+
+        for name, klass in (("all", BenchConfiguration), ("strict", StrictConfiguration)):
+            elapsed = min(timeit.repeat(klass.load, number=1, repeat=3))
+            print("{:<12} {:>9.3f}s {:>12} peak bytes".format(name, elapsed, peak(klass.load)))
+
+
+def stalls(load):
+    """
+    Runs load on an event loop alongside a task that ticks every 1ms and
+    returns the elapsed time of the load and the longest gap between ticks.
+    """
+    async def main():
+        gaps = []
+
+        async def ticker():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.001)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0.01)
+        started = time.perf_counter()
+        await load()
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0.01)
+        task.cancel()
+        return elapsed, max(gaps)
+
+    return asyncio.run(main())
+
+
+def run_async(files=8, keys=500, latency=0.05):
+    async def blocking():
+        BenchConfiguration.load()
+
+    with config_files(files=files, keys=keys) as paths:
+        BenchConfiguration.CONF_PATHS = paths
+        print("loading {} files with {}s read latency on an event loop".format(files, latency))
+
+        loaders.open = slow_open(latency)
+        try:
+            for name, load in (("load", blocking), ("aload", BenchConfiguration.aload)):
+                elapsed, stall = stalls(load)
+                print("{:<12} {:>9.3f}s {:>9.3f}s max loop stall".format(name, elapsed, stall))
+        finally:
+            del loaders.open
+
+
+# A command line program that defines its settings at import time, with
+# either load or lazy_load, but exits without reading them
+STARTUP = """
+import sys
+from confire import Configuration
+
+class CommandConfiguration(Configuration):
+
+    CONF_PATHS = sys.argv[2:]
+
+settings = getattr(CommandConfiguration, sys.argv[1])()
+"""
+
+
+def time_startup(method, paths, number=5):
+    """
+    Returns the best wall clock time of running the startup program.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, "-c", STARTUP, method] + list(paths)
+    timings = []
+    for _ in range(number):
+        started = time.perf_counter()
+        subprocess.check_call(command, cwd=root)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run_lazy(files=3, keys=5000):
+    with config_files(files=files, keys=keys) as paths:
+        print("starting a command with {} files of {} keys".format(files, keys))
+        eager = time_startup("load", paths)
+        lazy  = time_startup("lazy_load", paths)
+
+    print("{:<12} {:>9.3f}s".format("load", eager))
+    print("{:<12} {:>9.3f}s {:>7.2f}x".format("lazy_load", lazy, eager / lazy))
+
+
+def run():
+    run_loaders()
+    run_parallel()
+    run_streaming()
+    run_strict()
+    run_async()
+    run_lazy()
+
+
+if __name__ == '__main__':
+    run()
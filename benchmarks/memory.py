@@ -0,0 +1,108 @@
+# benchmarks.memory
+# Memory benchmarks for the configuration storage layouts
+#
+# For license information, see LICENSE.txt
+
+"""
+Memory benchmarks for the configuration storage layouts, measured with
+tracemalloc as the memory allocated while building each layout.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import gc
+import tracemalloc
+
+from confire import Configuration
+from confire.flat import FlatConfiguration
+from benchmarks.generators import make_config
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+class BenchConfiguration(Configuration):
+
+    CONF_PATHS = []
+
+
+def measure(build):
+    """
+    Returns the bytes still allocated by build() after it returns; anything
+    it allocated that was not retained by its result is not counted.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        after  = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def mutable(keys, depth=1):
+    """
+    Builds a mutable configuration that owns its parsed values.
+    """
+    config = BenchConfiguration()
+    config.configure(make_config(keys, depth))
+    return config
+
+
+def sections(keys, width=10):
+    """
+    Builds a mutable configuration in which every group of width keys is
+    held by a nested Configuration, e.g. per-tenant feature tables.
+    """
+    config = BenchConfiguration()
+    for idx in range(keys // width):
+        section = BenchConfiguration()
+        section.configure(make_config(width, seed=idx))
+        setattr(config, "tenant{}".format(idx), section)
+    return config
+
+
+def flat(keys, depth=1):
+    """
+    Builds a flat, array-backed configuration.
+    """
+    config = FlatConfiguration.from_config(BenchConfiguration())
+    config.configure(make_config(keys, depth))
+    return config
+
+
+def frozen(keys, depth=1):
+    """
+    Builds a frozen snapshot, discarding the mutable configuration.
+    """
+    return mutable(keys, depth).freeze()
+
+
+def run(keys=10000):
+    for depth in (1, 3):
+        print("{} keys, depth {}".format(keys, depth))
+        _, base = measure(lambda: mutable(keys, depth))
+        print("{:<12} {:>10} bytes".format("mutable", base))
+
+        # Measure the second snapshot so the shared layout is not counted
+        layout = frozen(keys, depth)
+        _, size = measure(lambda: frozen(keys, depth))
+        print("{:<12} {:>10} bytes {:>6.2f}x".format("frozen", size, base / size))
+        del layout
+
+        _, size = measure(lambda: flat(keys, depth))
+        print("{:<12} {:>10} bytes {:>6.2f}x".format("flat", size, base / size))
+
+    print("{} keys in nested configurations".format(keys))
+    _, base = measure(lambda: sections(keys))
+    print("{:<12} {:>10} bytes".format("mutable", base))
+    _, size = measure(lambda: FlatConfiguration.from_config(sections(keys)))
+    print("{:<12} {:>10} bytes {:>6.2f}x".format("flat", size, base / size))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,69 @@
+# benchmarks.shared
+# Benchmarks for configurations shared between processes through mmap
+#
+# For license information, see LICENSE.txt
+
+"""
+Benchmarks for a worker attaching to a shared configuration segment rather
+than loading the CONF_PATHS stack itself, the latency of a lookup in the
+segment compared with a lookup on a loaded configuration, and the
+cost of the per-request version check.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import timeit
+import tempfile
+
+from confire import Configuration
+from confire.shared import Segment
+from benchmarks.generators import config_files
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+class BenchConfiguration(Configuration):
+
+    CONF_PATHS = []
+    debug      = False
+
+
+def run(files=3, keys=5000, depth=2, number=1000):
+    print("sharing {} files with {} keys at depth {}".format(files, keys, depth))
+    with config_files(files=files, keys=keys, depth=depth) as paths:
+        BenchConfiguration.CONF_PATHS = paths
+        config = BenchConfiguration.load()
+        load = min(timeit.repeat(BenchConfiguration.load, number=1, repeat=3))
+
+    fd, path = tempfile.mkstemp(suffix=".conf")
+    os.close(fd)
+    try:
+        config.share(path)
+        attach  = min(timeit.repeat(lambda: Segment(path).settings, number=number, repeat=3)) / number
+        segment = Segment(path)
+        stale   = min(timeit.repeat(segment.stale, number=number, repeat=3)) / number
+
+        # The generated options are large mappings, which are decoded in
+        # full by each lookup, so also time a scalar option.
+        name = next(opt for opt, val in config.options() if isinstance(val, dict))
+        settings = segment.settings
+        local  = min(timeit.repeat(lambda: config.get("debug"), number=number, repeat=3)) / number
+        mapped = min(timeit.repeat(lambda: settings.get("debug"), number=number, repeat=3)) / number
+        large  = min(timeit.repeat(lambda: settings.get(name), number=number, repeat=3)) / number
+    finally:
+        os.remove(path)
+
+    print("{:<12} {:>12.6f}s".format("load", load))
+    print("{:<12} {:>12.6f}s {:>9.1f}x".format("attach", attach, load / attach))
+    print("{:<12} {:>12.6f}s".format("stale", stale))
+    print("{:<12} {:>12.6f}s".format("get", local))
+    print("{:<12} {:>12.6f}s {:>9.1f}x".format("shared get", mapped, mapped / local))
+    print("{:<12} {:>12.6f}s".format("mapping get", large))
+
+
+if __name__ == '__main__':
+    run()
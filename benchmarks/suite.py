@@ -0,0 +1,292 @@
+# benchmarks.suite
+# Regression benchmark suite for the configuration hot paths
+#
+# For license information, see LICENSE.txt
+
+"""
+Regression benchmark suite for the configuration hot paths. Each benchmark
+is timed across a grid of synthetic configurations (flat and deeply nested,
+10 to 100k keys, 1 to 10 CONF_PATHS files) and the results can be saved as
+JSON, keyed by the confire version, and compared against a previous run:
+
+    python -m benchmarks.suite --save
+    python -m benchmarks.suite --compare benchmarks/results/0.3-....json
+
+By default a quick grid is run; pass --full for the complete grid.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import itertools
+import tempfile
+import shutil
+
+import confire
+
+from confire import Configuration, path_setting
+from benchmarks.generators import config_files, make_config
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+RESULTS = os.path.join(os.path.dirname(__file__), "results")
+
+QUICK = {
+    "keys":  (10, 1000),
+    "depth": (1, 5),
+    "files": (1, 3),
+}
+
+FULL = {
+    "keys":  (10, 1000, 10000, 100000),
+    "depth": (1, 5),
+    "files": (1, 3, 10),
+}
+
+##########################################################################
+## Benchmark registry
+##########################################################################
+
+BENCHMARKS = []
+
+
+def benchmark(*params):
+    """
+    Registers a benchmark that is run for every combination of the named
+    grid parameters. The function receives the parameters and returns the
+    callable to time; any setup happens before returning it.
+    """
+    def decorator(func):
+        BENCHMARKS.append((func.__name__, params, func))
+        return func
+    return decorator
+
+
+class BenchConfiguration(Configuration):
+
+    CONF_PATHS = []
+
+
+def configured(keys, depth):
+    config = BenchConfiguration()
+    config.configure(make_config(keys, depth))
+    return config
+
+##########################################################################
+## Benchmarks
+##########################################################################
+
+@benchmark("keys", "depth", "files")
+def load(keys, depth, files):
+    with config_files(files=files, keys=keys, depth=depth) as paths:
+        BenchConfiguration.CONF_PATHS = paths
+        yield BenchConfiguration.load
+        BenchConfiguration.CONF_PATHS = []
+
+
+@benchmark("keys", "depth")
+def configure(keys, depth):
+    data = make_config(keys, depth)
+    yield lambda: BenchConfiguration().configure(data)
+
+
+@benchmark("keys")
+def getitem_hit(keys):
+    config = configured(keys, 1)
+    yield lambda: config["key0"]
+
+
+@benchmark("keys")
+def getitem_miss(keys):
+    config = configured(keys, 1)
+
+    def miss():
+        try:
+            config["missing"]
+        except KeyError:
+            pass
+    yield miss
+
+
+@benchmark("keys")
+def get_default(keys):
+    config = configured(keys, 1)
+    yield lambda: config.get("missing", 1)
+
+
+@benchmark("keys", "depth")
+def options(keys, depth):
+    config = configured(keys, depth)
+    yield lambda: list(config.options())
+
+
+@benchmark("keys", "depth")
+def render(keys, depth):
+    config = configured(keys, depth)
+    yield lambda: str(config)
+
+
+@benchmark("keys", "depth")
+def fingerprint(keys, depth):
+    config = configured(keys, depth)
+    config.fingerprint()
+
+    def change():
+        config.key0 = not config.get("key0")
+        return config.fingerprint()
+    yield change
+
+
+@benchmark("keys", "depth")
+def diff(keys, depth):
+    old, new = configured(keys, depth), configured(keys, depth)
+
+    def change():
+        new.key0 = not new.get("key0")
+        return old.diff(new)
+    yield change
+
+
+@benchmark("keys")
+def overlay(keys):
+    config = configured(keys, 1)
+    overrides = {"key0": "override", "key1": 0}
+    yield lambda: config.overlay(overrides)
+
+
+@benchmark()
+def path_assignment():
+    tmpdir = tempfile.mkdtemp(prefix="confire_bench_")
+
+    class PathConfiguration(Configuration):
+
+        CONF_PATHS = []
+        path = path_setting()
+
+    config = PathConfiguration()
+
+    def assign():
+        config.path = tmpdir
+
+    yield assign
+    shutil.rmtree(tmpdir)
+
+##########################################################################
+## Runner
+##########################################################################
+
+def timed(func, budget=0.2):
+    """
+    Returns the best seconds per call of func, using timeit's autorange to
+    pick the number of loops and repeating for roughly the time budget.
+    """
+    timer  = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    repeat = max(3, min(10, int(budget / max(elapsed, 1e-9))))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(grid, select=None, out=sys.stdout):
+    """
+    Runs the registered benchmarks over the grid and returns the results as
+    a dictionary of "name[param=value,...]" to seconds per call.
+    """
+    results = {}
+    for name, params, func in BENCHMARKS:
+        if select and not any(pattern in name for pattern in select):
+            continue
+
+        for values in itertools.product(*(grid[param] for param in params)):
+            kwargs = dict(zip(params, values))
+            key = "{}[{}]".format(name, ",".join(
+                "{}={}".format(param, kwargs[param]) for param in params
+            ))
+
+            setup = func(**kwargs)
+            results[key] = timed(next(setup))
+            for _ in setup:
+                pass
+
+            out.write("{:<48} {:>12.3f}us\n".format(key, results[key] * 1e6))
+    return results
+
+
+def save(results, path=None):
+    """
+    Saves the results along with the version and machine information.
+    """
+    if path is None:
+        if not os.path.exists(RESULTS):
+            os.makedirs(RESULTS)
+        path = os.path.join(RESULTS, "{}-{}.json".format(
+            confire.__version__, time.strftime("%Y%m%d%H%M%S")
+        ))
+
+    with open(path, 'w') as f:
+        json.dump({
+            "version": confire.__version__,
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "timestamp": time.time(),
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+    return path
+
+
+def compare(results, path, threshold=0.1, out=sys.stdout):
+    """
+    Compares the results against a saved run and reports the benchmarks
+    that are slower by more than the threshold. Returns the regressions.
+    """
+    with open(path, 'r') as f:
+        baseline = json.load(f)
+
+    out.write("\ncompared to {} ({})\n".format(baseline["version"], path))
+    regressions = []
+    for key in sorted(results):
+        if key not in baseline["results"]:
+            continue
+
+        ratio = results[key] / baseline["results"][key]
+        flag  = ""
+        if ratio > 1 + threshold:
+            flag = "REGRESSION"
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            flag = "improved"
+        out.write("{:<48} {:>8.2f}x {}\n".format(key, ratio, flag))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="confire benchmark suite")
+    parser.add_argument("select", nargs="*", help="only run matching benchmarks")
+    parser.add_argument("--full", action="store_true", help="run the full grid")
+    parser.add_argument("--save", nargs="?", const="", metavar="PATH", help="save the results")
+    parser.add_argument("--compare", metavar="PATH", help="compare against saved results")
+    parser.add_argument("--threshold", type=float, default=0.1, help="regression threshold")
+    args = parser.parse_args(argv)
+
+    results = run(FULL if args.full else QUICK, args.select)
+
+    if args.save is not None:
+        print("\nsaved results to {}".format(save(results, args.save or None)))
+
+    if args.compare:
+        if compare(results, args.compare, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
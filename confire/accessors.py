@@ -0,0 +1,201 @@
+# confire.accessors
+# Compiled accessors for reading nested settings in hot loops
+#
+# For license information, see LICENSE.txt
+
+"""
+Compiled accessors and bulk dotted path access for nested settings. An accessor
+resolves a dotted path such as "database.port" once and caches the value
+along with the version of every configuration along the path:
+
+    port = settings.accessor('database.port')
+    port()
+
+Calling the accessor only compares those versions; the path is resolved
+again when any of the configurations along it has been modified (through
+setattr, delattr or configure) or when a Configuration class attribute has
+changed.
+
+Many dotted paths can be read or written at once with get_many and
+set_many; the paths are arranged into a prefix trie so that each shared
+prefix (e.g. "database" in "database.host" and "database.port") is
+resolved only once rather than once per path.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from copy import copy
+from functools import lru_cache
+
+from . import descriptors
+from .exceptions import ImproperlyConfigured
+
+##########################################################################
+## Accessor
+##########################################################################
+
+class Accessor(object):
+    """
+    A callable that returns the value of the option at the dotted path of
+    the configuration, raising a KeyError if the path does not exist.
+    """
+
+    __slots__ = ('config', 'path', 'keys', '_chain', '_tail', '_value', '_generation')
+
+    def __init__(self, config, path):
+        self.config = config
+        self.path   = path
+        self.keys   = tuple(path.split('.'))
+        self._resolve()
+
+    def _resolve(self):
+        """
+        Walks the path, recording the (configuration, version) pairs that
+        the cached value depends on. If the path descends into a value that
+        is not a configuration, e.g. a dict, the remaining keys are stored
+        as a tail that is looked up on every call since it is not versioned.
+        """
+        self._generation = descriptors.generation
+        chain = []
+        value = self.config
+        for idx, key in enumerate(self.keys):
+            if not hasattr(value, '_version'):
+                self._chain, self._tail, self._value = tuple(chain), self.keys[idx:], value
+                return self._lookup_tail()
+
+            chain.append((value, value._version))
+            value = value[key]
+
+        self._chain, self._tail, self._value = tuple(chain), (), value
+        return value
+
+    def _lookup_tail(self):
+        value = self._value
+        for key in self._tail:
+            value = value[key]
+        return value
+
+    def __call__(self):
+        if self._generation != descriptors.generation:
+            return self._resolve()
+
+        for config, version in self._chain:
+            if config._version != version:
+                return self._resolve()
+
+        if self._tail:
+            return self._lookup_tail()
+        return self._value
+
+    def __repr__(self):
+        return "<{} {!r}>".format(self.__class__.__name__, self.path)
+
+
+##########################################################################
+## Dotted path trie
+##########################################################################
+
+# Marks the node at which a requested path ends
+LEAF = None
+
+
+@lru_cache(maxsize=256)
+def build_trie(paths):
+    """
+    Builds a prefix trie from a tuple of dotted paths. Each node maps a key
+    to its child node, and the LEAF key of a node holds the full path that
+    ends there. Tries are cached since callers tend to repeat batches.
+    """
+    root = {}
+    for path in paths:
+        node = root
+        for key in path.split('.'):
+            node = node.setdefault(key, {})
+        node[LEAF] = path
+    return root
+
+
+def leaves(node):
+    """
+    Yields every path that ends at or below the node.
+    """
+    for key, child in node.items():
+        if key is LEAF:
+            yield child
+        else:
+            for path in leaves(child):
+                yield path
+
+
+def get_many(config, paths, default=None):
+    """
+    Returns a dictionary of the values at each of the dotted paths, or the
+    default for paths that do not exist.
+    """
+    results = {}
+    _get_many(config, build_trie(tuple(paths)), default, results)
+    return results
+
+
+def _get_many(value, node, default, results):
+    for key, child in node.items():
+        if key is LEAF:
+            continue
+
+        try:
+            item = value[key]
+        except (KeyError, IndexError, TypeError, ImproperlyConfigured):
+            for path in leaves(child):
+                results[path] = default
+            continue
+
+        if LEAF in child:
+            results[child[LEAF]] = item
+        if len(child) > (LEAF in child):
+            _get_many(item, child, default, results)
+
+
+def set_many(config, values):
+    """
+    Sets the value at each of the dotted paths in the dictionary. Options
+    are set on configurations (and nested configurations) with setattr as
+    configure does; keys below a value that is not a configuration are set
+    on a copy of the dict, which is created if the key does not exist yet,
+    so that dicts shared with the class or other instances never change.
+    """
+    _set_many(config, build_trie(tuple(values)), values)
+
+
+def _set_many(target, node, values):
+    for key, child in node.items():
+        if key is LEAF:
+            continue
+
+        if LEAF in child:
+            _set(target, key, values[child[LEAF]])
+
+        if len(child) > (LEAF in child):
+            try:
+                item = target[key]
+            except (KeyError, ImproperlyConfigured):
+                item = None
+
+            if not hasattr(item, '__setitem__') and not hasattr(item, '_version'):
+                item = {}
+                _set(target, key, item)
+            elif hasattr(item, '_owned') and hasattr(target, '_owned'):
+                item = target._owned(key, item)
+            elif not hasattr(item, '_version'):
+                # The dict may be a class attribute or shared with a copy
+                item = copy(item)
+                _set(target, key, item)
+            _set_many(item, child, values)
+
+
+def _set(target, key, value):
+    if hasattr(target, '_version'):
+        setattr(target, key, value)
+    else:
+        target[key] = value
@@ -0,0 +1,181 @@
+# confire.aio
+# Loading and reloading configurations from asyncio applications
+#
+# For license information, see LICENSE.txt
+
+"""
+Loading and reloading configurations without blocking the asyncio event
+loop. All file system access (checking and reading the CONF_PATHS and the
+existence checks and directory creation of Path settings) and parsing are
+run in an executor, the default executor of the loop unless one is given:
+
+    settings = await MyConfig.aload()
+
+The files are read and parsed concurrently, then the documents are
+applied with apply_documents in CONF_PATHS order, so the result is the
+same as Configuration.load.
+
+The AsyncReloader is the asyncio counterpart of the Reloader: reloads run
+in the executor and subscribers, which may be coroutine functions, are
+called on the loop. If inotify_simple is installed, the inotify file
+descriptor is registered with the loop (add_reader) to wake the reloader
+as soon as a file changes; otherwise the files are polled every interval.
+
+    reloader = AsyncReloader(MyConfig)
+    await reloader.start()
+    ...
+    await reloader.stop()
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import asyncio
+import inspect
+import warnings
+
+from timeit import default_timer as timer
+from . import reload
+from . import instrument
+from .loaders import load_path
+from .exceptions import ReloadFailed
+
+##########################################################################
+## Loading
+##########################################################################
+
+def existing(paths):
+    """
+    Returns the paths that exist, in order.
+    """
+    return [path for path in paths if os.path.exists(path)]
+
+
+async def aload(klass, executor=None):
+    """
+    Loads the configuration of the class as Configuration.load does while
+    running all file system access and parsing in the executor.
+    """
+    loop = asyncio.get_running_loop()
+    started = timer() if instrument.HOOKS else None
+
+    if klass.CONF_CACHE:
+        documents = await loop.run_in_executor(executor, klass.parse_conf_paths)
+    else:
+        paths = await loop.run_in_executor(executor, existing, klass.CONF_PATHS)
+        documents = await asyncio.gather(*[
+            loop.run_in_executor(executor, load_path, path) for path in paths
+        ])
+
+    config = await loop.run_in_executor(
+        executor, klass.apply_documents, klass(), list(documents)
+    )
+
+    if started is not None:
+        instrument.emit(
+            'load', klass=klass, files=len(documents), seconds=timer() - started,
+        )
+    return config
+
+##########################################################################
+## Reloading
+##########################################################################
+
+class AsyncReloader(reload.BaseReloader):
+    """
+    Reloader for asyncio applications. The configuration is not loaded
+    until check or start is awaited.
+    """
+
+    def __init__(self, klass, interval=1.0, executor=None):
+        super(AsyncReloader, self).__init__(klass, interval)
+        self.executor = executor
+        self._task = None
+
+    async def check(self):
+        """
+        Reparses any changed configuration files in the executor and, if
+        anything changed, publishes a new configuration and notifies (and
+        awaits) the subscribers. Returns the Diff of the reload or None.
+        """
+        loop = asyncio.get_running_loop()
+        published = await loop.run_in_executor(self.executor, self._update)
+        if published is None:
+            return None
+
+        old, config = published
+        delta = old.diff(config)
+        for callback in list(self.callbacks):
+            result = callback(config, delta)
+            if inspect.isawaitable(result):
+                await result
+        return delta
+
+    async def start(self):
+        """
+        Loads the configuration if needed and starts a task on the running
+        loop that watches the CONF_PATHS for changes.
+        """
+        if self._task is not None:
+            return
+
+        if self.published.current is None:
+            await self.check()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """
+        Cancels the watcher task and waits for it to exit.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _reload(self):
+        try:
+            await self.check()
+        except asyncio.CancelledError:
+            # CancelledError is an Exception before Python 3.8
+            raise
+        except Exception as e:
+            warnings.warn(ReloadFailed(
+                "Could not reload {}: {}".format(self.klass.__name__, e)
+            ))
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        inotify = None
+        if reload.inotify_simple:
+            inotify = await loop.run_in_executor(
+                self.executor, reload.watch, self.klass.CONF_PATHS
+            )
+
+            def readable():
+                inotify.read(timeout=0)
+                wakeup.set()
+            loop.add_reader(inotify.fileno(), readable)
+
+        try:
+            # Events only wake the task early; changes are still detected
+            # with stat so that directories created later are not missed.
+            while True:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+                await self._reload()
+        finally:
+            if inotify is not None:
+                loop.remove_reader(inotify.fileno())
+                inotify.close()
@@ -0,0 +1,91 @@
+# confire.cache
+# An on-disk cache of the parsed CONF_PATHS stack
+#
+# For license information, see LICENSE.txt
+
+"""
+An on-disk cache of the parsed CONF_PATHS stack. The cache stores the data
+parsed from every configuration file in marshal format, keyed on the path,
+mtime, size and inode of each file. If any of those change (or a file is
+created or removed) the key no longer matches and the files are reparsed.
+
+Only the types that marshal supports (the types produced by JSON-like YAML
+documents) can be cached; if a configuration file contains other types,
+e.g. timestamps, the stack is simply not cached.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import marshal
+import tempfile
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+CACHE_VERSION = 1
+
+##########################################################################
+## Cache functions
+##########################################################################
+
+def cache_key(paths):
+    """
+    Computes the cache key for a list of configuration paths. Paths that do
+    not exist are part of the key so that creating them invalidates it.
+    """
+    key = [CACHE_VERSION]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            key.append((path, None))
+        else:
+            key.append((path, stat.st_mtime_ns, stat.st_size, stat.st_ino))
+    return tuple(key)
+
+
+def read_cache(cache_path, key):
+    """
+    Returns the cached list of parsed documents if the cache file exists
+    and was written with the same key, otherwise returns None.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, documents = marshal.load(f)
+    except (OSError, IOError, EOFError, ValueError, TypeError):
+        return None
+
+    if cached_key != key:
+        return None
+    return documents
+
+
+def write_cache(cache_path, key, documents):
+    """
+    Atomically writes the parsed documents to the cache file. Returns False
+    if the documents cannot be marshaled or the file cannot be written.
+    """
+    try:
+        data = marshal.dumps((key, documents))
+    except ValueError:
+        return False
+
+    dirname = os.path.dirname(os.path.abspath(cache_path))
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=".confire", dir=dirname)
+    except (OSError, IOError):
+        return False
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, cache_path)
+    except (OSError, IOError):
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+    return True
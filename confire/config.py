@@ -39,12 +39,18 @@ dictionary-like access.
 ##########################################################################
 
 import os
-import yaml
 import warnings
 
+from copy import copy
+from timeit import default_timer as timer
 from six import with_metaclass
 
-from .paths import Path
+from . import cache
+from . import instrument
+from .paths import Path, deferred_paths
+from .lazy import LazyConfiguration
+from .accessors import Accessor, get_many, set_many
+from .loaders import load_path
 from .descriptors import SettingsMeta
 from .exceptions import ImproperlyConfigured, ConfigurationMissing
 
@@ -71,6 +77,62 @@ def environ_setting(name, default=None, required=True):
 
     return os.environ.get(name, default)
 
+def environ_overlay(prefix, environ=None):
+    """
+    Builds a nested dictionary of configuration overrides from all of the
+    environment variables that start with the given prefix, in a single
+    scan of the environment. The prefix is separated from the key by an
+    underscore and nested keys are separated by a double underscore:
+
+        MYAPP_DEBUG=false           -> {'debug': 'false'}
+        MYAPP_DATABASE__HOST=db     -> {'database': {'host': 'db'}}
+
+    Keys are lowercased and values are left as strings, as they are with
+    environ_setting. The result can be passed directly to configure.
+
+    The scan is linear in the size of the environment, so it is not faster
+    than looking up a few hundred declared names with environ_setting in a
+    large environment (see benchmarks/environ.py); its advantage is that it
+    finds any key, including nested ones, that is not declared up front.
+    """
+    environ = os.environ if environ is None else environ
+    prefix = prefix.rstrip('_') + '_'
+    offset = len(prefix)
+
+    overlay = {}
+    for name, value in environ_items(environ, prefix):
+        keys = name[offset:].lower().split('__')
+        if not all(keys):
+            continue
+
+        node = overlay
+        for key in keys[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+        node.setdefault(keys[-1], value)
+    return overlay
+
+def environ_items(environ, prefix):
+    """
+    Returns the (name, value) pairs of the environment variables that start
+    with the prefix. Since os.environ decodes every key as it is iterated,
+    its raw keys (bytes on POSIX) are filtered on the encoded prefix and
+    only the matching names and values are decoded.
+    """
+    if environ is not os.environ:
+        return [
+            (name, environ[name]) for name in environ if name.startswith(prefix)
+        ]
+
+    data, encoded = environ._data, environ.encodekey(prefix)
+    decodekey, decodevalue = environ.decodekey, environ.decodevalue
+    return [
+        (decodekey(key), decodevalue(data[key]))
+        for key in data if key.startswith(encoded)
+    ]
+
 ##########################################################################
 ## Paths helper function
 ##########################################################################
@@ -132,20 +194,144 @@ class Configuration(with_metaclass(SettingsMeta, object)):
         os.path.abspath('conf/confire.yaml')    # Local directory configuration
     ]
 
+    # Path to an on-disk cache of the parsed CONF_PATHS (disabled if None)
+    CONF_CACHE = None
+
+    # Validate all Path settings in one batch after loading
+    DEFER_PATHS = False
+
+    # Options that are never loaded from the configuration files
+    IGNORE_OPTIONS = ()
+
+    # Only load the options declared on the class, ignoring all others
+    STRICT_OPTIONS = False
+
+    # Incremented every time an option is set or deleted on the instance
+    _version = 0
+
+    # Prefix of environment variables that override the CONF_PATHS, e.g.
+    # MYAPP for MYAPP_DATABASE__HOST (disabled if None)
+    ENVIRON_PREFIX = None
+
     @classmethod
-    def load(klass):
+    def load(klass, parallel=False, streaming=None):
         """
         Insantiates the configuration by attempting to load the
         configuration from YAML files specified by the CONF_PATH module
         variable. This should be the main entry point for configuration.
+        If ENVIRON_PREFIX is set, matching environment variables are then
+        applied on top of the files (see environ_overlay and
+        apply_documents).
+
+        If parallel is True (or the number of worker threads) the files are
+        read and parsed concurrently, but they are still applied to the
+        configuration in CONF_PATHS order. If streaming is True the files
+        are instead streamed into the configuration one key at a time (see
+        confire.streaming), which reduces the peak memory of large files.
+        Classes with STRICT_OPTIONS stream by default (unless parallel or
+        CONF_CACHE are used) so that undeclared options are never parsed.
+        """
+        if streaming is None:
+            streaming = klass.STRICT_OPTIONS and not (parallel or klass.CONF_CACHE)
+
+        started = timer() if instrument.HOOKS else None
+        if streaming:
+            paths = [path for path in klass.CONF_PATHS if os.path.exists(path)]
+            documents = []
+        else:
+            paths = []
+            documents = klass.parse_conf_paths(parallel)
+
+        config = klass.apply_documents(klass(), documents, paths)
+        if started is not None:
+            instrument.emit(
+                'load', klass=klass, files=len(documents) + len(paths),
+                seconds=timer() - started,
+            )
+        return config
+
+    @classmethod
+    def aload(klass, executor=None):
+        """
+        Returns a coroutine that loads the configuration as load does, but
+        reads and parses the CONF_PATHS and validates paths in an executor
+        so that the event loop is not blocked (see confire.aio):
+
+            settings = await MyConfig.aload()
+        """
+        from .aio import aload
+        return aload(klass, executor)
+
+    @classmethod
+    def load_flat(klass, parallel=False):
         """
-        config = klass()
-        for path in klass.CONF_PATHS:
-            if os.path.exists(path):
-                with open(path, 'r') as conf:
-                    config.configure(yaml.safe_load(conf))
+        Loads the configuration into the flat, array-backed layout, which
+        stores every option in a single list rather than on a nested tree
+        of Configuration objects; see confire.flat for the differences.
+        """
+        from .flat import FlatConfiguration
+        config = FlatConfiguration.from_config(klass())
+        return klass.apply_documents(config, klass.parse_conf_paths(parallel))
+
+    @classmethod
+    def apply_documents(klass, config, documents, paths=()):
+        """
+        Configures the config with each of the parsed documents in order,
+        streams in any of the paths, then applies the environment overlay
+        if ENVIRON_PREFIX is set. If DEFER_PATHS is set, all Path settings
+        are validated in one batch once everything has been applied.
+        """
+        with deferred_paths(klass.DEFER_PATHS):
+            for data in documents:
+                config.configure(data)
+
+            if paths:
+                from .streaming import stream_path
+                for path in paths:
+                    stream_path(path, config)
+
+            if klass.ENVIRON_PREFIX:
+                config.configure(environ_overlay(klass.ENVIRON_PREFIX))
         return config
 
+    @classmethod
+    def lazy_load(klass, **kwargs):
+        """
+        Returns a proxy that defers calling load (with the given keyword
+        arguments) until a setting is first accessed. Use this instead of
+        load for module level settings that may never be read.
+        """
+        return LazyConfiguration(klass, **kwargs)
+
+    @classmethod
+    def parse_conf_paths(klass, parallel=False):
+        """
+        Returns a list of the documents parsed from the CONF_PATHS that
+        exist, in precedence order. If CONF_CACHE is set, the documents are
+        read from the cache unless one of the files has changed.
+        """
+        if not klass.CONF_CACHE:
+            return klass._parse_conf_paths(parallel)
+
+        key = cache.cache_key(klass.CONF_PATHS)
+        documents = cache.read_cache(klass.CONF_CACHE, key)
+        if documents is None:
+            documents = klass._parse_conf_paths(parallel)
+            cache.write_cache(klass.CONF_CACHE, key, documents)
+        return documents
+
+    @classmethod
+    def _parse_conf_paths(klass, parallel=False):
+        paths = [path for path in klass.CONF_PATHS if os.path.exists(path)]
+        if not parallel or len(paths) < 2:
+            return [load_path(path) for path in paths]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = len(paths) if parallel is True else parallel
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(load_path, paths))
+
     def configure(self, conf={}):
         """
         Allows updating of the configuration via a dictionary of
@@ -156,27 +342,221 @@ class Configuration(with_metaclass(SettingsMeta, object)):
         if not conf: return
         if isinstance(conf, Configuration):
             conf = dict(conf.options())
+
+        if instrument.HOOKS:
+            started = timer()
+            self._configure(conf)
+            instrument.emit(
+                'configure', klass=self.__class__, keys=len(conf),
+                seconds=timer() - started,
+            )
+        else:
+            self._configure(conf)
+
+    def _configure(self, conf):
+        filtered = self.IGNORE_OPTIONS or self.STRICT_OPTIONS
         for key, value in conf.items():
+            if filtered and self.ignores(key):
+                continue
+
             opt = self.get(key, None)
             if isinstance(opt, Configuration):
-                opt.configure(value)
+                self._owned(key, opt).configure(value)
             else:
                 setattr(self, key, value)
 
+    def _owned(self, key, opt):
+        """
+        Returns the nested configuration opt found at key so that it can be
+        written to. Nested configurations are copy-on-write: if opt is a
+        class attribute default or is borrowed from the configuration this
+        instance was copied from (see __copy__), it is copied and set on
+        the instance first. Reads never copy.
+        """
+        key = key.lower()
+        if key in self.__dict__ and key not in self.__dict__.get('_borrowed', ()):
+            return opt
+
+        opt = copy(opt)
+        setattr(self, key, opt)
+        return opt
+
+    def writable(self, key):
+        """
+        Returns the nested configuration at key for direct attribute writes,
+        copying it onto the instance first if it is shared with the class or
+        with the configuration this one was copied from:
+
+            settings.writable('database').host = 'db1'
+
+        Assigning to an attribute of settings.database instead writes to
+        whichever object is shared, as with any class attribute.
+        """
+        opt = self[key]
+        if not isinstance(opt, Configuration):
+            raise TypeError("'{}' is not a nested configuration".format(key))
+        return self._owned(key, opt)
+
+    def __copy__(self):
+        """
+        Returns a shallow copy of the configuration that borrows the nested
+        configurations of the original until it writes to them through
+        configure, set_many or writable, at which point it copies them in
+        turn. The original is left unchanged, and reads are never copied,
+        so a copy is much cheaper than a deepcopy.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        state = dict(self.__dict__)
+        state.pop('_digests', None)
+
+        borrowed = frozenset(
+            key for key, value in state.items()
+            if not key.startswith('_') and isinstance(value, Configuration)
+        )
+        if borrowed:
+            state['_borrowed'] = borrowed
+        else:
+            state.pop('_borrowed', None)
+        clone.__dict__.update(state)
+
+        for descriptor in self._descriptors:
+            descriptor.copy_to(self, clone)
+        return clone
+
+    @classmethod
+    def ignores(klass, key):
+        """
+        Returns True if the option should not be loaded from configuration
+        files: either it is listed in IGNORE_OPTIONS or STRICT_OPTIONS is
+        set and the option is not declared on the class.
+        """
+        key = key.lower()
+        if key in klass.IGNORE_OPTIONS:
+            return True
+        return klass.STRICT_OPTIONS and key not in klass._options_index
+
+    def share(self, path):
+        """
+        Writes the configuration to a file that other processes can map
+        read-only with confire.shared.Segment, returning its version.
+        """
+        from .shared import share
+        return share(self, path)
+
+    def overlay(self, overrides=None):
+        """
+        Returns a child configuration that stores only the overrides and
+        falls through to this configuration for all other options, in the
+        manner of a ChainMap (see confire.overlay).
+        """
+        from .overlay import overlay
+        return overlay(self, overrides)
+
+    def freeze(self):
+        """
+        Returns an immutable, hashable snapshot of the configuration in
+        which nested configurations are frozen recursively.
+        """
+        from .frozen import freeze
+        return freeze(self)
+
+    def fingerprint(self):
+        """
+        Returns a stable 64-bit structural hash of the options, which is
+        maintained incrementally as options are set (see confire.hashing).
+        """
+        from .hashing import fingerprint
+        return fingerprint(self)
+
+    def diff(self, other):
+        """
+        Returns a Diff of the sorted dotted option names that were added,
+        removed and changed in the other configuration, skipping nested
+        configurations whose fingerprints match.
+        """
+        from .hashing import diff
+        return diff(self, other)
+
     def options(self):
         """
         Returns an iterable of sorted option names in order to loop
         through all the configuration directives specified in the class.
         """
-        keys = self.__class__.__dict__.copy()
-        keys.update(self.__dict__)
-        keys = sorted(keys.keys())
+        for opt in self._option_names():
+            try:
+                val = getattr(self, opt)
+            except ImproperlyConfigured:
+                continue
 
-        for opt in keys:
-            val = self.get(opt)
-            if val is not None:
+            if val is not None and not callable(val):
                 yield opt, val
 
+    def _option_names(self):
+        """
+        Returns the sorted tuple of option names for this instance. The
+        tuple is cached on the instance and only rebuilt when an option is
+        added or removed, or when the class options index changes.
+        """
+        cache = self.__dict__.get('_options_cache')
+        if cache is not None and cache[0] is self._options_index:
+            return cache[1]
+
+        names = set(self._options_index)
+        names.update(
+            key for key in self.__dict__
+            if not key.startswith('_') and key == key.lower()
+        )
+
+        names = tuple(sorted(names))
+        self.__dict__['_options_cache'] = (self._options_index, names)
+        return names
+
+    def __setattr__(self, name, value):
+        if name not in self.__dict__ and name not in self._options_index:
+            self.__dict__.pop('_options_cache', None)
+        super(Configuration, self).__setattr__(name, value)
+
+        borrowed = self.__dict__.get('_borrowed')
+        if borrowed and name in borrowed:
+            self.__dict__['_borrowed'] = borrowed - {name}
+        self.__dict__['_version'] = self._version + 1
+
+        digests = self.__dict__.get('_digests')
+        if digests is not None:
+            digests.dirty.add(name)
+
+    def __delattr__(self, name):
+        if name not in self._options_index:
+            self.__dict__.pop('_options_cache', None)
+        super(Configuration, self).__delattr__(name)
+        self.__dict__['_version'] = self._version + 1
+
+        digests = self.__dict__.get('_digests')
+        if digests is not None:
+            digests.dirty.add(name)
+
+    def accessor(self, path):
+        """
+        Returns a callable that reads the option at the dotted path, e.g.
+        "database.port", resolving the path once and then only again when
+        one of the configurations along the path has been modified.
+        """
+        return Accessor(self, path)
+
+    def get_many(self, paths, default=None):
+        """
+        Returns a dictionary of the values at each of the dotted paths,
+        resolving shared prefixes once, with the default for missing paths.
+        """
+        return get_many(self, paths, default)
+
+    def set_many(self, values):
+        """
+        Sets the value of each dotted path in the dictionary, resolving
+        shared prefixes once.
+        """
+        set_many(self, values)
+
     def get(self, key, default=None):
         """
         Fetches a key from the configuration without raising a KeyError
@@ -184,10 +564,19 @@ class Configuration(with_metaclass(SettingsMeta, object)):
         ImproperlyConfigured if the key doesn't exist, instead it returns the
         default (None).
         """
+        key = key.lower()
+        if key not in self._options_index:
+            if key not in self.__dict__ or key.startswith('_'):
+                return default
+
         try:
-            return self[key]
-        except (KeyError, ImproperlyConfigured):
+            attr = getattr(self, key)
+        except ImproperlyConfigured:
+            return default
+
+        if callable(attr):
             return default
+        return attr
 
     def __getitem__(self, key):
         """
@@ -197,9 +586,11 @@ class Configuration(with_metaclass(SettingsMeta, object)):
         all properties that are uppercase invisible to the options.
         """
         key = key.lower()
-        if hasattr(self, key):
+        if key in self._options_index or (
+            key in self.__dict__ and not key.startswith('_')
+        ):
             attr = getattr(self, key)
-            if not callable(attr) and not key.startswith('_'):
+            if not callable(attr):
                 return attr
         raise KeyError(
             "{} has no configuration '{}'".format(
@@ -210,12 +601,14 @@ class Configuration(with_metaclass(SettingsMeta, object)):
         return str(self)
 
     def __str__(self):
-        s = ""
-        for opt, val in self.options():
-            r = repr(val)
-            r = " ".join(r.split())
-            wlen = 76-max(len(opt),10)
-            if len(r) > wlen:
-                r = r[:wlen-3]+"..."
-            s += "%-10s = %s\n" % (opt, r)
-        return s[:-1]
+        from .render import render
+        return render(self)
+
+    def dump(self, fp, width=76):
+        """
+        Writes the configuration to the file-like object one line at a
+        time, with nested configurations as indented sections. Values are
+        truncated to the width unless it is None.
+        """
+        from .render import dump
+        dump(self, fp, width)
@@ -61,6 +61,14 @@ class SettingsDescriptor(object):
 
         del instance.__dict__[self.label]
 
+    def copy_to(self, instance, clone):
+        """
+        Copies the value stored for the instance to its clone. Values are
+        stored in the instance __dict__, which is copied with the instance,
+        so subclasses that store them elsewhere must override this.
+        """
+        pass
+
 ##########################################################################
 ## Settings Meta Class
 ##########################################################################
@@ -68,6 +76,11 @@ class SettingsDescriptor(object):
 class SettingsMeta(type):
     """
     Required metaclass for Configuration objects now.
+
+    In addition to labeling descriptors, the metaclass builds a frozen index
+    of the option names that are visible on the class (including inherited
+    ones) so that lookups can be performed with a single set probe rather
+    than a hasattr/getattr/callable inspection on every access.
     """
 
     def __new__(cls, name, bases, attrs):
@@ -77,4 +90,82 @@ class SettingsMeta(type):
         for n, v in attrs.items():
             if isinstance(v, SettingsDescriptor):
                 v.label = n
-        return super(SettingsMeta, cls).__new__(cls, name, bases, attrs)
+        klass = super(SettingsMeta, cls).__new__(cls, name, bases, attrs)
+        klass._options_index = options_index(klass)
+        klass._descriptors = settings_descriptors(klass)
+        return klass
+
+    def __setattr__(klass, name, value):
+        """
+        Keep the options index up to date when class attributes change.
+        Private and uppercase names (e.g. CONF_PATHS) are never options, so
+        setting them does not invalidate accessors and fingerprints.
+        """
+        super(SettingsMeta, klass).__setattr__(name, value)
+        if not name.startswith('_') and name == name.lower():
+            reindex(klass)
+
+    def __delattr__(klass, name):
+        super(SettingsMeta, klass).__delattr__(name)
+        if not name.startswith('_') and name == name.lower():
+            reindex(klass)
+
+
+##########################################################################
+## Options index helpers
+##########################################################################
+
+def is_option(name, value):
+    """
+    Returns True if the class attribute with the given name and value is a
+    configuration option: the name must be lowercase and public, and the
+    value must not be a method or other callable.
+    """
+    if name.startswith('_') or name != name.lower():
+        return False
+    if isinstance(value, (classmethod, staticmethod)):
+        return False
+    return not callable(value)
+
+
+def options_index(klass):
+    """
+    Computes the frozen set of option names for the class by walking the
+    MRO so that subclasses can both inherit and shadow options.
+    """
+    index = {}
+    for base in reversed(klass.__mro__):
+        for name, value in vars(base).items():
+            index[name] = is_option(name, value)
+    return frozenset(name for name, option in index.items() if option)
+
+
+def settings_descriptors(klass):
+    """
+    Returns the tuple of SettingsDescriptors visible on the class, which
+    are copied along with its instances.
+    """
+    attrs = {}
+    for base in reversed(klass.__mro__):
+        attrs.update(vars(base))
+    return tuple(
+        value for value in attrs.values()
+        if isinstance(value, SettingsDescriptor)
+    )
+
+
+# Incremented whenever a class attribute changes after class creation
+generation = 0
+
+
+def reindex(klass):
+    """
+    Rebuilds the options index of the class and all of its subclasses.
+    """
+    global generation
+    generation += 1
+
+    type.__setattr__(klass, '_options_index', options_index(klass))
+    type.__setattr__(klass, '_descriptors', settings_descriptors(klass))
+    for subclass in type.__subclasses__(klass):
+        reindex(subclass)
@@ -61,10 +61,10 @@ class ExampleConfiguration(Configuration):
     datadir         = path_setting(raises=False, required=False)
 
 ##########################################################################
-## Import this loaded Configuration
+## Import this lazily loaded Configuration
 ##########################################################################
 
-settings = ExampleConfiguration.load()
+settings = ExampleConfiguration.lazy_load()
 
 if __name__ == '__main__':
     print(settings)
@@ -50,3 +50,9 @@ class PathNotFound(ConfireWarning):
     Warn the user that the specified path does not exist.
     """
     pass
+
+class ReloadFailed(ConfireWarning):
+    """
+    Warn the user that the configuration could not be reloaded.
+    """
+    pass
@@ -0,0 +1,273 @@
+# confire.flat
+# A flat, array-backed storage layout for very large configurations
+#
+# For license information, see LICENSE.txt
+
+"""
+A flat, array-backed storage layout for very large configurations. Rather
+than a Configuration object (with its own __dict__) at every level of
+nesting, a FlatStore keeps every value in a single list. Each section of
+the configuration is a contiguous block of that list, described by a
+layout: a dict of its interned, lowercased option names to their offset in
+the block. Layouts are shared by all sections with the same option names,
+so for example thousands of per-tenant feature tables with the same keys
+share a single index dict:
+
+    settings = MyConfig.load_flat()
+    settings['tenants']['acme']['feature']
+
+The FlatConfiguration objects returned for nested sections are thin views
+that only hold a reference to the store and their section.
+
+Note that the flat layout stores plain data: every mapping is merged into
+the store recursively (rather than replaced, as configure does with dicts
+on undeclared options), keys are lowercased when they are stored, and
+SettingsDescriptors such as Path are not applied to the values. Options
+are filtered with the IGNORE_OPTIONS and STRICT_OPTIONS of the classes of
+the configuration and nested configurations it was created from.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from sys import intern
+
+from .config import Configuration
+from .frozen import layout
+from .views import ConfigurationView
+
+##########################################################################
+## Flat Store
+##########################################################################
+
+EMPTY = layout(())
+
+
+class Section(object):
+    """
+    The shared layout and the base offset of a section's block of values,
+    along with the ignores filter of its configuration class, if any.
+    """
+
+    __slots__ = ('layout', 'base', 'ignores')
+
+    def __init__(self, layout=EMPTY, base=0, ignores=None):
+        self.layout  = layout
+        self.base    = base
+        self.ignores = ignores
+
+
+class FlatStore(object):
+    """
+    Stores the values of a nested configuration in a single list, in one
+    block per section. The value of an option that is a nested section is
+    the Section itself. When options are added to a section its block is
+    reallocated at the end of the list; the list is compacted once more
+    than half of it is unused.
+    """
+
+    __slots__ = ('values', 'root', 'unused')
+
+    def __init__(self):
+        self.values = []
+        self.root   = Section()
+        self.unused = 0
+
+    def __len__(self):
+        return len(self.values) - self.unused
+
+    def get(self, section, key, default=None):
+        offset = section.layout.get(key)
+        if offset is None:
+            return default
+        return self.values[section.base + offset]
+
+    def update(self, mapping, section=None):
+        """
+        Merges a nested mapping into the section (the root by default),
+        storing non-empty dicts as nested sections.
+        """
+        section = section or self.root
+        items = [(intern(str(key).lower()), value) for key, value in mapping.items()]
+        if section.ignores is not None:
+            items = [(key, value) for key, value in items if not section.ignores(key)]
+
+        names = set(key for key, _ in items)
+        if not names.issubset(section.layout):
+            self.relayout(section, names.union(section.layout))
+
+        values, base, index = self.values, section.base, section.layout
+        for key, value in items:
+            idx = base + index[key]
+            current = values[idx]
+
+            if isinstance(value, dict) and value:
+                if not isinstance(current, Section):
+                    current = values[idx] = Section()
+                self.update(value, current)
+                # A nested relayout may have compacted the values
+                values, base = self.values, section.base
+            else:
+                if isinstance(current, Section):
+                    self.release(current)
+                values[idx] = value
+
+    def relayout(self, section, names):
+        """
+        Moves the section to a new block at the end of the values with the
+        layout for the given names, copying the existing values across.
+        """
+        old, base = section.layout, section.base
+        new = layout(tuple(sorted(names)))
+
+        values = self.values
+        block = [
+            values[base + old[name]] if name in old else None
+            for name in new
+        ]
+
+        for offset in old.values():
+            values[base + offset] = None
+        self.unused += len(old)
+
+        section.layout, section.base = new, len(values)
+        values.extend(block)
+
+        if self.unused > len(values) // 2:
+            self.compact()
+
+    def release(self, section):
+        """
+        Marks the blocks of a section and its nested sections as unused.
+        """
+        for offset in section.layout.values():
+            value = self.values[section.base + offset]
+            if isinstance(value, Section):
+                self.release(value)
+            self.values[section.base + offset] = None
+        self.unused += len(section.layout)
+        section.layout, section.base = EMPTY, 0
+
+    def compact(self):
+        """
+        Rebuilds the values list without the unused blocks.
+        """
+        values = []
+        stack  = [self.root]
+        while stack:
+            section = stack.pop()
+            block = [self.values[section.base + offset] for offset in section.layout.values()]
+            section.base = len(values)
+            values.extend(block)
+            stack.extend(value for value in block if isinstance(value, Section))
+
+        self.values = values
+        self.unused = 0
+
+
+##########################################################################
+## Flat Configuration View
+##########################################################################
+
+class FlatConfiguration(ConfigurationView):
+    """
+    A thin view of a section of a FlatStore that supports the same case
+    insensitive item, get, attribute and options access as Configuration,
+    as well as configure to merge in more data.
+    """
+
+    __slots__ = ('_store', '_section', '_name')
+
+    def __init__(self, store, section=None, name="FlatConfiguration"):
+        object.__setattr__(self, '_store', store)
+        object.__setattr__(self, '_section', section or store.root)
+        object.__setattr__(self, '_name', name)
+
+    @classmethod
+    def from_config(klass, config):
+        """
+        Creates a flat configuration from the options of a configuration,
+        including those of its nested configurations.
+        """
+        store = FlatStore()
+        store.update(as_dict(config))
+        set_filters(store, store.root, config)
+        return klass(store, name=config.__class__.__name__)
+
+    def configure(self, conf={}):
+        """
+        Merges a nested dictionary of options into this section.
+        """
+        if not conf: return
+        if not isinstance(conf, dict):
+            conf = as_dict(conf)
+        self._store.update(conf, self._section)
+
+    def options(self):
+        """
+        Returns an iterable of sorted option names and values; nested
+        sections are returned as views.
+        """
+        for name in self._section.layout:
+            value = self._lookup(name, None)
+            if value is not None:
+                yield name, value
+
+    @property
+    def _title(self):
+        return self._name
+
+    def _lookup(self, key, default):
+        section = self._section
+        offset = section.layout.get(key)
+        if offset is None:
+            return default
+
+        value = self._store.values[section.base + offset]
+        if value.__class__ is Section:
+            return FlatConfiguration(self._store, value, self._name)
+        return value
+
+    def __setattr__(self, name, value):
+        self.configure({name: value})
+
+    def __eq__(self, other):
+        if not isinstance(other, FlatConfiguration):
+            return NotImplemented
+        return self._section is other._section
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __hash__(self):
+        return hash(self._section)
+
+
+def set_filters(store, section, config):
+    """
+    Filters the options merged into the section, and into the sections of
+    nested configurations, if their configuration class ignores options.
+    """
+    if config.IGNORE_OPTIONS or config.STRICT_OPTIONS:
+        section.ignores = config.ignores
+
+    for opt, val in config.options():
+        if isinstance(val, Configuration):
+            idx = section.base + section.layout[opt]
+            child = store.values[idx]
+            if not isinstance(child, Section):
+                child = store.values[idx] = Section()
+            set_filters(store, child, val)
+
+
+def as_dict(config):
+    """
+    Converts the options of a configuration (or any object with options)
+    into a nested dictionary.
+    """
+    return dict(
+        (opt, as_dict(val) if hasattr(val, 'options') else val)
+        for opt, val in config.options()
+    )
@@ -0,0 +1,174 @@
+# confire.frozen
+# Immutable snapshots of loaded configurations
+#
+# For license information, see LICENSE.txt
+
+"""
+Immutable snapshots of loaded configurations. A FrozenConfiguration stores
+its values in a tuple alongside an index of option names to positions that
+is shared by every snapshot with the same options. Nested configurations
+are frozen recursively, lists become tuples, sets become frozensets and
+dicts become read-only mapping proxies, so a snapshot is hashable and can
+be shared between threads without locking:
+
+    snapshot = settings.freeze()
+    snapshot['database']['port']
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from weakref import WeakValueDictionary
+from types import MappingProxyType
+
+from .config import Configuration
+from .views import ConfigurationView
+
+##########################################################################
+## Option layouts
+##########################################################################
+
+class Layout(dict):
+    """
+    Maps option names to their position in a snapshot's values tuple.
+    """
+    pass
+
+
+# Layouts are shared by all snapshots with the same option names
+LAYOUTS = WeakValueDictionary()
+
+
+def layout(names):
+    """
+    Returns the shared layout for the tuple of option names.
+    """
+    index = LAYOUTS.get(names)
+    if index is None:
+        index = Layout((name, idx) for idx, name in enumerate(names))
+        LAYOUTS[names] = index
+    return index
+
+##########################################################################
+## Freezing values
+##########################################################################
+
+def freeze(config):
+    """
+    Returns an immutable snapshot of the configuration.
+    """
+    if isinstance(config, FrozenConfiguration):
+        return config
+
+    names, values = [], []
+    for opt, val in config.options():
+        names.append(opt)
+        values.append(freeze_value(val))
+
+    return FrozenConfiguration(
+        config.__class__, layout(tuple(names)), tuple(values)
+    )
+
+
+def freeze_value(value):
+    """
+    Converts a configuration value into an immutable equivalent.
+    """
+    if isinstance(value, (Configuration, FrozenConfiguration)):
+        return freeze(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_value(item) for item in value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType(dict(
+            (key, freeze_value(val)) for key, val in value.items()
+        ))
+    return value
+
+
+def thaw_value(value):
+    """
+    Converts the read-only mapping proxies of a frozen value back to dicts
+    so that the value can be pickled.
+    """
+    if isinstance(value, MappingProxyType):
+        return dict((key, thaw_value(val)) for key, val in value.items())
+    if isinstance(value, tuple):
+        return tuple(thaw_value(item) for item in value)
+    return value
+
+
+def hashable(value):
+    """
+    Returns a hashable representation of a frozen value.
+    """
+    if isinstance(value, MappingProxyType):
+        return frozenset((key, hashable(val)) for key, val in value.items())
+    if isinstance(value, tuple):
+        return tuple(hashable(item) for item in value)
+    return value
+
+##########################################################################
+## Frozen Configuration
+##########################################################################
+
+class FrozenConfiguration(ConfigurationView):
+    """
+    An immutable, hashable snapshot of a Configuration that supports the
+    same case insensitive item, get, attribute and options access.
+    """
+
+    __slots__ = ('_klass', '_index', '_values', '_hash')
+
+    def __init__(self, klass, index, values):
+        object.__setattr__(self, '_klass', klass)
+        object.__setattr__(self, '_index', index)
+        object.__setattr__(self, '_values', values)
+        object.__setattr__(self, '_hash', None)
+
+    @property
+    def _title(self):
+        return self._klass.__name__
+
+    def _lookup(self, key, default):
+        idx = self._index.get(key)
+        if idx is None:
+            return default
+        return self._values[idx]
+
+    def options(self):
+        """
+        Returns an iterable of the sorted option names and values.
+        """
+        return zip(self._index, self._values)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenConfiguration):
+            return NotImplemented
+        return (
+            self._klass is other._klass and
+            self._index is other._index and
+            self._values == other._values
+        )
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __hash__(self):
+        if self._hash is None:
+            value = hash((self._klass, tuple(self._index), hashable(self._values)))
+            object.__setattr__(self, '_hash', value)
+        return self._hash
+
+    def __reduce__(self):
+        return (restore, (self._klass, tuple(self._index), thaw_value(self._values)))
+
+
+def restore(klass, names, values):
+    """
+    Reconstructs a frozen configuration when unpickling.
+    """
+    return FrozenConfiguration(klass, layout(names), freeze_value(values))
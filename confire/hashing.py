@@ -0,0 +1,257 @@
+# confire.hashing
+# Structural hashing and diffing of configurations
+#
+# For license information, see LICENSE.txt
+
+"""
+Structural hashing and diffing of configurations. The fingerprint of a
+configuration is a stable 64-bit hash of its options (the same options
+that are yielded by Configuration.options), computed by summing a blake2b
+digest of each option name and its encoded value. The digests are cached on
+the instance and only the options that have been set or deleted since the
+last call are rehashed, while nested configurations are fingerprinted (and
+cached) in the same way, so computing the fingerprint of an unchanged
+configuration does not encode any values.
+
+Values are encoded structurally rather than by repr, so dictionaries and
+sets hash the same regardless of order, and fingerprints are stable across
+processes. Values that are mutated in place (e.g. appending to a list
+option) are not detected until the option is set again.
+
+Two configurations are diffed by comparing their fingerprints and then the
+digests of their options, descending only into nested configurations whose
+fingerprints differ.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from hashlib import blake2b
+from collections import namedtuple
+from collections.abc import Mapping, Set
+
+from . import descriptors
+from .config import Configuration
+from .exceptions import ImproperlyConfigured
+
+##########################################################################
+## Encoding
+##########################################################################
+
+MASK = (1 << 64) - 1
+
+Diff = namedtuple("Diff", "added removed changed")
+
+
+def digest(data):
+    """
+    Returns the 64-bit blake2b digest of the bytes as an integer.
+    """
+    return int.from_bytes(blake2b(data, digest_size=8).digest(), 'little')
+
+
+def encode(value, out):
+    """
+    Appends a structural encoding of the value to the list of bytes.
+    """
+    if value is None:
+        out.append(b"N")
+    elif value is True or value is False:
+        out.append(b"T" if value else b"F")
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+        out.append(b"s%d:" % len(data))
+        out.append(data)
+    elif isinstance(value, bytes):
+        out.append(b"b%d:" % len(value))
+        out.append(value)
+    elif isinstance(value, (int, float)):
+        out.append(b"n" + repr(value).encode('ascii') + b";")
+    elif isinstance(value, (list, tuple)):
+        out.append(b"[")
+        for item in value:
+            encode(item, out)
+        out.append(b"]")
+    elif isinstance(value, Mapping):
+        out.append(b"{")
+        for item in sorted(encoded(key) + encoded(val) for key, val in value.items()):
+            out.append(item)
+        out.append(b"}")
+    elif isinstance(value, Set):
+        out.append(b"(")
+        for item in sorted(encoded(item) for item in value):
+            out.append(item)
+        out.append(b")")
+    elif isinstance(value, Configuration):
+        out.append(b"C%d;" % fingerprint(value))
+    else:
+        out.append(b"r" + type(value).__name__.encode('utf-8') + b":")
+        encode(repr(value), out)
+
+
+def encoded(value):
+    out = []
+    encode(value, out)
+    return b"".join(out)
+
+
+def entry(name, value):
+    """
+    Returns the digest of an option name and its value.
+    """
+    out = [name.encode('utf-8'), b"="]
+    encode(value, out)
+    return digest(b"".join(out))
+
+##########################################################################
+## Digests
+##########################################################################
+
+class Digests(object):
+    """
+    The cached option digests of a configuration instance. Leaves map the
+    option name to its (digest, value) and children map the option name of
+    nested configurations to [configuration, fingerprint, digest]. The
+    names of options that have been set or deleted are added to dirty by
+    Configuration.__setattr__ and are rehashed on the next fingerprint.
+    """
+
+    __slots__ = ('owner', 'generation', 'parent', 'leaves', 'children', 'total', 'dirty')
+
+    def __init__(self, config):
+        self.owner      = id(config)
+        self.generation = descriptors.generation
+        self.parent     = parent_version(config)
+        self.leaves     = {}
+        self.children   = {}
+        self.total      = 0
+        self.dirty      = set()
+
+        for name in config._option_names():
+            self.refresh(config, name)
+
+    def refresh(self, config, name):
+        """
+        Rehashes the option with the given name.
+        """
+        old = self.leaves.pop(name, None)
+        if old is not None:
+            self.total -= old[0]
+        self.children.pop(name, None)
+
+        if name.startswith('_') or name != name.lower():
+            return
+
+        try:
+            value = getattr(config, name)
+        except (AttributeError, ImproperlyConfigured):
+            return
+
+        if value is None or callable(value):
+            return
+
+        if isinstance(value, Configuration):
+            self.children[name] = [value, None, 0]
+        else:
+            value_digest = entry(name, value)
+            self.leaves[name] = (value_digest, value)
+            self.total += value_digest
+
+
+def parent_version(config):
+    """
+    Returns the version of the parent of an overlay (see confire.overlay),
+    whose options may change without the overlay being modified.
+    """
+    parent = config.__dict__.get('_parent')
+    return None if parent is None else parent._version
+
+
+def digests(config):
+    """
+    Returns the up to date Digests of the configuration, rehashing only the
+    dirty options and the nested configurations whose fingerprint changed.
+    """
+    state = config.__dict__.get('_digests')
+    if (
+        state is None or
+        state.owner != id(config) or
+        state.generation != descriptors.generation or
+        state.parent != parent_version(config)
+    ):
+        state = Digests(config)
+        config.__dict__['_digests'] = state
+    elif state.dirty:
+        for name in state.dirty:
+            state.refresh(config, name)
+        state.dirty.clear()
+
+    for name, child in state.children.items():
+        child_fingerprint = fingerprint(child[0])
+        if child_fingerprint != child[1]:
+            child[1] = child_fingerprint
+            child[2] = digest(b"%s{%d}" % (name.encode('utf-8'), child_fingerprint))
+    return state
+
+
+def fingerprint(config):
+    """
+    Returns the stable 64-bit structural hash of the configuration.
+    """
+    state = digests(config)
+    total = state.total
+    for child in state.children.values():
+        total += child[2]
+    return total & MASK
+
+##########################################################################
+## Diff
+##########################################################################
+
+def diff(old, new):
+    """
+    Returns the sorted dotted option names that were added, removed and
+    changed between the old and the new configuration.
+    """
+    delta = Diff([], [], [])
+    compare(old, new, "", delta)
+    return Diff(*(sorted(keys) for keys in delta))
+
+
+def compare(old, new, prefix, delta):
+    if fingerprint(old) == fingerprint(new):
+        return
+
+    olds, news = digests(old), digests(new)
+    for name, (value_digest, _) in news.leaves.items():
+        if name not in olds.leaves:
+            delta.added.append(prefix + name)
+        elif olds.leaves[name][0] != value_digest:
+            delta.changed.append(prefix + name)
+
+    for name in olds.leaves:
+        if name not in news.leaves:
+            delta.removed.append(prefix + name)
+
+    for name, child in news.children.items():
+        if name in olds.children:
+            compare(olds.children[name][0], child[0], prefix + name + ".", delta)
+        else:
+            delta.added.extend(keys(child[0], prefix + name + "."))
+
+    for name, child in olds.children.items():
+        if name not in news.children:
+            delta.removed.extend(keys(child[0], prefix + name + "."))
+
+
+def keys(config, prefix=""):
+    """
+    Yields the dotted names of all the options of the configuration.
+    """
+    state = digests(config)
+    for name in state.leaves:
+        yield prefix + name
+    for name, child in state.children.items():
+        for key in keys(child[0], prefix + name + "."):
+            yield key
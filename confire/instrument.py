@@ -0,0 +1,116 @@
+# confire.instrument
+# Instrumentation hooks for profiling configuration loading
+#
+# For license information, see LICENSE.txt
+
+"""
+Instrumentation hooks for profiling configuration loading. Hooks are
+callables registered with `register` that are called as hook(event, info)
+with one of the following events and an info dictionary:
+
+    read        path, bytes, seconds    a configuration file was read
+    parse       path, keys, seconds     a configuration file was parsed
+    configure   klass, keys, seconds    configure was called (recursively)
+    path        label, path, seconds    a Path setting was assigned
+    validate    paths, seconds          a deferred batch of Paths was checked
+    load        klass, files, seconds   load completed
+
+Instrumented code checks whether any hooks are registered before timing
+anything, so instrumentation costs a single list check when it is unused.
+The profile context manager collects the events for a block of code:
+
+    with profile() as stats:
+        settings = MyConfig.load()
+    print(stats)
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from contextlib import contextmanager
+
+##########################################################################
+## Hook Registry
+##########################################################################
+
+HOOKS = []
+
+
+def register(hook):
+    """
+    Registers a hook(event, info) to be called on instrumented events.
+    """
+    HOOKS.append(hook)
+    return hook
+
+
+def unregister(hook):
+    HOOKS.remove(hook)
+
+
+def emit(event, **info):
+    """
+    Calls every registered hook with the event; callers should check that
+    HOOKS is not empty before collecting the info to emit.
+    """
+    for hook in list(HOOKS):
+        hook(event, info)
+
+def count_keys(data):
+    """
+    Counts the keys in a parsed document, including those of nested dicts.
+    """
+    if not isinstance(data, dict):
+        return 0
+    return len(data) + sum(count_keys(value) for value in data.values())
+
+##########################################################################
+## Profiler
+##########################################################################
+
+class Profile(object):
+    """
+    A hook that records every event it receives so that they can be
+    summarized once loading is complete.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event, info):
+        self.events.append((event, info))
+
+    def filter(self, event):
+        """
+        Returns the info dictionaries of the events with the given name.
+        """
+        return [info for name, info in self.events if name == event]
+
+    def total(self, event):
+        """
+        Returns the total seconds spent in the events with the given name.
+        """
+        return sum(info['seconds'] for info in self.filter(event))
+
+    def __str__(self):
+        lines = []
+        for event, info in self.events:
+            details = " ".join(
+                "{}={}".format(key, getattr(val, '__name__', val))
+                for key, val in sorted(info.items()) if key != 'seconds'
+            )
+            lines.append("{:<10} {:>10.6f}s {}".format(event, info['seconds'], details))
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile():
+    """
+    Registers a Profile hook for the duration of the context.
+    """
+    stats = register(Profile())
+    try:
+        yield stats
+    finally:
+        unregister(stats)
@@ -0,0 +1,111 @@
+# confire.lazy
+# A proxy that defers loading a configuration until it is first used
+#
+# For license information, see LICENSE.txt
+
+"""
+A proxy that defers loading a configuration until it is first used. This
+allows modules to define their settings at import time without paying for
+file I/O and parsing unless a setting is actually read:
+
+    settings = MyConfig.lazy_load()
+
+The CONF_PATHS are read and parsed on the first item, get, attribute or
+options access; loading is guarded by a lock so that it happens exactly
+once even if multiple threads access the settings concurrently. The proxy
+reports the class of the loaded configuration as its __class__, so that it
+passes isinstance checks (e.g. in configure), and copying or pickling it
+copies or pickles the loaded configuration.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import threading
+
+from copy import copy, deepcopy
+
+##########################################################################
+## Lazy Configuration Proxy
+##########################################################################
+
+class LazyConfiguration(object):
+    """
+    Proxy for a Configuration class that calls its load method on first
+    access and then delegates all access to the loaded configuration.
+    """
+
+    def __init__(self, klass, **kwargs):
+        object.__setattr__(self, '_klass', klass)
+        object.__setattr__(self, '_kwargs', kwargs)
+        object.__setattr__(self, '_lock', threading.Lock())
+        object.__setattr__(self, '_wrapped', None)
+
+    @property
+    def __class__(self):
+        return (self._wrapped or self._setup()).__class__
+
+    @property
+    def loaded(self):
+        """
+        Returns True if the configuration has been loaded.
+        """
+        return self._wrapped is not None
+
+    def _setup(self):
+        """
+        Loads the configuration exactly once and returns it.
+        """
+        with self._lock:
+            if self._wrapped is None:
+                config = self._klass.load(**self._kwargs)
+                object.__setattr__(self, '_wrapped', config)
+        return self._wrapped
+
+    def __getitem__(self, key):
+        return (self._wrapped or self._setup())[key]
+
+    def get(self, key, default=None):
+        return (self._wrapped or self._setup()).get(key, default)
+
+    def options(self):
+        return (self._wrapped or self._setup()).options()
+
+    def configure(self, conf={}):
+        return (self._wrapped or self._setup()).configure(conf)
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped or self._setup(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._wrapped or self._setup(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._wrapped or self._setup(), name)
+
+    def __copy__(self):
+        return copy(self._wrapped or self._setup())
+
+    def __deepcopy__(self, memo):
+        return deepcopy(self._wrapped or self._setup(), memo)
+
+    def __reduce__(self):
+        return (unwrap, (self._wrapped or self._setup(),))
+
+    def __str__(self):
+        return str(self._wrapped or self._setup())
+
+    def __repr__(self):
+        if self._wrapped is None:
+            return "<{} {} (not loaded)>".format(
+                type(self).__name__, self._klass.__name__
+            )
+        return repr(self._wrapped)
+
+
+def unwrap(config):
+    """
+    Returns the configuration, which is how a pickled proxy is unpickled.
+    """
+    return config
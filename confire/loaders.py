@@ -0,0 +1,180 @@
+# confire.loaders
+# Parsers for reading configuration files from disk
+#
+# For license information, see LICENSE.txt
+
+"""
+Parsers for reading configuration files from disk. The YAML parser uses the
+libyaml backed CSafeLoader when PyYAML has been built against libyaml and
+falls back to the pure-Python SafeLoader otherwise; both are safe loaders.
+
+Other formats are parsed by loaders registered by file extension, which are
+passed the raw bytes of the file. JSON (.json), TOML (.toml) and msgpack
+(.msgpack, .mpk) are registered by default, each using the fastest parser
+that is installed; any file whose extension is not registered is parsed as
+YAML. Additional formats can be registered as follows:
+
+    from confire import loaders
+    loaders.register(".ini", parse_ini)
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import json
+import yaml
+
+from timeit import default_timer as timer
+from . import instrument
+from .exceptions import ImproperlyConfigured
+
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+##########################################################################
+## YAML Loader
+##########################################################################
+
+def yaml_loader():
+    """
+    Returns the name of the YAML loader class used to parse configuration
+    files, e.g. "CSafeLoader" or "SafeLoader".
+    """
+    return YAMLLoader.__name__
+
+
+def load_yaml(stream, Loader=None):
+    """
+    Parses a single YAML document from the stream using the fastest safe
+    loader available, unless a specific Loader class is passed in.
+    """
+    return yaml.load(stream, Loader=Loader or YAMLLoader)
+
+
+##########################################################################
+## Other Formats
+##########################################################################
+
+def load_json(data):
+    """
+    Parses a JSON document with orjson if it is installed, otherwise with
+    the standard library json module.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_toml(data):
+    """
+    Parses a TOML document with tomllib (or tomli on older Pythons).
+    """
+    if tomllib is None:
+        raise ImproperlyConfigured("tomli is required to load TOML configuration files")
+    return tomllib.loads(data.decode('utf-8'))
+
+
+def load_msgpack(data):
+    """
+    Parses a msgpack document; requires the msgpack package.
+    """
+    if msgpack is None:
+        raise ImproperlyConfigured("msgpack is required to load msgpack configuration files")
+    return msgpack.unpackb(data, raw=False)
+
+##########################################################################
+## Loader Registry
+##########################################################################
+
+# Maps lowercase file extensions to functions that parse the file's bytes
+LOADERS = {
+    ".json": load_json,
+    ".toml": load_toml,
+    ".msgpack": load_msgpack,
+    ".mpk": load_msgpack,
+}
+
+
+def register(ext, loader):
+    """
+    Registers a loader to parse the bytes of files with the extension.
+    """
+    LOADERS[normalize(ext)] = loader
+
+
+def unregister(ext):
+    """
+    Removes the loader for the extension, which will be parsed as YAML.
+    """
+    LOADERS.pop(normalize(ext), None)
+
+
+def normalize(ext):
+    """
+    Returns the lowercase extension with a leading period.
+    """
+    ext = ext.lower()
+    return ext if ext.startswith(".") else "." + ext
+
+
+def format_loader(path):
+    """
+    Returns the loader registered for the extension of the path or None if
+    the file should be parsed as YAML.
+    """
+    return LOADERS.get(os.path.splitext(path)[1].lower())
+
+
+def parse(path, data):
+    """
+    Parses the bytes read from the path with the loader for its extension.
+    """
+    loader = format_loader(path)
+    if loader is None:
+        return load_yaml(data)
+    return loader(data)
+
+
+def load_path(path):
+    """
+    Opens the configuration file at the given path and parses it with the
+    loader registered for its extension.
+    """
+    if not instrument.HOOKS:
+        with open(path, 'rb') as conf:
+            return parse(path, conf.read())
+
+    started = timer()
+    with open(path, 'rb') as conf:
+        data = conf.read()
+    instrument.emit('read', path=path, bytes=len(data), seconds=timer() - started)
+
+    started = timer()
+    data = parse(path, data)
+    instrument.emit(
+        'parse', path=path, keys=instrument.count_keys(data),
+        seconds=timer() - started,
+    )
+    return data
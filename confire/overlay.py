@@ -0,0 +1,162 @@
+# confire.overlay
+# Layered configurations that fall through to a parent configuration
+#
+# For license information, see LICENSE.txt
+
+"""
+Layered configurations, similar to collections.ChainMap. An overlay is a
+child configuration that stores only the options that are set on it and
+falls through to its parent for every other option:
+
+    tenant = settings.overlay({"database": {"host": "tenant.db"}})
+    tenant.database.host    # "tenant.db"
+    tenant.database.port    # settings.database.port
+
+Creating an overlay only costs as much as configuring its overrides; the
+parent is not copied. Nested configurations that are written to through
+the overlay (with configure, set_many or writable) become overlays of the
+parent's nested configuration, and changes to the parent are visible
+through the overlay unless the option is overridden. As with a ChainMap,
+reading a nested configuration that is not overridden returns the
+parent's object, so assigning to its attributes changes the parent:
+
+    tenant.writable("cache").size = 10   # only the tenant
+    tenant.cache.size = 10               # the parent as well
+
+Overlays can be layered on top of each other.
+
+An overlay is an instance of a subclass of its parent's class, generated
+once per class, so that isinstance checks and class attributes behave
+exactly as they do for the parent. Overlays are pickled as their parent
+and their overrides, since the generated class cannot be found by name.
+"""
+
+##########################################################################
+## Overlay
+##########################################################################
+
+# Cache of generated overlay classes by configuration class
+OVERLAYS = {}
+
+
+def overlay(parent, overrides=None):
+    """
+    Returns a child configuration of the parent with the given overrides.
+    """
+    klass = type(parent)
+    if not issubclass(klass, Overlay):
+        klass = OVERLAYS.get(klass)
+        if klass is None:
+            klass = OVERLAYS[type(parent)] = overlay_class(type(parent))
+
+    child = klass.__new__(klass)
+    child.__dict__['_parent'] = parent
+    child.__dict__['_overrides'] = set()
+    if overrides:
+        child.configure(overrides)
+    return child
+
+
+def restore(parent, overrides):
+    """
+    Rebuilds a pickled overlay of the parent from its overrides.
+    """
+    child = overlay(parent)
+    for name, value in overrides.items():
+        setattr(child, name, value)
+    return child
+
+
+def overlay_class(klass):
+    """
+    Creates the overlay subclass of the configuration class.
+    """
+    return type(klass)(klass.__name__, (Overlay, klass), {
+        '__module__': klass.__module__,
+        '__doc__': klass.__doc__,
+    })
+
+
+class Overlay(object):
+    """
+    Mixin for overlay subclasses of Configuration classes. Options that are
+    not set on the instance are read from the _parent configuration. The
+    names of the options set on the instance are tracked in _overrides
+    since descriptors (e.g. path settings) do not store them in __dict__;
+    deleting an option reveals the parent's value again.
+    """
+
+    def __getattribute__(self, name):
+        if name[:1] != '_':
+            attrs = object.__getattribute__(self, '__dict__')
+            if name not in attrs['_overrides']:
+                klass = type(self)
+                if name in klass._options_index or not hasattr(klass, name):
+                    return getattr(attrs['_parent'], name)
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name, value):
+        super(Overlay, self).__setattr__(name, value)
+        if name[:1] != '_':
+            self._overrides.add(name)
+
+    def __delattr__(self, name):
+        super(Overlay, self).__delattr__(name)
+        self._overrides.discard(name)
+
+    def __copy__(self):
+        clone = super(Overlay, self).__copy__()
+        clone.__dict__['_overrides'] = set(self._overrides)
+        return clone
+
+    def __reduce__(self):
+        overrides = dict(
+            (name, getattr(self, name)) for name in self._overrides
+        )
+        return (restore, (self._parent, overrides))
+
+    @property
+    def _version(self):
+        """
+        Changes whenever the overlay or any of its parents is modified.
+        """
+        return self.__dict__.get('_version', 0) + self._parent._version
+
+    def _option_names(self):
+        """
+        Returns the sorted option names of the parent and the overlay.
+        """
+        names = self._parent._option_names()
+        cache = self.__dict__.get('_options_cache')
+        if cache is not None and cache[0] is names:
+            return cache[1]
+
+        own = [key for key in self._overrides if key == key.lower()]
+        merged = tuple(sorted(set(names).union(own))) if own else names
+        self.__dict__['_options_cache'] = (names, merged)
+        return merged
+
+    def _owned(self, key, opt):
+        """
+        Nested configurations are written to through overlays of the
+        parent's nested configuration rather than through copies.
+        """
+        key = key.lower()
+        if key in self._overrides:
+            return super(Overlay, self)._owned(key, opt)
+
+        opt = overlay(opt)
+        setattr(self, key, opt)
+        return opt
+
+    def get(self, key, default=None):
+        lkey = key.lower()
+        if lkey not in self._overrides and lkey not in self._options_index:
+            return self._parent.get(key, default)
+        return super(Overlay, self).get(key, default)
+
+    def __getitem__(self, key):
+        lkey = key.lower()
+        if lkey not in self._overrides and lkey not in self._options_index:
+            return self._parent[key]
+        return super(Overlay, self).__getitem__(key)
@@ -18,9 +18,15 @@ A descriptor for managing path properties and configurations
 ##########################################################################
 
 import os
+import re
 import warnings
+import threading
 
+from timeit import default_timer as timer
+from functools import lru_cache
+from contextlib import contextmanager
 from weakref import WeakKeyDictionary
+from . import instrument
 from .descriptors import SettingsDescriptor
 from .exceptions import ImproperlyConfigured, PathNotFound
 
@@ -73,21 +79,43 @@ class Path(SettingsDescriptor):
         return path
 
     def __set__(self, obj, value):
+        if not instrument.HOOKS:
+            return self._set(obj, value)
+
+        started = timer()
+        try:
+            self._set(obj, value)
+        finally:
+            instrument.emit(
+                'path', label=self.label, path=value, seconds=timer() - started
+            )
+
+    def _set(self, obj, value):
         # Store original
         self.strings[obj] = value
 
         # Compute the path
-        value = os.path.expanduser(value)
-        value = os.path.expandvars(value)
-        value = os.path.normpath(value)
-
-        if self.absolute:
-            value = os.path.abspath(value)
-
-        if self.mkdirs and not os.path.exists(value):
+        value = expand_path(value, self.absolute)
+
+        # Defer the file system checks if a batch is being collected
+        batches = getattr(_deferred, 'batches', None)
+        if batches:
+            batches[-1].append((self, obj, value))
+            return
+
+        self.validate(obj, value)
+
+    def validate(self, obj, value):
+        """
+        Creates the directory if mkdirs is set, checks that the path exists
+        and then stores the computed path for the instance.
+        """
+        exists = os.path.exists(value)
+        if not exists and self.mkdirs:
             os.makedirs(value)
+            exists = True
 
-        if not os.path.exists(value):
+        if not exists:
             message = "Path at '{0}' does not exist!".format(value)
             if self.raises:
                 raise ImproperlyConfigured(message)
@@ -99,3 +127,109 @@ class Path(SettingsDescriptor):
     def __delete__(self, obj):
         del self.paths[obj]
         del self.strings[obj]
+
+    def copy_to(self, obj, clone):
+        if obj in self.strings:
+            self.strings[clone] = self.strings[obj]
+        if obj in self.paths:
+            self.paths[clone] = self.paths[obj]
+
+
+##########################################################################
+## Path expansion
+##########################################################################
+
+VARIABLE = re.compile(r'\$(\w+|\{[^}]*\})')
+
+
+def expand_path(value, absolute=True):
+    """
+    Expands the user and environment variables in the path, normalizes it
+    and, if absolute is True, makes it absolute. Results are memoized on
+    the raw string along with the current working directory and the values
+    of the environment variables the expansion depends on.
+    """
+    environ = tuple(
+        os.environ.get(name.strip('{}')) for name in VARIABLE.findall(value)
+    )
+    if value.startswith('~'):
+        environ += (os.environ.get('HOME'),)
+
+    cwd = os.getcwd() if absolute else None
+    return _expand_path(value, absolute, cwd, environ)
+
+
+@lru_cache(maxsize=512)
+def _expand_path(value, absolute, cwd, environ):
+    value = os.path.expanduser(value)
+    value = os.path.expandvars(value)
+    value = os.path.normpath(value)
+
+    if absolute:
+        value = os.path.abspath(value)
+    return value
+
+##########################################################################
+## Deferred validation
+##########################################################################
+
+_deferred = threading.local()
+
+
+@contextmanager
+def deferred_paths(enabled=True):
+    """
+    Collects the file system checks of every Path set in this thread within
+    the context, then runs them in a single batch on exit: each directory
+    is created or checked only once, even if several settings share it.
+    Paths are stored on their instances only after they are validated.
+    """
+    if not enabled:
+        yield
+        return
+
+    if not hasattr(_deferred, 'batches'):
+        _deferred.batches = []
+
+    batch = []
+    _deferred.batches.append(batch)
+    try:
+        yield
+    finally:
+        _deferred.batches.pop()
+    validate_paths(batch)
+
+
+def validate_paths(batch):
+    """
+    Validates a batch of (descriptor, instance, path) tuples, creating the
+    directories and checking for existence once per unique path.
+    """
+    if instrument.HOOKS:
+        started = timer()
+        try:
+            _validate_paths(batch)
+        finally:
+            instrument.emit('validate', paths=len(batch), seconds=timer() - started)
+    else:
+        _validate_paths(batch)
+
+
+def _validate_paths(batch):
+    for path in sorted(set(value for desc, _, value in batch if desc.mkdirs)):
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+    exists = {}
+    for desc, obj, value in batch:
+        if value not in exists:
+            exists[value] = os.path.exists(value)
+
+        if not exists[value]:
+            message = "Path at '{0}' does not exist!".format(value)
+            if desc.raises:
+                raise ImproperlyConfigured(message)
+            else:
+                warnings.warn(PathNotFound(message))
+
+        desc.paths[obj] = value
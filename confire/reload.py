@@ -0,0 +1,217 @@
+# confire.reload
+# Watches the CONF_PATHS and reloads the configuration when they change
+#
+# For license information, see LICENSE.txt
+
+"""
+Watches the CONF_PATHS and reloads the configuration when they change.
+
+The Reloader keeps the parsed document of every configuration file and
+only reparses the files whose mtime, size or inode have changed. It then
+builds a completely new configuration from the documents and publishes it
+by swapping a single reference (see confire.snapshot), so readers that
+fetch `reloader.settings` always see either the old or the new
+configuration, never a partially configured one:
+
+    reloader = Reloader(MyConfig)
+    reloader.subscribe(lambda settings, diff: print(diff.changed))
+    reloader.start()
+
+    settings = reloader.settings
+
+If the optional inotify_simple package is installed, the watcher thread
+is woken by inotify events on the directories of the CONF_PATHS; otherwise
+it falls back to polling the files with stat every interval seconds.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import warnings
+import threading
+
+from .loaders import load_path
+from .snapshot import Published
+from .exceptions import ReloadFailed
+
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+##########################################################################
+## Helpers
+##########################################################################
+
+def file_key(path):
+    """
+    Returns the (mtime, size, inode) of the path or None if it is missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def watch(paths):
+    """
+    Returns an inotify_simple.INotify watching the existing directories of
+    the paths for any changes to the files in them.
+    """
+    flags = inotify_simple.flags
+    mask  = (
+        flags.CLOSE_WRITE | flags.MOVED_TO | flags.MOVED_FROM |
+        flags.CREATE | flags.DELETE | flags.ATTRIB
+    )
+
+    inotify = inotify_simple.INotify()
+    for dirname in set(os.path.dirname(path) for path in paths):
+        if os.path.isdir(dirname):
+            inotify.add_watch(dirname, mask)
+    return inotify
+
+##########################################################################
+## Reloader
+##########################################################################
+
+class BaseReloader(object):
+    """
+    The state shared by the Reloader and the asyncio AsyncReloader: the
+    published configuration, the subscribers and the parsed documents of
+    the CONF_PATHS. Subclasses decide how and when _update is called.
+    """
+
+    def __init__(self, klass, interval=1.0):
+        self.klass     = klass
+        self.interval  = interval
+        self.callbacks = []
+
+        self._keys      = {}
+        self._documents = {}
+        self._lock      = threading.Lock()
+        self.published  = Published()
+
+    @property
+    def settings(self):
+        """
+        The currently published configuration.
+        """
+        return self.published.current
+
+    def subscribe(self, callback):
+        """
+        Registers a callback(settings, diff) to be called after a reload.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        self.callbacks.remove(callback)
+
+    def _update(self):
+        """
+        Reparses the changed files and publishes the new configuration,
+        returning the (old, new) configurations if a previously published
+        configuration was replaced and None otherwise.
+        """
+        with self._lock:
+            changed = False
+            for path in self.klass.CONF_PATHS:
+                key = file_key(path)
+                if path in self._keys and self._keys[path] == key:
+                    continue
+
+                self._documents[path] = load_path(path) if key else None
+                self._keys[path] = key
+                changed = True
+
+            if not changed and self.published.current is not None:
+                return None
+
+            documents = [self._documents.get(path) for path in self.klass.CONF_PATHS]
+            config = self.klass.apply_documents(self.klass(), documents)
+
+            old = self.published.publish(config)
+
+        if old is None:
+            return None
+        return old, config
+
+
+class Reloader(BaseReloader):
+    """
+    Maintains the current configuration of a Configuration class, reloading
+    it when any of the CONF_PATHS change. Subscribers are called with the
+    new configuration and a Diff of dotted option names after each reload.
+    """
+
+    def __init__(self, klass, interval=1.0):
+        super(Reloader, self).__init__(klass, interval)
+        self._stopped = threading.Event()
+        self._thread  = None
+        self._update()
+
+    def check(self):
+        """
+        Reparses any changed configuration files and, if anything changed,
+        publishes a new configuration and notifies the subscribers. Returns
+        the Diff of the reload or None if no files changed.
+        """
+        published = self._update()
+        if published is None:
+            return None
+
+        old, config = published
+        delta = old.diff(config)
+        for callback in list(self.callbacks):
+            callback(config, delta)
+        return delta
+
+    def start(self):
+        """
+        Starts a daemon thread that watches the CONF_PATHS for changes.
+        """
+        if self._thread is not None:
+            return
+
+        self._stopped.clear()
+        target = self._watch if inotify_simple else self._poll
+        self._thread = threading.Thread(target=target, name="confire-reloader")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the watcher thread and waits for it to exit.
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _reload(self):
+        try:
+            self.check()
+        except Exception as e:
+            warnings.warn(ReloadFailed(
+                "Could not reload {}: {}".format(self.klass.__name__, e)
+            ))
+
+    def _poll(self):
+        while not self._stopped.wait(self.interval):
+            self._reload()
+
+    def _watch(self):
+        inotify = watch(self.klass.CONF_PATHS)
+        try:
+            # Events only wake the thread early; changes are still detected
+            # with stat so that directories created later are not missed.
+            while not self._stopped.is_set():
+                inotify.read(timeout=int(self.interval * 1000))
+                if not self._stopped.is_set():
+                    self._reload()
+        finally:
+            inotify.close()
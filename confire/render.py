@@ -0,0 +1,228 @@
+# confire.render
+# Rendering configurations as text for logging and dumping
+#
+# For license information, see LICENSE.txt
+
+"""
+Rendering configurations as text. Each option is rendered on a single line
+as its name and repr, with whitespace collapsed and the repr truncated to
+76 columns less the width of the name. Rather than calling repr on every
+value and truncating the result, lists, tuples, dicts, sets and nested
+configurations are rendered as a stream of chunks that is abandoned as
+soon as the line is full, so rendering a huge list only generates its
+first few items.
+
+Configurations can also be dumped to a file-like object one line at a
+time, with nested configurations written as indented sections:
+
+    settings.dump(sys.stdout)
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from .config import Configuration
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+WIDTH   = 76    # Width shared by the option name and its value
+KEYSIZE = 10    # Minimum width of the option name column
+INDENT  = "    "
+BUDGET  = 64    # Number of container items below which repr is used directly
+
+SCALARS    = frozenset((str, int, float, bool, bytes, type(None)))
+CONTAINERS = frozenset((list, tuple, dict, set, frozenset))
+
+##########################################################################
+## Bounded repr
+##########################################################################
+
+def chunks(value, active=None):
+    """
+    Yields chunks of text that concatenate to repr(value). Containers are
+    yielded item by item so the caller can stop consuming them early.
+    """
+    kind = type(value)
+    if kind is list or kind is tuple:
+        opener, closer = ("[", "]") if kind is list else ("(", ")")
+        if not value:
+            yield opener + closer
+            return
+
+        active = active or set()
+        if id(value) in active:
+            yield opener + "..." + closer
+            return
+
+        active.add(id(value))
+        yield opener
+        for idx, item in enumerate(value):
+            if idx:
+                yield ", "
+            for chunk in chunks(item, active):
+                yield chunk
+        active.discard(id(value))
+        yield "," + closer if kind is tuple and len(value) == 1 else closer
+
+    elif kind is dict:
+        if not value:
+            yield "{}"
+            return
+
+        active = active or set()
+        if id(value) in active:
+            yield "{...}"
+            return
+
+        active.add(id(value))
+        yield "{"
+        for idx, (key, item) in enumerate(value.items()):
+            if idx:
+                yield ", "
+            for chunk in chunks(key, active):
+                yield chunk
+            yield ": "
+            for chunk in chunks(item, active):
+                yield chunk
+        active.discard(id(value))
+        yield "}"
+
+    elif kind is set or kind is frozenset:
+        if not value:
+            yield kind.__name__ + "()"
+            return
+
+        yield "{" if kind is set else "frozenset({"
+        for idx, item in enumerate(value):
+            if idx:
+                yield ", "
+            for chunk in chunks(item, active):
+                yield chunk
+        yield "}" if kind is set else "})"
+
+    elif isinstance(value, Configuration) and kind.__repr__ is Configuration.__repr__:
+        for idx, line in enumerate(lines(value)):
+            if idx:
+                yield "\n"
+            yield line
+
+    else:
+        yield repr(value)
+
+
+def small(value, budget=BUDGET):
+    """
+    Returns True if the value contains fewer than budget container items
+    (and no configurations), in which case repr is faster than chunking.
+    """
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        kind  = type(value)
+        if kind in SCALARS:
+            continue
+
+        if kind in CONTAINERS:
+            budget -= len(value)
+            if budget < 0:
+                return False
+            stack.extend(value.values() if kind is dict else value)
+        elif isinstance(value, Configuration):
+            return False
+    return True
+
+
+def bounded_repr(value, limit):
+    """
+    Returns repr(value) with runs of whitespace collapsed to single spaces,
+    truncated with an ellipsis if it is longer than limit characters. Only
+    as much of the repr as is needed to fill the limit is generated.
+    """
+    if limit < 3 or type(value) in SCALARS or small(value):
+        text = " ".join(repr(value).split())
+        return text[:limit-3] + "..." if len(text) > limit else text
+
+    parts = []
+    size  = 0
+    space = False
+    for chunk in chunks(value):
+        if not chunk:
+            continue
+
+        if chunk[0].isspace():
+            space = True
+
+        for idx, word in enumerate(chunk.split()):
+            if idx:
+                space = True
+            if space and size:
+                parts.append(" ")
+                size += 1
+            space = False
+
+            parts.append(word)
+            size += len(word)
+            if size > limit:
+                return "".join(parts)[:limit-3] + "..."
+
+        if chunk[-1].isspace():
+            space = True
+
+    return "".join(parts)
+
+##########################################################################
+## Rendering
+##########################################################################
+
+def lines(config):
+    """
+    Yields the rendered line of each option of the configuration.
+    """
+    for opt, val in config.options():
+        limit = WIDTH - max(len(opt), KEYSIZE)
+        yield "%-10s = %s" % (opt, bounded_repr(val, limit))
+
+
+def render(config):
+    """
+    Returns the rendered lines of the configuration joined by newlines.
+    This inlines lines() with a fast path for scalar values, which are the
+    majority of the options of most configurations.
+    """
+    rendered = []
+    for opt, val in config.options():
+        limit = WIDTH - max(len(opt), KEYSIZE)
+        if type(val) in SCALARS:
+            text = " ".join(repr(val).split())
+            if len(text) > limit:
+                text = text[:limit-3] + "..."
+        else:
+            text = bounded_repr(val, limit)
+        rendered.append("%-10s = %s" % (opt, text))
+    return "\n".join(rendered)
+
+
+def dump(config, fp, width=WIDTH, indent=""):
+    """
+    Writes the options of the configuration to the file-like object one
+    line at a time, writing nested configurations as indented sections.
+    Values are truncated to fit the width unless width is None, in which
+    case their complete repr is written in chunks.
+    """
+    for opt, val in config.options():
+        if isinstance(val, Configuration):
+            fp.write("%s%s:\n" % (indent, opt))
+            dump(val, fp, width, indent + INDENT)
+            continue
+
+        fp.write("%s%-10s = " % (indent, opt))
+        if width is None:
+            for chunk in chunks(val):
+                fp.write(chunk)
+        else:
+            limit = width - len(indent) - max(len(opt), KEYSIZE)
+            fp.write(bounded_repr(val, limit))
+        fp.write("\n")
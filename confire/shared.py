@@ -0,0 +1,318 @@
+# confire.shared
+# Read-only configurations shared between processes through mmap
+#
+# For license information, see LICENSE.txt
+
+"""
+Read-only configurations shared between processes through a memory mapped
+file (e.g. in /dev/shm, which is shared memory on Linux). A master process
+serializes its loaded configuration into the file and worker processes map
+it and read settings directly from the shared pages:
+
+    # Master
+    settings = MyConfig.load()
+    settings.share("/dev/shm/myapp.conf")
+
+    # Worker
+    segment  = Segment("/dev/shm/myapp.conf")
+    settings = segment.settings
+    settings.database.host
+
+Workers do not build a copy of the configuration: options are found with a
+hash table stored in the segment (keyed by the crc32 of the dotted option
+name) and only the value that is looked up is decoded. Since the mapped
+pages are never written to, they remain shared between all of the workers
+rather than being copied when reference counts change after a fork.
+
+The file is never modified in place: sharing a new version writes a new
+file and atomically renames it over the old one, so workers that still
+map the old version are unaffected. Segment.stale checks for a new version
+with a single stat and Segment.refresh maps it.
+
+Values are stored in marshal format, or pickled if marshal does not
+support them (e.g. dates), so the file must only be writable by the user
+that runs the master and workers; share creates it with mode 0600.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import mmap
+import zlib
+import pickle
+import struct
+import marshal
+import tempfile
+
+from .views import ConfigurationView
+
+##########################################################################
+## Module Constants
+##########################################################################
+
+MAGIC  = b"CONFIRE\x01"
+HEADER = struct.Struct("<8sQII")    # magic, version, count, slots
+ENTRY  = struct.Struct("<IIII")     # key offset, key length, value offset, value length
+ORDER  = struct.Struct("<I")        # slot of the entry, in key order
+
+# Tags that prefix each stored value
+MARSHALED = 0x6d
+PICKLED   = 0x70
+SECTION   = 0x73
+
+##########################################################################
+## Writing
+##########################################################################
+
+def entries(config, prefix=""):
+    """
+    Yields the dotted name and encoded value of every option, with nested
+    configurations yielded as sections followed by their options.
+    """
+    for opt, val in config.options():
+        name = prefix + opt
+        if hasattr(val, 'options'):
+            yield name, bytes((SECTION,))
+            for entry in entries(val, name + "."):
+                yield entry
+        else:
+            yield name, encode(val)
+
+
+def encode(value):
+    """
+    Encodes the value with marshal, falling back to pickle.
+    """
+    try:
+        return bytes((MARSHALED,)) + marshal.dumps(value)
+    except ValueError:
+        return bytes((PICKLED,)) + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+
+def serialize(config, version=1):
+    """
+    Returns the bytes of the shared segment for the configuration.
+    """
+    items = sorted((name.encode('utf-8'), value) for name, value in entries(config))
+    slots = 8
+    while slots < len(items) * 2:
+        slots *= 2
+
+    table = [None] * slots
+    order = []
+    blob  = bytearray()
+    start = HEADER.size + ENTRY.size * slots + ORDER.size * len(items)
+
+    for key, value in items:
+        koff = start + len(blob)
+        blob += key
+        voff = start + len(blob)
+        blob += value
+
+        slot = zlib.crc32(key) & (slots - 1)
+        while table[slot] is not None:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = (koff, len(key), voff, len(value))
+        order.append(slot)
+
+    data = bytearray(HEADER.pack(MAGIC, version, len(items), slots))
+    for entry in table:
+        data += ENTRY.pack(*(entry or (0, 0, 0, 0)))
+    for slot in order:
+        data += ORDER.pack(slot)
+    data += blob
+    return bytes(data)
+
+
+def share(config, path):
+    """
+    Writes the configuration to the shared file at path, replacing any
+    previous version atomically, and returns the new version number.
+    """
+    version = 1
+    try:
+        with open(path, 'rb') as f:
+            magic, previous, _, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic == MAGIC:
+            version = previous + 1
+    except (OSError, struct.error):
+        pass
+
+    data = serialize(config, version)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        os.remove(tmp)
+        raise
+    return version
+
+##########################################################################
+## Reading
+##########################################################################
+
+class Segment(object):
+    """
+    A handle on the shared configuration file at path that maps its
+    current version and can check for and map new versions.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._map()
+
+    def _map(self):
+        with open(self.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self.mapped = Mapped(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        self._key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def version(self):
+        """
+        The version number of the mapped configuration.
+        """
+        return self.mapped.version
+
+    @property
+    def settings(self):
+        """
+        The root configuration of the mapped version.
+        """
+        return SharedConfiguration(self.mapped, "")
+
+    def stale(self):
+        """
+        Returns True if a new version has been shared since it was mapped.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size) != self._key
+
+    def refresh(self):
+        """
+        Maps the new version if the segment is stale, returning True if
+        the settings have been replaced. Configurations obtained from the
+        previous version remain readable and unchanged.
+        """
+        if not self.stale():
+            return False
+        self._map()
+        return True
+
+
+class Mapped(object):
+    """
+    One version of a shared configuration file mapped into memory.
+    """
+
+    def __init__(self, buf):
+        magic, version, count, slots = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError("not a shared configuration")
+
+        self._mmap   = buf
+        self._view   = memoryview(buf)
+        self.version = version
+        self.count   = count
+        self.slots   = slots
+
+    def find(self, key):
+        """
+        Returns the (offset, length) of the value stored for the encoded
+        dotted key or None if it does not exist.
+        """
+        view, mask = self._view, self.slots - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            koff, klen, voff, vlen = ENTRY.unpack_from(view, HEADER.size + ENTRY.size * slot)
+            if not voff:
+                return None
+            if klen == len(key) and view[koff:koff+klen] == key:
+                return voff, vlen
+            slot = (slot + 1) & mask
+
+    def decode(self, offset, length):
+        """
+        Decodes the value at the offset, or returns None for a section.
+        """
+        tag = self._view[offset]
+        if tag == MARSHALED:
+            return marshal.loads(self._view[offset+1:offset+length])
+        if tag == PICKLED:
+            return pickle.loads(self._view[offset+1:offset+length])
+        return None
+
+    def key(self, idx):
+        """
+        Returns the entry (key, value offset, value length) at the index in
+        key order.
+        """
+        slot, = ORDER.unpack_from(self._view, HEADER.size + ENTRY.size * self.slots + ORDER.size * idx)
+        koff, klen, voff, vlen = ENTRY.unpack_from(self._view, HEADER.size + ENTRY.size * slot)
+        return bytes(self._view[koff:koff+klen]), voff, vlen
+
+    def scan(self, prefix):
+        """
+        Yields the entries whose key starts with the encoded prefix in key
+        order, starting from a binary search for the prefix.
+        """
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key(mid)[0] < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        for idx in range(lo, self.count):
+            entry = self.key(idx)
+            if not entry[0].startswith(prefix):
+                return
+            yield entry
+
+
+class SharedConfiguration(ConfigurationView):
+    """
+    A read-only view of the options of a mapped version (or of one of its
+    nested configurations) that supports the same case insensitive item,
+    get, attribute and options access as a Configuration.
+    """
+
+    __slots__ = ('_mapped', '_prefix')
+
+    def __init__(self, mapped, prefix):
+        object.__setattr__(self, '_mapped', mapped)
+        object.__setattr__(self, '_prefix', prefix)
+
+    def _lookup(self, key, default):
+        name = self._prefix + key
+        found = self._mapped.find(name.encode('utf-8'))
+        if found is None:
+            return default
+
+        value = self._mapped.decode(*found)
+        if value is None:
+            return SharedConfiguration(self._mapped, name + ".")
+        return value
+
+    def options(self):
+        """
+        Returns an iterable of the sorted option names and values.
+        """
+        prefix = self._prefix.encode('utf-8')
+        for key, offset, length in self._mapped.scan(prefix):
+            name = key[len(prefix):].decode('utf-8')
+            if "." in name:
+                continue
+
+            value = self._mapped.decode(offset, length)
+            if value is None:
+                value = SharedConfiguration(self._mapped, self._prefix + name + ".")
+            yield name, value
@@ -0,0 +1,108 @@
+# confire.snapshot
+# Atomic publication of configuration snapshots to concurrent readers
+#
+# For license information, see LICENSE.txt
+
+"""
+Atomic publication of configuration snapshots. Configuration.configure
+modifies options one at a time, so a thread reading the configuration
+while another configures it can see a mix of old and new options. A
+Published configuration avoids this by never modifying the configuration
+that readers see: writers build a new version to the side and publish it
+by swapping a single reference, while readers pin the current version
+without taking a lock:
+
+    published = Published(MyConfig.load())
+
+    # Readers
+    settings = published.current
+    connect(settings.database.host, settings.database.port)
+
+    # Writers
+    published.update({"database": {"host": "replica", "port": 5433}})
+
+New versions are copy-on-write copies of the current version (see
+Configuration.__copy__), so publishing only copies the nested
+configurations that are written to. Published versions must be treated
+as read-only; writes should go through update, set_many or publish.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import threading
+
+from copy import copy
+from collections import namedtuple
+
+##########################################################################
+## Published Configuration
+##########################################################################
+
+Snapshot = namedtuple("Snapshot", "version config")
+
+
+class Published(object):
+    """
+    Holds the current version of a configuration, replacing it atomically
+    when writers publish a new one. Writers are serialized by a lock.
+    """
+
+    def __init__(self, config=None):
+        self._lock = threading.Lock()
+        self._snapshot = Snapshot(0, config)
+
+    @property
+    def current(self):
+        """
+        The currently published configuration.
+        """
+        return self._snapshot.config
+
+    @property
+    def version(self):
+        """
+        The number of times a configuration has been published.
+        """
+        return self._snapshot.version
+
+    def pin(self):
+        """
+        Returns the current Snapshot, the version and its configuration.
+        """
+        return self._snapshot
+
+    def publish(self, config):
+        """
+        Publishes the configuration and returns the previous one.
+        """
+        with self._lock:
+            return self._publish(config)
+
+    def update(self, conf):
+        """
+        Publishes a new version of the configuration with the options from
+        the dictionary (or configuration) applied as configure would.
+        """
+        with self._lock:
+            config = copy(self._snapshot.config)
+            config.configure(conf)
+            self._publish(config)
+        return config
+
+    def set_many(self, values):
+        """
+        Publishes a new version of the configuration with the value of each
+        dotted path in the dictionary set.
+        """
+        with self._lock:
+            config = copy(self._snapshot.config)
+            config.set_many(values)
+            self._publish(config)
+        return config
+
+    def _publish(self, config):
+        previous = self._snapshot
+        self._snapshot = Snapshot(previous.version + 1, config)
+        return previous.config
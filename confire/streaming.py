@@ -0,0 +1,228 @@
+# confire.streaming
+# Streams YAML events directly into a configuration
+#
+# For license information, see LICENSE.txt
+
+"""
+Streams YAML events directly into a configuration. Rather than building the
+Python objects for the entire document and then walking them in configure,
+the top level mapping of the document is consumed one key at a time from
+the parser's event stream: only the value of the current key is composed
+and constructed before it is applied to the configuration, and values for
+nested Configurations are streamed into them in the same way. The values
+of keys that a configuration ignores (those in IGNORE_OPTIONS or, if
+STRICT_OPTIONS is set, those not declared on the class) are skipped
+entirely without being composed or constructed.
+
+Anchored nodes inside skipped values are still composed (but not
+constructed) so that aliases to them later in the document resolve. As
+with safe_load, only the last value of a duplicate key is applied.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from copy import copy
+from yaml.composer import ComposerError
+from yaml.nodes import ScalarNode, SequenceNode, MappingNode
+from yaml.events import (
+    AliasEvent, ScalarEvent, StreamEndEvent, SequenceStartEvent,
+    SequenceEndEvent, MappingStartEvent, MappingEndEvent,
+    CollectionStartEvent, CollectionEndEvent,
+)
+
+from . import loaders
+from .config import Configuration
+
+##########################################################################
+## Streaming loader
+##########################################################################
+
+MERGE_TAG = 'tag:yaml.org,2002:merge'
+
+
+def stream_path(path, config, Loader=None):
+    """
+    Opens the configuration file at the given path and streams it into the
+    configuration. Files in formats other than YAML cannot be streamed and
+    are instead loaded and applied in one step.
+    """
+    if loaders.format_loader(path) is not None:
+        config.configure(loaders.load_path(path))
+        return config
+
+    with open(path, 'r') as stream:
+        return stream_yaml(stream, config, Loader)
+
+
+def stream_yaml(stream, config, Loader=None):
+    """
+    Streams a single YAML document into the configuration using the
+    fastest safe loader available, unless a Loader class is passed in.
+    """
+    loader = (Loader or loaders.YAMLLoader)(stream)
+    try:
+        loader.get_event()
+        if loader.check_event(StreamEndEvent):
+            return config
+
+        loader.get_event()
+        anchors = {}
+        if loader.check_event(MappingStartEvent) and loader.peek_event().anchor is None:
+            stream_mapping(loader, config, anchors)
+        else:
+            config.configure(loader.construct_document(compose(loader, anchors)))
+        loader.get_event()
+
+        if not loader.check_event(StreamEndEvent):
+            event = loader.get_event()
+            raise ComposerError(
+                "expected a single document in the stream", None,
+                "but found another document", event.start_mark,
+            )
+    finally:
+        loader.dispose()
+    return config
+
+
+def stream_mapping(loader, config, anchors):
+    """
+    Applies the mapping at the head of the event stream to the config one
+    key at a time. Merge keys are collected and applied once the mapping
+    ends, without the keys that the mapping sets explicitly, since those
+    take precedence wherever the merge key appears (as with safe_load).
+
+    Nested configurations are streamed into a copy, and the option each
+    key had before it was first seen is kept, so that a duplicate key
+    replaces the earlier value rather than being merged into it.
+    """
+    merged, seen = {}, {}
+    loader.get_event()
+    while not loader.check_event(MappingEndEvent):
+        node = compose(loader, anchors)
+        if node.tag == MERGE_TAG:
+            value = loader.construct_document(compose(loader, anchors))
+            for mapping in reversed(value if isinstance(value, list) else [value]):
+                merged.update(mapping)
+            continue
+
+        key = loader.construct_document(node)
+        if not isinstance(key, str):
+            seen[key] = None
+            config.configure({key: loader.construct_document(compose(loader, anchors))})
+            continue
+
+        if config.ignores(key):
+            seen[key] = None
+            skip(loader, anchors)
+            continue
+
+        if key not in seen:
+            seen[key] = config.get(key)
+
+        opt = seen[key]
+        if not isinstance(opt, Configuration):
+            config.configure({key: loader.construct_document(compose(loader, anchors))})
+            continue
+
+        target = config._owned(key, opt)
+        if target is opt:
+            target = copy(opt)
+            setattr(config, key, target)
+
+        if loader.check_event(MappingStartEvent) and loader.peek_event().anchor is None:
+            stream_mapping(loader, target, anchors)
+        else:
+            target.configure(loader.construct_document(compose(loader, anchors)))
+    loader.get_event()
+
+    if merged:
+        config.configure(dict(
+            (key, value) for key, value in merged.items() if key not in seen
+        ))
+
+
+def skip(loader, anchors):
+    """
+    Consumes the events of the next value without composing them, except
+    for anchored nodes, which are composed so that later aliases resolve.
+    """
+    depth = 0
+    while True:
+        event = loader.peek_event()
+        if getattr(event, 'anchor', None) is not None and not isinstance(event, AliasEvent):
+            compose(loader, anchors)
+            if depth == 0:
+                return
+            continue
+
+        event = loader.get_event()
+        if isinstance(event, CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, CollectionEndEvent):
+            depth -= 1
+
+        if depth == 0:
+            return
+
+##########################################################################
+## Node composition
+##########################################################################
+
+def compose(loader, anchors):
+    """
+    Composes the node for the next value from the event stream, resolving
+    implicit tags with the loader. This mirrors yaml.composer.Composer but
+    only uses the event API, which both the pure-Python and the libyaml
+    loaders provide.
+    """
+    event = loader.get_event()
+    if isinstance(event, AliasEvent):
+        if event.anchor not in anchors:
+            raise ComposerError(
+                None, None, "found undefined alias %r" % event.anchor,
+                event.start_mark,
+            )
+        return anchors[event.anchor]
+
+    if isinstance(event, ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(ScalarNode, event.value, event.implicit)
+        node = ScalarNode(
+            tag, event.value, event.start_mark, event.end_mark, style=event.style
+        )
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        return node
+
+    if isinstance(event, SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = loader.resolve(SequenceNode, None, event.implicit)
+        node = SequenceNode(
+            tag, [], event.start_mark, None, flow_style=event.flow_style
+        )
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+
+        while not loader.check_event(SequenceEndEvent):
+            node.value.append(compose(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+        return node
+
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = loader.resolve(MappingNode, None, event.implicit)
+    node = MappingNode(
+        tag, [], event.start_mark, None, flow_style=event.flow_style
+    )
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+
+    while not loader.check_event(MappingEndEvent):
+        key = compose(loader, anchors)
+        node.value.append((key, compose(loader, anchors)))
+    node.end_mark = loader.get_event().end_mark
+    return node
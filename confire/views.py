@@ -0,0 +1,75 @@
+# confire.views
+# A mixin for read-only views of configurations
+#
+# For license information, see LICENSE.txt
+
+"""
+A mixin for read-only views of configurations, such as frozen snapshots,
+the flat layout and configurations shared between processes. Views store
+their options in their own way, so they only implement _lookup and
+options; the mixin provides the same case insensitive item, get and
+attribute access as a Configuration on top of them, and renders them in
+the same way.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+from .render import render
+
+##########################################################################
+## Configuration View
+##########################################################################
+
+# Returned by _lookup for options that do not exist
+MISSING = object()
+
+
+class ConfigurationView(object):
+    """
+    Mixin for read-only configuration views. Subclasses must implement
+    _lookup(key, default), which returns the value of the option with the
+    lowercase name key or the default if there is no such option, and
+    options(), which yields the (name, value) pairs of the options. _title
+    is the name used in error messages.
+    """
+
+    __slots__ = ()
+
+    @property
+    def _title(self):
+        return self.__class__.__name__
+
+    def get(self, key, default=None):
+        return self._lookup(key.lower(), default)
+
+    def __getitem__(self, key):
+        key = key.lower()
+        value = self._lookup(key, MISSING)
+        if value is MISSING:
+            raise KeyError(
+                "{} has no configuration '{}'".format(self._title, key)
+            )
+        return value
+
+    def __getattr__(self, name):
+        # Private names are never options, e.g. unset slots while copying
+        value = MISSING if name.startswith('_') else self._lookup(name.lower(), MISSING)
+        if value is MISSING:
+            raise AttributeError(
+                "{} has no configuration '{}'".format(self._title, name)
+            )
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is read-only".format(self._title))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is read-only".format(self._title))
+
+    def __str__(self):
+        return render(self)
+
+    def __repr__(self):
+        return str(self)
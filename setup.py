@@ -35,7 +35,7 @@ except ImportError:
 PROJECT      = os.path.abspath(os.path.dirname(__file__))
 REQUIRE_PATH = "requirements.txt"
 TEST_REQUIRE_PATH = "tests/requirements.txt"
-EXCLUDES = ("tests", "bin", "docs", "fixtures", "register",)
+EXCLUDES = ("tests", "bin", "docs", "fixtures", "register", "benchmarks",)
 
 VERSION  = __import__('confire').__version__
 
@@ -51,8 +51,13 @@ CLASSIFIERS = (
     'Natural Language :: English',
     'Operating System :: OS Independent',
     'Programming Language :: Python',
-    'Programming Language :: Python :: 2.7',
-    'Programming Language :: Python :: 3.6',
+    'Programming Language :: Python :: 3',
+    'Programming Language :: Python :: 3 :: Only',
+    'Programming Language :: Python :: 3.7',
+    'Programming Language :: Python :: 3.8',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
+    'Programming Language :: Python :: 3.11',
     'Topic :: Software Development',
     'Topic :: Software Development :: Libraries :: Python Modules',
     'Topic :: Utilities',
@@ -112,6 +117,7 @@ config = {
     "url": "https://github.com/bbengfort/confire",
     "download_url": 'https://github.com/bbengfort/confire/tarball/v{}'.format(VERSION),
     "packages": PACKAGES,
+    "python_requires": ">=3.7",
     "install_requires": list(get_requires()),
     "setup_requires": ['pytest-runner'],
     "tests_require": list(get_requires(TEST_REQUIRE_PATH)),
@@ -0,0 +1,87 @@
+# tests.conftest
+# Shared configurations and fixtures for the confire tests
+#
+# For license information, see LICENSE.txt
+
+"""
+Shared configurations and fixtures for the confire tests. Test modules that
+need a nested configuration subclass AppConfiguration (or use it as is) and
+write their CONF_PATHS with the conf_paths fixture.
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import time
+import pytest
+
+from confire.config import Configuration, path_setting
+
+
+##########################################################################
+## Configurations
+##########################################################################
+
+class PoolConfiguration(Configuration):
+
+    size    = 10
+    timeout = 30
+
+
+class DatabaseConfiguration(Configuration):
+
+    host    = "localhost"
+    port    = 5432
+    pool    = PoolConfiguration()
+    datadir = path_setting(required=False, raises=False)
+
+
+class AppConfiguration(Configuration):
+
+    CONF_PATHS = []
+
+    debug    = False
+    database = DatabaseConfiguration()
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+def touch(path, content):
+    """
+    Writes the content and bumps the mtime so that changes are detected
+    even on file systems with a coarse timestamp resolution.
+    """
+    mtime = os.stat(str(path)).st_mtime + 10 if path.exists() else time.time()
+    path.write(content)
+    os.utime(str(path), (mtime, mtime))
+
+
+@pytest.fixture(scope='function')
+def conf_paths(tmpdir):
+    """
+    Returns a function that writes (name, content) files to a temporary
+    directory and sets them as the CONF_PATHS of a configuration class,
+    returning their paths. Files whose content is None are not written.
+    The CONF_PATHS are reset after the test.
+    """
+    classes = []
+
+    def write(klass, *files):
+        paths = []
+        for name, content in files:
+            path = tmpdir.join(name)
+            if content is not None:
+                touch(path, content)
+            paths.append(path)
+
+        klass.CONF_PATHS = [str(path) for path in paths]
+        classes.append(klass)
+        return paths
+
+    yield write
+    for klass in classes:
+        klass.CONF_PATHS = []
@@ -0,0 +1,181 @@
+# tests.test_accessors
+# Testing the compiled accessors for nested settings
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the compiled accessors for nested settings
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+
+from unittest import mock
+from confire.config import Configuration
+from confire.accessors import build_trie, LEAF
+from tests.conftest import AppConfiguration, DatabaseConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class AccessorConfiguration(AppConfiguration):
+
+    mapping = {"Upper": {"lower": 1}}
+
+
+@pytest.fixture(scope='function')
+def config():
+    config = AccessorConfiguration()
+    config.database = DatabaseConfiguration()
+    config.mapping  = {"Upper": {"lower": 1}}
+    return config
+
+
+##########################################################################
+## Accessor Tests
+##########################################################################
+
+class TestAccessors(object):
+
+    def test_accessor(self, config):
+        """
+        Test that accessors return the value at the dotted path
+        """
+        assert config.accessor("debug")() is False
+        assert config.accessor("database.port")() == 5432
+        assert config.accessor("DATABASE.HOST")() == "localhost"
+        assert isinstance(config.accessor("database")(), DatabaseConfiguration)
+
+    def test_missing_path(self, config):
+        """
+        Test that missing paths raise a KeyError
+        """
+        with pytest.raises(KeyError):
+            config.accessor("database.missing")
+
+        config.configure({"added": 1})
+        accessor = config.accessor("added")
+        del config.added
+        with pytest.raises(KeyError):
+            accessor()
+
+    def test_cached_resolution(self, config):
+        """
+        Test that the path is only resolved again after a modification
+        """
+        accessor = config.accessor("database.port")
+        with mock.patch.object(
+            AccessorConfiguration, '__getitem__', side_effect=KeyError
+        ):
+            assert accessor() == 5432
+
+    def test_configure_invalidates(self, config):
+        """
+        Test that accessors follow configure and attribute updates
+        """
+        accessor = config.accessor("database.port")
+        config.configure({"database": {"port": 6543}})
+        assert accessor() == 6543
+
+        config.database.port = 7654
+        assert accessor() == 7654
+
+        replacement = DatabaseConfiguration()
+        replacement.port = 8765
+        config.database = replacement
+        assert accessor() == 8765
+
+    def test_class_attribute_invalidates(self, config):
+        """
+        Test that accessors follow class attribute changes
+        """
+        accessor = config.accessor("debug")
+        AccessorConfiguration.debug = True
+        try:
+            assert accessor() is True
+        finally:
+            AccessorConfiguration.debug = False
+        assert accessor() is False
+
+    def test_dict_tail(self, config):
+        """
+        Test that paths into plain dicts are looked up on every call
+        """
+        accessor = config.accessor("mapping.Upper.lower")
+        assert accessor() == 1
+
+        config.mapping["Upper"]["lower"] = 2
+        assert accessor() == 2
+
+    def test_build_trie(self):
+        """
+        Test that shared prefixes are arranged into a single trie node
+        """
+        trie = build_trie(("database.host", "database.port", "debug"))
+        assert set(trie) == {"database", "debug"}
+        assert set(trie["database"]) == {"host", "port"}
+        assert trie["database"]["host"][LEAF] == "database.host"
+
+    def test_get_many(self, config):
+        """
+        Test that many dotted paths are fetched with defaults
+        """
+        values = config.get_many([
+            "debug", "database.host", "DATABASE.PORT", "database.missing",
+            "missing.path", "mapping.Upper.lower", "debug.notnested",
+        ], default=1)
+
+        assert values == {
+            "debug": False,
+            "database.host": "localhost",
+            "DATABASE.PORT": 5432,
+            "database.missing": 1,
+            "missing.path": 1,
+            "mapping.Upper.lower": 1,
+            "debug.notnested": 1,
+        }
+
+    def test_get_many_shared_prefix(self, config):
+        """
+        Test that shared prefixes are only resolved once
+        """
+        with mock.patch.object(
+            AccessorConfiguration, '__getitem__',
+            autospec=True, side_effect=Configuration.__getitem__,
+        ) as getitem:
+            config.get_many(["database.host", "database.port"])
+            getitem.assert_called_once_with(config, "database")
+
+    def test_set_many(self, config):
+        """
+        Test that many dotted paths are set at once
+        """
+        config.set_many({
+            "debug": True,
+            "database.host": "db.example.com",
+            "mapping.Upper.lower": 2,
+            "created.nested.key": 3,
+        })
+
+        assert config.debug is True
+        assert config.database.host == "db.example.com"
+        assert config.database.port == 5432
+        assert config.mapping == {"Upper": {"lower": 2}}
+        assert config.created == {"nested": {"key": 3}}
+        assert config.accessor("created.nested.key")() == 3
+
+    def test_set_many_copies_dicts(self):
+        """
+        Test that set_many does not write into class attribute dicts
+        """
+        config = AccessorConfiguration()
+        config.set_many({"mapping.Upper.lower": 2, "mapping.added": 3})
+
+        assert config.mapping == {"Upper": {"lower": 2}, "added": 3}
+        assert AccessorConfiguration.mapping == {"Upper": {"lower": 1}}
+        assert AccessorConfiguration().mapping == {"Upper": {"lower": 1}}
@@ -0,0 +1,252 @@
+# tests.test_aio
+# Testing loading and reloading configurations from asyncio
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing loading and reloading configurations from asyncio
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import asyncio
+import pytest
+import threading
+
+from unittest import mock
+from confire import aio
+from confire import reload
+from confire.loaders import load_path
+from confire.config import path_setting
+from tests.conftest import AppConfiguration, touch
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class AsyncConfiguration(AppConfiguration):
+
+    ENVIRON_PREFIX = "CONFIRE_AIO_TEST"
+
+    datadir = path_setting(required=False, mkdirs=True)
+
+
+@pytest.fixture(scope='function')
+def confs(conf_paths, tmpdir):
+    first, _, second = conf_paths(
+        AsyncConfiguration,
+        ("first.yaml", "debug: true\ndatadir: {}\ndatabase:\n  host: db\n".format(tmpdir.join("data"))),
+        ("missing.yaml", None),
+        ("second.json", '{"database": {"port": 6543}}'),
+    )
+    return first, second
+
+
+##########################################################################
+## Loading Tests
+##########################################################################
+
+class TestAsyncLoad(object):
+
+    def test_aload(self, confs, tmpdir):
+        """
+        Test that aload merges the files exactly as load does
+        """
+        with mock.patch.dict(os.environ, {"CONFIRE_AIO_TEST_DATABASE__USER": "app"}):
+            config = asyncio.run(AsyncConfiguration.aload())
+            loaded = AsyncConfiguration.load()
+
+        assert not any(config.diff(loaded))
+        assert config.debug is True
+        assert config.database.host == "db"
+        assert config.database.port == 6543
+        assert config.database.user == "app"
+        assert config.datadir == str(tmpdir.join("data"))
+        assert AsyncConfiguration.database.host == "localhost"
+
+    def test_aload_cache(self, confs, tmpdir):
+        """
+        Test that aload reads the cache when CONF_CACHE is set
+        """
+        AsyncConfiguration.CONF_CACHE = str(tmpdir.join("confire.cache"))
+        try:
+            asyncio.run(AsyncConfiguration.aload())
+            with mock.patch('confire.loaders.parse') as parse:
+                config = asyncio.run(AsyncConfiguration.aload())
+                parse.assert_not_called()
+        finally:
+            AsyncConfiguration.CONF_CACHE = None
+        assert config.database.port == 6543
+
+    def test_does_not_block(self, confs):
+        """
+        Test that the files are read concurrently off the event loop
+        """
+        reading = threading.Event()
+        ticked  = threading.Event()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def slow_load(path):
+            # Both files must be read at once, and the event loop must keep
+            # running while they are being read
+            reading.set()
+            barrier.wait()
+            assert ticked.wait(5), "the event loop was blocked"
+            return load_path(path)
+
+        async def main():
+            async def ticker():
+                while True:
+                    if reading.is_set():
+                        ticked.set()
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.ensure_future(ticker())
+            with mock.patch.object(aio, 'load_path', slow_load):
+                config = await AsyncConfiguration.aload()
+            task.cancel()
+            return config
+
+        config = asyncio.run(main())
+        assert config.debug is True
+
+
+##########################################################################
+## Reloading Tests
+##########################################################################
+
+class TestAsyncReloader(object):
+
+    def test_check(self, confs):
+        """
+        Test that check publishes changes and awaits coroutine subscribers
+        """
+        first, _ = confs
+
+        async def main():
+            reloader = aio.AsyncReloader(AsyncConfiguration)
+            assert reloader.settings is None
+            assert await reloader.check() is None
+            assert reloader.settings.debug is True
+
+            called = []
+
+            async def subscriber(settings, delta):
+                await asyncio.sleep(0)
+                called.append(delta)
+            reloader.subscribe(subscriber)
+
+            assert await reloader.check() is None
+            touch(first, "debug: false\n")
+            delta = await reloader.check()
+            return reloader, delta, called
+
+        reloader, delta, called = asyncio.run(main())
+        assert reloader.settings.debug is False
+        assert "debug" in delta.changed
+        assert called == [delta]
+
+    def test_poll(self, confs):
+        """
+        Test that the watcher task polls for changes
+        """
+        first, _ = confs
+
+        async def main():
+            reloader = aio.AsyncReloader(AsyncConfiguration, interval=0.01)
+            changed = asyncio.Event()
+            reloader.subscribe(lambda settings, delta: changed.set())
+
+            with mock.patch.object(reload, 'inotify_simple', None):
+                await reloader.start()
+                assert reloader.settings.debug is True
+                touch(first, "debug: false\n")
+                await asyncio.wait_for(changed.wait(), 5)
+                await reloader.stop()
+            return reloader
+
+        reloader = asyncio.run(main())
+        assert reloader.settings.debug is False
+        assert reloader._task is None
+
+    def test_stop_during_check(self, confs):
+        """
+        Test that stop cancels the watcher task while it awaits a reload
+        """
+        async def main():
+            reloader = aio.AsyncReloader(AsyncConfiguration, interval=0)
+            await reloader.check()
+            checking = asyncio.Event()
+
+            async def check():
+                checking.set()
+                await asyncio.Event().wait()
+            reloader.check = check
+
+            with mock.patch.object(reload, 'inotify_simple', None):
+                await reloader.start()
+                await asyncio.wait_for(checking.wait(), 5)
+                await asyncio.wait_for(reloader.stop(), 5)
+            return reloader
+
+        reloader = asyncio.run(main())
+        assert reloader._task is None
+
+    def test_no_thread_methods(self):
+        """
+        Test that the async reloader does not inherit the watcher thread
+        """
+        assert issubclass(aio.AsyncReloader, reload.BaseReloader)
+        assert not issubclass(aio.AsyncReloader, reload.Reloader)
+        assert not hasattr(aio.AsyncReloader, "_poll")
+        assert not hasattr(aio.AsyncReloader, "_watch")
+
+    def test_watch(self, confs):
+        """
+        Test that the loop wakes the reloader when inotify is readable
+        """
+        first, _ = confs
+        rfd, wfd = os.pipe()
+
+        class FakeINotify(object):
+
+            closed = False
+
+            def fileno(self):
+                return rfd
+
+            def read(self, timeout=None):
+                return os.read(rfd, 1024)
+
+            def close(self):
+                self.closed = True
+
+        inotify = FakeINotify()
+
+        async def main():
+            reloader = aio.AsyncReloader(AsyncConfiguration, interval=60)
+            changed = asyncio.Event()
+            reloader.subscribe(lambda settings, delta: changed.set())
+
+            with mock.patch.object(reload, 'inotify_simple', True):
+                with mock.patch.object(reload, 'watch', return_value=inotify):
+                    await reloader.start()
+                    await asyncio.sleep(0.01)
+                    touch(first, "debug: false\n")
+                    os.write(wfd, b"x")
+                    await asyncio.wait_for(changed.wait(), 5)
+                    await reloader.stop()
+            return reloader
+
+        try:
+            reloader = asyncio.run(main())
+        finally:
+            os.close(rfd)
+            os.close(wfd)
+
+        assert reloader.settings.debug is False
+        assert inotify.closed
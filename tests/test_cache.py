@@ -0,0 +1,125 @@
+# tests.test_cache
+# Testing the on-disk cache of parsed configuration files
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the on-disk cache of parsed configuration files
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import pytest
+import datetime
+
+from unittest import mock
+from confire import cache
+from tests.conftest import AppConfiguration, touch
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class CachedConfiguration(AppConfiguration):
+
+    level = 0
+    name  = "default"
+
+
+@pytest.fixture(scope='function')
+def cached(conf_paths, tmpdir):
+    """
+    Configure a two file stack with a cache file in a temporary directory.
+    """
+    paths = conf_paths(
+        CachedConfiguration,
+        ("first.yaml", "level: 1\nname: first\n"),
+        ("second.yaml", "level: 2\n"),
+    )
+    CachedConfiguration.CONF_CACHE = str(tmpdir.join("confire.cache"))
+    yield paths
+    CachedConfiguration.CONF_CACHE = None
+
+
+##########################################################################
+## Cache Tests
+##########################################################################
+
+class TestCache(object):
+
+    def test_cache_key(self, tmpdir):
+        """
+        Test the cache key changes when a file is modified or created
+        """
+        path = tmpdir.join("conf.yaml")
+        key  = cache.cache_key([str(path)])
+
+        path.write("level: 1\n")
+        assert cache.cache_key([str(path)]) != key
+        key = cache.cache_key([str(path)])
+
+        path.write("level: 10\n")
+        assert cache.cache_key([str(path)]) != key
+
+    def test_read_write_cache(self, tmpdir):
+        """
+        Test that documents round trip through the cache file
+        """
+        path = str(tmpdir.join("confire.cache"))
+        key  = cache.cache_key([path])
+        docs = [{"level": 1, "nested": {"items": [1, 2, 3]}}]
+
+        assert cache.read_cache(path, key) is None
+        assert cache.write_cache(path, key, docs)
+        assert cache.read_cache(path, key) == docs
+        assert cache.read_cache(path, key + (None,)) is None
+
+    def test_unmarshalable_documents(self, tmpdir):
+        """
+        Test that documents with unsupported types are not cached
+        """
+        path = str(tmpdir.join("confire.cache"))
+        docs = [{"when": datetime.date(2026, 10, 17)}]
+
+        assert not cache.write_cache(path, (), docs)
+        assert not os.path.exists(path)
+
+    def test_corrupt_cache(self, tmpdir):
+        """
+        Test that a corrupt cache file is treated as a miss
+        """
+        path = tmpdir.join("confire.cache")
+        path.write("not a marshal file")
+        assert cache.read_cache(str(path), ()) is None
+
+    def test_load_cached(self, cached):
+        """
+        Test that a warm cache skips YAML parsing entirely
+        """
+        config = CachedConfiguration.load()
+        assert config.level == 2
+        assert config.name == "first"
+        assert os.path.exists(CachedConfiguration.CONF_CACHE)
+
+        with mock.patch('confire.loaders.load_yaml') as load_yaml:
+            config = CachedConfiguration.load()
+            load_yaml.assert_not_called()
+
+        assert config.level == 2
+        assert config.name == "first"
+
+    def test_load_invalidated(self, cached):
+        """
+        Test that modifying a configuration file invalidates the cache
+        """
+        _, second = cached
+        assert CachedConfiguration.load().level == 2
+
+        touch(second, "level: 3\nname: second\n")
+        config = CachedConfiguration.load()
+        assert config.level == 3
+        assert config.name == "second"
@@ -139,6 +139,24 @@ class TestConfig(object):
         config = MockConfiguration.load()
         assert not config["mysetting"]
 
+    @pytest.mark.filterwarnings("ignore")
+    def test_load_parallel(self, tmpdir, emptyconfig):
+        """
+        Assert parallel loading merges identically to sequential loading
+        """
+        paths = [str(tmpdir.join("conf{}.yaml".format(idx))) for idx in range(6)]
+        for idx, path in enumerate(paths):
+            with open(path, 'w') as f:
+                f.write("anoption: {0}\nlayer{0}: {0}\nnested:\n  level: {0}\n".format(idx))
+
+        Configuration.CONF_PATHS = paths
+        sequential = MockConfiguration.load()
+        for parallel in (True, 2):
+            config = MockConfiguration.load(parallel=parallel)
+            assert not any(config.diff(sequential))
+            assert config["anoption"] == 5
+            assert config["nested"]["level"] == 5
+
     def test_configure_by_dict(self):
         """
         Check configuration by dictionary
@@ -189,6 +207,24 @@ class TestConfig(object):
         assert config.get('nested').get('level') == 'lobby'
         assert config.get('nested').get('nested').get('level') == 'basement'
 
+    def test_strict_configure(self):
+        """
+        Test that strict configurations only load declared options
+        """
+        class StrictConfiguration(NestedConfiguration):
+            STRICT_OPTIONS = True
+
+        config = StrictConfiguration()
+        config.nested = SubNestedConfiguration()
+        config.configure({"level": 3, "undeclared": True, "nested": {"extra": 1}})
+
+        assert config.level == 3
+        assert config.get("undeclared") is None
+        assert config.nested.extra == 1
+        assert StrictConfiguration.ignores("undeclared")
+        assert not StrictConfiguration.ignores("LEVEL")
+        assert not NestedConfiguration.ignores("undeclared")
+
     @pytest.mark.filterwarnings("ignore")
     def test_environ_configuration(self):
         """
@@ -234,6 +270,20 @@ class TestConfig(object):
         assert config['nested']['nested_path'] == '/tmp'
         assert config['NESTED']['NESTED_PATH'] == '/tmp'
 
+    @pytest.mark.filterwarnings("ignore")
+    def test_deferred_path_configuration(self, testconfig):
+        """
+        Test the paths loaded with deferred validation
+        """
+
+        class DeferredConfiguration(MockConfiguration):
+
+            DEFER_PATHS = True
+
+        config = DeferredConfiguration.load()
+        assert os.path.expanduser('~/tmp/data.txt') == config.myfile
+        assert config.nested.nested_path == '/tmp'
+
     def test_options(self):
         """
         Test the options method
@@ -249,6 +299,40 @@ class TestConfig(object):
         assert "amethod" not in options
         assert "NOTANOPT" not in options
 
+    def test_options_cache(self):
+        """
+        Test that options are cached and invalidated when keys change
+        """
+        config = MockConfiguration.load()
+        names  = config._option_names()
+        assert names == tuple(sorted(names))
+        assert config._option_names() is names
+
+        # Updating an existing option does not change the names
+        config.anoption = 43
+        assert config._option_names() is names
+        assert dict(config.options())["anoption"] == 43
+
+        # Adding and removing options does
+        config.configure({"foo": "bar"})
+        assert "foo" in dict(config.options())
+        del config.foo
+        assert "foo" not in dict(config.options())
+
+    def test_options_inherited(self):
+        """
+        Test that options include inherited and class level changes
+        """
+
+        class SubMockConfiguration(MockConfiguration):
+            pass
+
+        config = SubMockConfiguration.load()
+        assert "anoption" in dict(config.options())
+
+        SubMockConfiguration.added = "yes"
+        assert dict(config.options())["added"] == "yes"
+
     def test_get(self):
         """
         Assert that get returns default or key
@@ -272,6 +356,34 @@ class TestConfig(object):
         config = MockConfiguration.load()
         assert config["MYSETTING"]
 
+    def test_inherited_options(self):
+        """
+        Assert inherited options are found by case insensitive lookup
+        """
+
+        class SubMockConfiguration(MockConfiguration):
+
+            extra = "extra"
+
+        config = SubMockConfiguration.load()
+        assert config["ANOPTION"] == 42
+        assert config["extra"] == "extra"
+        assert config.get("amethod") is None
+        assert config.get("_notanopt") is None
+        assert config.get("notanopt", 1) == 1
+
+    def test_instance_options(self):
+        """
+        Assert options added to the instance are found but private ones not
+        """
+        config = MockConfiguration.load()
+        config.configure({"foo": "bar", "_private": "value"})
+        assert config["FOO"] == "bar"
+        assert config.get("_private") is None
+
+        with pytest.raises(KeyError):
+            config["_private"]
+
     def test_key_error(self):
         """
         Assert not found key raises an exception
@@ -293,3 +405,133 @@ class TestConfig(object):
         config.nested.configure(NestedConfiguration())
         assert len(config.nested.empty) == 0
         assert config.nested.level == 1
+
+
+##########################################################################
+## Copy-on-write Tests
+##########################################################################
+
+class TestCopyOnWrite(object):
+
+    def test_reads_are_shared(self):
+        """
+        Assert nested defaults are not copied when they are read
+        """
+        config = MockConfiguration()
+        version = config._version
+        assert config.nested is MockConfiguration.nested
+        assert config.nested.nested is NestedConfiguration.nested
+        assert str(config)
+        assert "nested" not in config.__dict__
+        assert config._version == version
+
+    def test_writable(self):
+        """
+        Assert writable copies nested defaults for attribute writes
+        """
+        first, second = MockConfiguration(), MockConfiguration()
+        first.writable("nested").level = 10
+        first.writable("nested").writable("nested").level = 20
+
+        assert first.nested.level == 10
+        assert first.nested.nested.level == 20
+        assert second.nested.level == 1
+        assert second.nested.nested is NestedConfiguration.nested
+        assert MockConfiguration.nested.level == 1
+        assert NestedConfiguration.nested.level == 2
+
+        # The copy is owned, so it is not copied again
+        assert first.writable("NESTED") is first.nested
+        with pytest.raises(TypeError):
+            first.writable("anoption")
+
+    def test_configure_copies(self):
+        """
+        Assert configure copies nested defaults before writing to them
+        """
+        first, second = MockConfiguration(), MockConfiguration()
+        first.configure({"nested": {"level": "lobby", "nested": {"level": "basement"}}})
+        second.configure({"nested": {"level": "roof"}})
+
+        assert first.nested.level == "lobby"
+        assert first.nested.nested.level == "basement"
+        assert second.nested.level == "roof"
+        assert second.nested.nested is NestedConfiguration.nested
+        assert MockConfiguration.nested.level == 1
+        assert NestedConfiguration.nested.level == 2
+
+        # The copy is owned, so later writes do not copy it again
+        nested = first.nested
+        first.configure({"nested": {"level": "mezzanine"}})
+        assert first.nested is nested
+
+    def test_copy(self):
+        """
+        Assert copies share nested configurations until one side writes
+        """
+        config = MockConfiguration()
+        config.configure({"nested": {"level": "lobby"}})
+        clone = copy(config)
+        assert clone.nested is config.nested
+
+        clone.configure({"nested": {"level": "roof"}})
+        assert clone.nested.level == "roof"
+        assert config.nested.level == "lobby"
+
+        config.configure({"nested": {"level": "basement"}})
+        assert config.nested.level == "basement"
+        assert clone.nested.level == "roof"
+
+    def test_copy_leaves_original(self):
+        """
+        Assert copying does not change the original configuration
+        """
+        config = MockConfiguration()
+        config.configure({"nested": {"level": "lobby"}})
+        nested = config.nested
+
+        clone = copy(config)
+        assert config.__dict__["nested"] is nested
+        assert "_borrowed" not in config.__dict__
+
+        config.configure({"nested": {"level": "roof"}})
+        assert config.nested is nested
+        assert nested.level == "roof"
+        assert clone.writable("nested") is not nested
+
+    def test_set_many_copies(self):
+        """
+        Assert set_many copies nested defaults before writing to them
+        """
+        config = MockConfiguration()
+        config.set_many({"nested.level": 3, "nested.nested.level": 4})
+        assert config.nested.level == 3
+        assert config.nested.nested.level == 4
+        assert MockConfiguration.nested.level == 1
+        assert NestedConfiguration.nested.level == 2
+
+    def test_copy_paths(self, tmpdir):
+        """
+        Assert copies keep path settings, which are not stored in __dict__
+        """
+        class PathsConfiguration(Configuration):
+
+            datadir = path_setting(raises=False)
+
+        class ParentConfiguration(Configuration):
+
+            paths = PathsConfiguration()
+            level = 1
+
+        config = ParentConfiguration()
+        config.configure({"paths": {"datadir": str(tmpdir)}})
+
+        clone = copy(config)
+        assert clone.paths.datadir == str(tmpdir)
+
+        clone.configure({"paths": {"datadir": "/tmp"}, "level": 2})
+        assert clone.paths.datadir == "/tmp"
+        assert config.paths.datadir == str(tmpdir)
+
+        other = copy(config.paths)
+        assert other.datadir == str(tmpdir)
@@ -20,6 +20,7 @@ Implements a base SettingsDescriptor for advanced configurations
 import pytest
 
 from six import with_metaclass
+from confire import descriptors
 from confire.descriptors import SettingsDescriptor, SettingsMeta
 
 
@@ -131,3 +132,78 @@ class TestDescriptors(object):
         assert SubMockObject.test_setting.label == "test_setting"
         assert SubMockObject.subtest_setting.label is not None
         assert SubMockObject.subtest_setting.label == "subtest_setting"
+
+    def test_options_index(self):
+        """
+        Ensure the metaclass indexes public, non-callable attributes
+        """
+
+        class IndexedObject(MockObject):
+
+            option = 42
+            Upper  = "invisible"
+            _private = "invisible"
+
+            def method(self):
+                pass
+
+            @classmethod
+            def klassmethod(klass):
+                pass
+
+        assert IndexedObject._options_index == frozenset(
+            ('test_setting', 'option')
+        )
+
+    def test_options_index_inheritance(self):
+        """
+        Ensure subclasses inherit and can shadow indexed options
+        """
+
+        class ParentObject(MockObject):
+
+            option = 42
+            shadow = "option"
+
+        class ChildObject(ParentObject):
+
+            def shadow(self):
+                pass
+
+        assert 'option' in ChildObject._options_index
+        assert 'shadow' in ParentObject._options_index
+        assert 'shadow' not in ChildObject._options_index
+
+    def test_options_index_class_update(self):
+        """
+        Ensure that the options index follows class attribute changes
+        """
+
+        class ParentObject(MockObject):
+            pass
+
+        class ChildObject(ParentObject):
+            pass
+
+        ParentObject.added = True
+        assert 'added' in ParentObject._options_index
+        assert 'added' in ChildObject._options_index
+
+        del ParentObject.added
+        assert 'added' not in ParentObject._options_index
+        assert 'added' not in ChildObject._options_index
+
+    def test_uppercase_class_update(self):
+        """
+        Ensure that uppercase class attributes do not rebuild the index
+        """
+
+        class ParentObject(MockObject):
+            pass
+
+        index, generation = ParentObject._options_index, descriptors.generation
+        ParentObject.CONF_PATHS = ["/tmp/conf.yaml"]
+        del ParentObject.CONF_PATHS
+
+        assert ParentObject._options_index is index
+        assert descriptors.generation == generation
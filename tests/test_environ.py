@@ -20,8 +20,9 @@ Tests the environment configuration ability
 import os
 import pytest
 
-from confire import environ_setting
+from confire import environ_setting, environ_overlay
 from confire.exceptions import ImproperlyConfigured, ConfigurationMissing
+from tests.conftest import AppConfiguration
 
 
 ##########################################################################
@@ -91,3 +92,61 @@ class TestEnviron(object):
         """
         FAKEKEY = 'MISSING_SETTING'
         assert environ_setting(FAKEKEY, required=False, default='15') == '15'
+
+
+##########################################################################
+## Environment overlay test case
+##########################################################################
+
+class OverlayConfiguration(AppConfiguration):
+
+    ENVIRON_PREFIX = "CONFIRETEST"
+
+
+class TestEnvironOverlay(object):
+
+    def test_environ_overlay(self):
+        """
+        Test that prefixed variables are collected into a nested dict
+        """
+        environ = {
+            "MYAPP_DEBUG": "false",
+            "MYAPP_DATABASE__HOST": "db.example.com",
+            "MYAPP_DATABASE__PORT": "6543",
+            "MYAPP_DATABASE": "shadowed",
+            "MYAPP_A__B__C": "deep",
+            "MYAPP_BAD__": "ignored",
+            "OTHER_DEBUG": "ignored",
+            "MYAPPDEBUG": "ignored",
+        }
+
+        assert environ_overlay("MYAPP", environ) == {
+            "debug": "false",
+            "database": {"host": "db.example.com", "port": "6543"},
+            "a": {"b": {"c": "deep"}},
+        }
+        assert environ_overlay("MYAPP_", environ) == environ_overlay("MYAPP", environ)
+
+    def test_raw_environ_keys(self, monkeypatch):
+        """
+        Test that filtering the raw os.environ keys matches a mapping scan
+        """
+        monkeypatch.setenv("CONFIRETEST_NAME", "caf\u00e9")
+        monkeypatch.setenv("CONFIRETEST_DATABASE__HOST", "db.example.com")
+        monkeypatch.setenv("CONFIRETESTNAME", "ignored")
+
+        overlay = environ_overlay("CONFIRETEST")
+        assert overlay == environ_overlay("CONFIRETEST", dict(os.environ))
+        assert overlay == {"name": "caf\u00e9", "database": {"host": "db.example.com"}}
+
+    def test_load_environ_overlay(self, monkeypatch):
+        """
+        Test that load applies the overlay from the real environment
+        """
+        monkeypatch.setenv("CONFIRETEST_DEBUG", "false")
+        monkeypatch.setenv("CONFIRETEST_DATABASE__HOST", "db.example.com")
+
+        config = OverlayConfiguration.load()
+        assert config["debug"] == "false"
+        assert config["database"]["host"] == "db.example.com"
+        assert config["database"]["port"] == 5432
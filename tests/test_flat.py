@@ -0,0 +1,183 @@
+# tests.test_flat
+# Testing the flat, array-backed configuration layout
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the flat, array-backed configuration layout
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+
+from confire.flat import FlatStore, FlatConfiguration, Section
+from tests.conftest import AppConfiguration, DatabaseConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class FlatMockConfiguration(AppConfiguration):
+
+    items = ["apples"]
+
+
+class StrictDatabaseConfiguration(DatabaseConfiguration):
+
+    STRICT_OPTIONS = True
+
+
+class StrictFlatConfiguration(FlatMockConfiguration):
+
+    IGNORE_OPTIONS = ("debug",)
+    STRICT_OPTIONS = True
+
+    database = StrictDatabaseConfiguration()
+    empty    = DatabaseConfiguration()
+
+
+@pytest.fixture(scope='function')
+def conf(conf_paths):
+    path, = conf_paths(FlatMockConfiguration, (
+        "conf.yaml",
+        "debug: true\n"
+        "database:\n  port: 6543\n"
+        "Tenants:\n  acme:\n    feature: true\n  globex:\n    feature: false\n"
+    ))
+    return str(path)
+
+
+##########################################################################
+## Flat Store Tests
+##########################################################################
+
+class TestFlatStore(object):
+
+    def test_update(self):
+        """
+        Test that nested mappings are stored as sections
+        """
+        store = FlatStore()
+        store.update({"a": {"b": 1, "c": {"d": 2}}, "e": {}, "F": 3})
+
+        assert list(store.root.layout) == ["a", "e", "f"]
+        assert store.get(store.root, "e") == {}
+        assert store.get(store.root, "f") == 3
+        assert store.get(store.root, "missing", 4) == 4
+
+        section = store.get(store.root, "a")
+        assert isinstance(section, Section)
+        assert list(section.layout) == ["b", "c"]
+        assert store.get(store.get(section, "c"), "d") == 2
+        assert len(store) == 6
+
+    def test_shared_layouts(self):
+        """
+        Test that sections with the same option names share a layout
+        """
+        store = FlatStore()
+        store.update({"tenants": dict(
+            ("tenant{}".format(idx), {"feature": True, "limit": idx})
+            for idx in range(10)
+        )})
+
+        tenants = store.get(store.root, "tenants")
+        layouts = set(
+            id(store.get(tenants, name).layout) for name in tenants.layout
+        )
+        assert len(layouts) == 1
+
+    def test_replace_section(self):
+        """
+        Test that leaves and sections replace each other
+        """
+        store = FlatStore()
+        store.update({"a": {"b": 1, "c": 2}, "d": 3})
+        store.update({"a": "leaf"})
+        assert store.get(store.root, "a") == "leaf"
+        assert len(store) == 2
+
+        store.update({"a": {"x": 1}})
+        assert store.get(store.get(store.root, "a"), "x") == 1
+
+    def test_compact(self):
+        """
+        Test that reallocated blocks are reclaimed
+        """
+        store = FlatStore()
+        for idx in range(100):
+            store.update({"key{}".format(idx): idx})
+
+        assert len(store.values) < 200
+        assert [store.get(store.root, "key{}".format(idx)) for idx in range(100)] == list(range(100))
+
+
+##########################################################################
+## Flat Configuration Tests
+##########################################################################
+
+class TestFlatConfiguration(object):
+
+    def test_load_flat(self, conf):
+        """
+        Test loading a configuration into the flat layout
+        """
+        settings = FlatMockConfiguration.load_flat()
+        assert isinstance(settings, FlatConfiguration)
+        assert settings["DEBUG"] is True
+        assert settings.items == ["apples"]
+        assert settings["database"]["host"] == "localhost"
+        assert settings.database.port == 6543
+        assert settings["tenants"]["acme"]["feature"] is True
+        assert settings.get("missing", 1) == 1
+
+        with pytest.raises(KeyError):
+            settings["missing"]
+
+        with pytest.raises(AttributeError):
+            settings.missing
+
+    def test_options(self, conf):
+        """
+        Test that options lists the direct children of a section
+        """
+        settings = FlatMockConfiguration.load_flat()
+        names = [name for name, _ in settings.options()]
+        assert names == ["database", "debug", "items", "tenants"]
+        assert dict(settings.tenants.options())["globex"] == settings.tenants.globex
+        assert "database" in str(settings)
+
+    def test_configure(self, conf):
+        """
+        Test that configure merges data into a section
+        """
+        settings = FlatMockConfiguration.load_flat()
+        settings.database.configure({"host": "db.example.com"})
+        settings.workers = 4
+
+        assert settings.database.host == "db.example.com"
+        assert settings.database.port == 6543
+        assert settings.workers == 4
+
+    def test_strict_options(self, conf):
+        """
+        Test that the flat layout filters ignored and undeclared options
+        """
+        settings = StrictFlatConfiguration.load_flat()
+        assert settings.debug is False
+        assert settings.database.port == 6543
+        assert settings.get("tenants") is None
+
+        settings.configure({"workers": 4, "items": ["pears"]})
+        settings.database.configure({"replica": "db1", "host": "db0"})
+        settings.empty.configure({"replica": "db1"})
+
+        assert settings.get("workers") is None
+        assert settings.items == ["pears"]
+        assert settings.database.get("replica") is None
+        assert settings.database.host == "db0"
+        assert settings.empty.replica == "db1"
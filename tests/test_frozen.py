@@ -0,0 +1,128 @@
+# tests.test_frozen
+# Testing the immutable configuration snapshots
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the immutable configuration snapshots
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pickle
+import pytest
+
+from confire.frozen import FrozenConfiguration
+from tests.conftest import AppConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class FrozenMockConfiguration(AppConfiguration):
+
+    debug    = True
+    items    = ["apples", "bananas"]
+    mapping  = {"a": [1, 2]}
+    nothing  = None
+
+    def amethod(self):
+        return True
+
+
+@pytest.fixture(scope='function')
+def config():
+    config = FrozenMockConfiguration.load()
+    config.configure({"added": 42})
+    return config
+
+
+##########################################################################
+## Frozen Tests
+##########################################################################
+
+class TestFrozen(object):
+
+    def test_freeze(self, config):
+        """
+        Test that a frozen configuration has the same options
+        """
+        frozen = config.freeze()
+        assert isinstance(frozen, FrozenConfiguration)
+        assert [opt for opt, _ in frozen.options()] == [
+            opt for opt, _ in config.options()
+        ]
+
+        assert frozen["DEBUG"] is True
+        assert frozen.get("added") == 42
+        assert frozen.get("missing", 1) == 1
+        assert frozen.get("nothing") is None
+        assert frozen.get("amethod") is None
+        assert frozen.debug is True
+
+        with pytest.raises(KeyError):
+            frozen["missing"]
+
+        with pytest.raises(AttributeError):
+            frozen.missing
+
+    def test_nested_freeze(self, config):
+        """
+        Test that nested configurations and containers are frozen
+        """
+        frozen = config.freeze()
+        assert isinstance(frozen.database, FrozenConfiguration)
+        assert isinstance(frozen.database.pool, FrozenConfiguration)
+        assert frozen["database"]["port"] == 5432
+        assert frozen.items == ("apples", "bananas")
+        assert frozen.mapping["a"] == (1, 2)
+
+        with pytest.raises(TypeError):
+            frozen.mapping["b"] = 3
+
+    def test_immutable(self, config):
+        """
+        Test that frozen configurations cannot be modified
+        """
+        frozen = config.freeze()
+        with pytest.raises(AttributeError):
+            frozen.debug = False
+
+        with pytest.raises(AttributeError):
+            del frozen.debug
+
+        config.debug = False
+        assert frozen.debug is True
+
+    def test_hash_and_equality(self, config):
+        """
+        Test that equal snapshots hash identically
+        """
+        first, second = config.freeze(), config.freeze()
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first._index is second._index
+
+        config.configure({"added": 43})
+        third = config.freeze()
+        assert first != third
+        assert len(set([first, second, third])) == 2
+
+    def test_pickle(self, config):
+        """
+        Test that frozen configurations can be pickled
+        """
+        frozen = config.freeze()
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+    def test_str(self, config):
+        """
+        Test that frozen configurations render like mutable ones
+        """
+        frozen = str(config.freeze()).splitlines()
+        mutable = str(config).splitlines()
+        assert len(frozen) == len(mutable)
+        assert frozen[0] == mutable[0]
@@ -0,0 +1,184 @@
+# tests.test_hashing
+# Testing the structural hashing and diffing of configurations
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the structural hashing and diffing of configurations
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import sys
+import subprocess
+
+from copy import copy
+from unittest import mock
+from confire import hashing
+from confire.config import Configuration
+from tests.conftest import AppConfiguration, DatabaseConfiguration, PoolConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class HashConfiguration(AppConfiguration):
+
+    tags  = {"web", "api"}
+    extra = {"b": [1, 2], "a": {"x": None}}
+
+
+def make():
+    config = HashConfiguration()
+    config.database = DatabaseConfiguration()
+    config.database.pool = PoolConfiguration()
+    return config
+
+
+##########################################################################
+## Fingerprint Tests
+##########################################################################
+
+class TestFingerprint(object):
+
+    def test_equal_configurations(self):
+        """
+        Test that structurally equal configurations have the same fingerprint
+        """
+        first, second = make(), make()
+        second.extra = {"a": {"x": None}, "b": [1, 2]}
+        second.tags = {"api", "web"}
+        assert first.fingerprint() == second.fingerprint()
+        assert 0 <= first.fingerprint() < 2 ** 64
+
+    def test_changes(self):
+        """
+        Test that setting, deleting and nested changes alter the fingerprint
+        """
+        config = make()
+        original = config.fingerprint()
+
+        config.debug = True
+        assert config.fingerprint() != original
+        config.debug = False
+        assert config.fingerprint() == original
+
+        config.database.pool.size = 20
+        assert config.fingerprint() != original
+        config.database.pool.size = 10
+        assert config.fingerprint() == original
+
+        config.added = "value"
+        assert config.fingerprint() != original
+        del config.added
+        assert config.fingerprint() == original
+
+    def test_value_types(self):
+        """
+        Test that values of different types do not collide
+        """
+        config = make()
+        seen = set()
+        for value in (1, "1", 1.5, True, [1], (1, 2), [[1], 2], b"1", {"1": 1}):
+            config.debug = value
+            seen.add(config.fingerprint())
+        assert len(seen) == 9
+
+    def test_incremental(self):
+        """
+        Test that only modified options are rehashed
+        """
+        config = make()
+        config.fingerprint()
+
+        with mock.patch.object(hashing, 'entry', wraps=hashing.entry) as entry:
+            config.fingerprint()
+            assert entry.call_count == 0
+
+            config.debug = True
+            config.database.port = 5433
+            config.fingerprint()
+            assert sorted(call[0][0] for call in entry.call_args_list) == ["debug", "port"]
+
+    def test_class_changes(self):
+        """
+        Test that changing a class attribute is detected
+        """
+        class Configured(Configuration):
+            level = 1
+
+        config = Configured()
+        original = config.fingerprint()
+        Configured.level = 2
+        assert config.fingerprint() != original
+
+    def test_copy(self):
+        """
+        Test that copies do not share digests with the original
+        """
+        config = make()
+        config.fingerprint()
+        other = copy(config)
+        other.debug = True
+        assert other.fingerprint() != config.fingerprint()
+        assert config.fingerprint() == make().fingerprint()
+
+    def test_stable(self):
+        """
+        Test that fingerprints are stable across processes
+        """
+        script = (
+            "from tests.test_hashing import make; "
+            "print(make().fingerprint())"
+        )
+        root = os.path.dirname(os.path.dirname(__file__))
+        for seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            output = subprocess.check_output([sys.executable, "-c", script], cwd=root, env=env)
+            assert int(output) == make().fingerprint()
+
+
+##########################################################################
+## Diff Tests
+##########################################################################
+
+class TestDiff(object):
+
+    def test_no_changes(self):
+        """
+        Test that identical configurations have an empty diff
+        """
+        assert make().diff(make()) == hashing.Diff([], [], [])
+
+    def test_diff(self):
+        """
+        Test the added, removed and changed dotted keys
+        """
+        old, new = make(), make()
+        old.removed = 1
+        new.added = 2
+        new.extra = {"b": [1, 2, 3]}
+        new.database.pool.size = 20
+        new.database.replica = PoolConfiguration()
+        new.database.pool = None
+
+        delta = old.diff(new)
+        assert delta.added == ["added", "database.replica.size", "database.replica.timeout"]
+        assert delta.removed == ["database.pool.size", "database.pool.timeout", "removed"]
+        assert delta.changed == ["extra"]
+
+    def test_short_circuit(self):
+        """
+        Test that subtrees with matching fingerprints are not compared
+        """
+        old, new = make(), make()
+        new.debug = True
+
+        with mock.patch.object(hashing, 'compare', wraps=hashing.compare) as compare:
+            delta = old.diff(new)
+        assert delta.changed == ["debug"]
+        assert compare.call_count == 2
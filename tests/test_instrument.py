@@ -0,0 +1,102 @@
+# tests.test_instrument
+# Testing the load instrumentation hooks
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the load instrumentation hooks
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+
+from unittest import mock
+from confire import instrument
+from confire.config import path_setting
+from confire.paths import deferred_paths
+from confire.instrument import profile, count_keys
+from tests.conftest import AppConfiguration, DatabaseConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class InstrumentedConfiguration(AppConfiguration):
+
+    path = path_setting(required=False)
+
+
+@pytest.fixture(scope='function')
+def conf(conf_paths, tmpdir):
+    path, = conf_paths(InstrumentedConfiguration, (
+        "conf.yaml", "debug: true\npath: {}\ndatabase:\n  port: 2\n".format(tmpdir)
+    ))
+    return str(path)
+
+
+##########################################################################
+## Instrumentation Tests
+##########################################################################
+
+class TestInstrument(object):
+
+    def test_count_keys(self):
+        """
+        Test that keys are counted including nested dictionaries
+        """
+        assert count_keys(None) == 0
+        assert count_keys({"a": 1, "b": {"c": 2, "d": {"e": 3}}}) == 5
+
+    def test_no_hooks(self, conf):
+        """
+        Test that no instrumentation is emitted without hooks
+        """
+        assert not instrument.HOOKS
+        with mock.patch('confire.instrument.emit') as emit:
+            InstrumentedConfiguration.load()
+            emit.assert_not_called()
+
+    def test_profile_load(self, conf):
+        """
+        Test the events emitted during a load
+        """
+        with profile() as stats:
+            config = InstrumentedConfiguration.load()
+
+        assert not instrument.HOOKS
+        assert config.database.port == 2
+
+        read, = stats.filter('read')
+        assert read['path'] == conf
+        assert read['bytes'] > 0
+
+        parse, = stats.filter('parse')
+        assert parse['keys'] == 4
+
+        configure = stats.filter('configure')
+        assert [info['klass'] for info in configure] == [
+            DatabaseConfiguration, InstrumentedConfiguration
+        ]
+
+        path, = stats.filter('path')
+        assert path['label'] == 'path'
+
+        load, = stats.filter('load')
+        assert load['files'] == 1
+        assert load['seconds'] >= stats.total('parse')
+        assert "load" in str(stats)
+
+    def test_profile_deferred(self, conf):
+        """
+        Test the event emitted for a deferred validation batch
+        """
+        with profile() as stats:
+            with deferred_paths():
+                InstrumentedConfiguration.load()
+
+        validate, = stats.filter('validate')
+        assert validate['paths'] == 1
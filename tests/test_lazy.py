@@ -0,0 +1,136 @@
+# tests.test_lazy
+# Testing the lazily loaded configuration proxy
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the lazily loaded configuration proxy
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import copy
+import pickle
+import pytest
+import threading
+
+from unittest import mock
+from confire.lazy import LazyConfiguration
+from tests.conftest import AppConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class LazyMockConfiguration(AppConfiguration):
+
+    debug = True
+    level = 1
+
+
+@pytest.fixture(scope='function')
+def lazy(conf_paths):
+    """
+    Returns a lazy configuration with a mocked load method.
+    """
+    conf_paths(LazyMockConfiguration, ("lazy.yaml", "level: 2\n"))
+
+    with mock.patch.object(
+        LazyMockConfiguration, 'load', wraps=LazyMockConfiguration.load
+    ) as load:
+        yield LazyMockConfiguration.lazy_load(), load
+
+
+##########################################################################
+## Lazy Tests
+##########################################################################
+
+class TestLazy(object):
+
+    def test_lazy_load(self, lazy):
+        """
+        Test that the configuration is not loaded until accessed
+        """
+        settings, load = lazy
+        assert isinstance(settings, LazyConfiguration)
+        assert not settings.loaded
+        assert "not loaded" in repr(settings)
+        load.assert_not_called()
+
+        assert settings["level"] == 2
+        assert settings.loaded
+        load.assert_called_once()
+
+    @pytest.mark.parametrize("access", [
+        lambda settings: settings["debug"],
+        lambda settings: settings.get("debug"),
+        lambda settings: settings.debug,
+        lambda settings: list(settings.options()),
+    ])
+    def test_load_on_access(self, lazy, access):
+        """
+        Test each of the access methods trigger the load exactly once
+        """
+        settings, load = lazy
+        access(settings)
+        access(settings)
+        load.assert_called_once()
+
+    def test_set_attribute(self, lazy):
+        """
+        Test that setting attributes is delegated to the configuration
+        """
+        settings, _ = lazy
+        settings.level = 3
+        assert settings["level"] == 3
+        assert settings._wrapped.level == 3
+
+    def test_threaded_load(self, lazy):
+        """
+        Test that concurrent first access only loads once
+        """
+        settings, load = lazy
+        threads = [
+            threading.Thread(target=settings.get, args=("level",))
+            for _ in range(16)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        load.assert_called_once()
+        assert settings.get("level") == 2
+
+    def test_configuration_interface(self, lazy):
+        """
+        Test that the proxy can be used where a configuration is expected
+        """
+        settings, load = lazy
+        assert isinstance(settings, LazyMockConfiguration)
+        load.assert_called_once()
+
+        config = LazyMockConfiguration()
+        config.configure(settings)
+        assert config.level == 2
+
+    @pytest.mark.parametrize("duplicate", [
+        copy.copy,
+        copy.deepcopy,
+        lambda settings: pickle.loads(pickle.dumps(settings)),
+    ])
+    def test_copy(self, lazy, duplicate):
+        """
+        Test that copying the proxy copies the loaded configuration
+        """
+        settings, _ = lazy
+        clone = duplicate(settings)
+        assert type(clone) is LazyMockConfiguration
+        assert clone.level == 2
+
+        clone.level = 3
+        assert settings.level == 2
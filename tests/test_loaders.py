@@ -0,0 +1,125 @@
+# tests.test_loaders
+# Testing the multi-format loader registry
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the multi-format loader registry
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import json
+import pytest
+
+from unittest import mock
+from confire import loaders
+from confire.exceptions import ImproperlyConfigured
+from tests.conftest import AppConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class FormatConfiguration(AppConfiguration):
+
+    level = 0
+    name  = "default"
+    items = []
+
+
+##########################################################################
+## Loader Tests
+##########################################################################
+
+class TestLoaders(object):
+
+    def test_json(self, tmpdir):
+        """
+        Test loading a JSON configuration file
+        """
+        path = tmpdir.join("conf.json")
+        path.write(json.dumps({"level": 1, "items": [1, "two"]}))
+        assert loaders.load_path(str(path)) == {"level": 1, "items": [1, "two"]}
+
+    def test_json_fallback(self):
+        """
+        Test that JSON is parsed with the standard library without orjson
+        """
+        with mock.patch.object(loaders, 'orjson', None):
+            assert loaders.load_json(b'{"level": 1}') == {"level": 1}
+
+    def test_toml(self, tmpdir):
+        """
+        Test loading a TOML configuration file
+        """
+        if loaders.tomllib is None:
+            pytest.skip("tomllib is not available")
+
+        path = tmpdir.join("conf.TOML")
+        path.write('level = 1\n\n[nested]\nname = "toml"\n')
+        assert loaders.load_path(str(path)) == {"level": 1, "nested": {"name": "toml"}}
+
+    def test_msgpack(self, tmpdir):
+        """
+        Test loading a msgpack configuration file
+        """
+        msgpack = pytest.importorskip("msgpack")
+        path = tmpdir.join("conf.msgpack")
+        path.write_binary(msgpack.packb({"level": 1, "name": "msgpack"}))
+        assert loaders.load_path(str(path)) == {"level": 1, "name": "msgpack"}
+
+    def test_missing_backend(self):
+        """
+        Test that a format without an installed parser is improperly configured
+        """
+        with mock.patch.object(loaders, 'msgpack', None):
+            with pytest.raises(ImproperlyConfigured):
+                loaders.load_msgpack(b"\x80")
+
+    def test_unregistered_is_yaml(self, tmpdir):
+        """
+        Test that unregistered extensions are parsed as YAML
+        """
+        path = tmpdir.join("conf.conf")
+        path.write("level: 1\n")
+        assert loaders.format_loader(str(path)) is None
+        assert loaders.load_path(str(path)) == {"level": 1}
+
+    def test_register(self, tmpdir):
+        """
+        Test registering and unregistering a loader by extension
+        """
+        path = tmpdir.join("conf.lines")
+        path.write("level=1\nname=lines\n")
+
+        parse = lambda data: dict(line.split("=") for line in data.decode().split())
+        loaders.register("LINES", parse)
+        try:
+            assert loaders.format_loader(str(path)) is parse
+            assert loaders.load_path(str(path)) == {"level": "1", "name": "lines"}
+        finally:
+            loaders.unregister(".lines")
+        assert loaders.format_loader(str(path)) is None
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_mixed_formats(self, conf_paths, streaming):
+        """
+        Test that CONF_PATHS precedence is the same across formats
+        """
+        first, second = conf_paths(
+            FormatConfiguration,
+            ("first.yaml", "level: 1\nname: first\n"),
+            ("second.json", '{"level": 2, "items": [2]}'),
+        )
+        config = FormatConfiguration.load(streaming=streaming)
+        assert config.level == 2
+        assert config.name == "first"
+        assert config.items == [2]
+
+        FormatConfiguration.CONF_PATHS = [str(second), str(first)]
+        config = FormatConfiguration.load(streaming=streaming)
+        assert config.level == 1
@@ -0,0 +1,169 @@
+# tests.test_overlay
+# Testing the layered overlay configurations
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the layered overlay configurations
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pickle
+import pytest
+
+from confire.config import path_setting
+from tests.conftest import AppConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class BaseConfiguration(AppConfiguration):
+
+    logdir = path_setting(required=False, raises=False)
+
+
+@pytest.fixture(scope='function')
+def base():
+    config = BaseConfiguration()
+    config.configure({"debug": True, "extra": "base", "database": {"host": "base.db"}})
+    return config
+
+
+##########################################################################
+## Overlay Tests
+##########################################################################
+
+class TestOverlay(object):
+
+    def test_overrides(self, base):
+        """
+        Test that overrides shadow the parent and other options fall through
+        """
+        child = base.overlay({"debug": False, "database": {"port": 6543}})
+        assert isinstance(child, BaseConfiguration)
+        assert child.debug is False
+        assert child["extra"] == "base"
+        assert child.get("EXTRA") == "base"
+        assert child.get("missing", 1) == 1
+        assert child.database.host == "base.db"
+        assert child.database.port == 6543
+
+        assert base.debug is True
+        assert base.database.port == 5432
+        assert BaseConfiguration.database.port == 5432
+
+        with pytest.raises(KeyError):
+            child["missing"]
+
+    def test_stores_only_overrides(self, base):
+        """
+        Test that the overlay does not copy the parent's options
+        """
+        child = base.overlay({"tenant": "a"})
+        options = [key for key in child.__dict__ if not key.startswith('_')]
+        assert options == ["tenant"]
+        assert child.database is base.database
+
+    def test_options(self, base):
+        """
+        Test that options are merged in sorted order
+        """
+        child = base.overlay({"debug": False, "tenant": "a", "database": {"port": 1}})
+        options = dict(child.options())
+        assert sorted(options) == ["database", "debug", "extra", "tenant"]
+        assert list(child.options())[0][0] == "database"
+        assert options["debug"] is False
+        database = dict(options["database"].options())
+        assert (database["host"], database["port"]) == ("base.db", 1)
+
+    def test_parent_changes(self, base):
+        """
+        Test that changes to the parent are visible through the overlay
+        """
+        child = base.overlay({"debug": False})
+        accessor = child.accessor("database.host")
+        fingerprint = child.fingerprint()
+
+        base.configure({"debug": None, "extra": "changed", "database": {"host": "new.db"}})
+        assert child.debug is False
+        assert child.extra == "changed"
+        assert accessor() == "new.db"
+        assert child.fingerprint() != fingerprint
+
+        base.added = "added"
+        assert child["added"] == "added"
+        assert "added" in dict(child.options())
+
+    def test_layers(self, base):
+        """
+        Test overlays of overlays
+        """
+        first  = base.overlay({"tenant": "first", "database": {"port": 1}})
+        second = first.overlay({"tenant": "second"})
+        assert type(second) is type(first)
+        assert second.tenant == "second"
+        assert second.database.port == 1
+        assert second.extra == "base"
+        assert first.tenant == "first"
+        assert not any(second.diff(first)[:2])
+
+    def test_paths(self, base, tmpdir):
+        """
+        Test that path settings can be overridden
+        """
+        child = base.overlay({"logdir": str(tmpdir)})
+        assert child.logdir == str(tmpdir)
+        assert base.logdir is None
+
+    def test_delete_reveals_parent(self, base):
+        """
+        Test that deleting an override falls through to the parent again
+        """
+        child = base.overlay({"debug": False, "tenant": "a"})
+        del child.debug
+        del child.tenant
+        assert child.debug is True
+        assert child.get("tenant") is None
+        assert "tenant" not in dict(child.options())
+
+    def test_nested_writes(self, base):
+        """
+        Test that writable isolates nested writes and attribute writes do not
+        """
+        child = base.overlay()
+        child.writable("database").port = 6543
+        assert child.database.port == 6543
+        assert child.database.host == "base.db"
+        assert base.database.port == 5432
+
+        # As with a ChainMap, objects read from the parent are the parent's
+        other = base.overlay()
+        other.database.host = "other.db"
+        assert base.database.host == "other.db"
+        assert child.database.host == "other.db"
+
+    def test_pickle(self, base, tmpdir):
+        """
+        Test that overlays can be pickled with their parent
+        """
+        child = base.overlay({"debug": False, "logdir": str(tmpdir), "database": {"port": 1}})
+        grandchild = child.overlay({"tenant": "a"})
+        clone = pickle.loads(pickle.dumps(grandchild))
+
+        assert type(clone) is type(grandchild)
+        assert not any(clone.diff(grandchild))
+        assert clone.tenant == "a"
+        assert clone.debug is False
+        assert clone.logdir == str(tmpdir)
+        assert clone.database.port == 1
+        assert clone.database.host == "base.db"
+        assert clone.extra == "base"
+
+        clone._parent._parent.configure({"database": {"host": "new.db"}})
+        assert clone.database.host == "new.db"
+        assert base.database.host == "base.db"
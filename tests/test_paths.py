@@ -22,7 +22,8 @@ import pytest
 import shutil
 import tempfile
 
-from confire.paths import Path
+from unittest import mock
+from confire.paths import Path, expand_path, _expand_path, deferred_paths
 from confire import path_setting
 from six import with_metaclass, string_types
 from confire.descriptors import SettingsMeta
@@ -338,3 +339,75 @@ class TestPaths():
                 setattr(obj, path, MISSDIR)
             except ImproperlyConfigured:
                 self.fail("Improperly configured raised on %s" % path)
+
+    def test_expand_path_cache(self):
+        """
+        Test that path expansion is memoized but follows the environment
+        """
+        _expand_path.cache_clear()
+        assert expand_path("${}".format(ENVVAR)) == VARSDIR
+        assert expand_path("${}".format(ENVVAR)) == VARSDIR
+        assert _expand_path.cache_info().hits == 1
+
+        os.environ[ENVVAR] = TESTDIR
+        try:
+            assert expand_path("${{{}}}".format(ENVVAR)) == TESTDIR
+        finally:
+            os.environ[ENVVAR] = VARSDIR
+
+    def test_expand_path_cwd(self, tmpdir):
+        """
+        Test that relative path expansion follows the working directory
+        """
+        relative = expand_path("relative/path")
+        with tmpdir.as_cwd():
+            assert expand_path("relative/path") == os.path.join(str(tmpdir), "relative", "path")
+            assert expand_path("relative/path", absolute=False) == "relative/path"
+        assert expand_path("relative/path") == relative
+
+    def test_deferred_paths(self, mockobj):
+        """
+        Test that deferred paths are validated when the context exits
+        """
+        obj, _ = mockobj
+        with mock.patch('confire.paths.os.makedirs', wraps=os.makedirs) as makedirs:
+            with deferred_paths():
+                obj.mkdirs_path = MISSDIR
+                obj.mk_no_raise_path = MISSDIR
+                obj.default_path = TESTFILE
+                obj.silent_path = TESTFILE
+
+                # Nothing is created or stored until the batch is validated
+                makedirs.assert_not_called()
+                assert obj.default_path == TESTDIR
+
+            # Directories shared by several settings are created once
+            assert makedirs.call_args_list.count(mock.call(MISSDIR)) == 1
+
+        assert os.path.exists(MISSDIR)
+        assert obj.mkdirs_path == MISSDIR
+        assert obj.mk_no_raise_path == MISSDIR
+        assert obj.default_path == TESTFILE
+        assert obj.silent_path == TESTFILE
+
+    def test_deferred_paths_raises(self, mockobj):
+        """
+        Test that deferred validation raises or warns on missing paths
+        """
+        obj, _ = mockobj
+        with pytest.raises(ImproperlyConfigured):
+            with deferred_paths():
+                obj.standard_path = MISSFILE
+
+        with pytest.warns(PathNotFound):
+            with deferred_paths():
+                obj.dont_raise_path = MISSFILE
+
+    def test_deferred_paths_disabled(self, mockobj):
+        """
+        Test that a disabled deferral validates paths immediately
+        """
+        obj, _ = mockobj
+        with deferred_paths(enabled=False):
+            with pytest.raises(ImproperlyConfigured):
+                obj.standard_path = MISSFILE
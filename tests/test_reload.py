@@ -0,0 +1,132 @@
+# tests.test_reload
+# Testing the configuration reloader
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the configuration reloader
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import time
+import pytest
+
+from unittest import mock
+from confire.reload import Reloader, file_key
+from confire.exceptions import ReloadFailed
+from tests.conftest import AppConfiguration, touch
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+@pytest.fixture(scope='function')
+def confs(conf_paths):
+    return conf_paths(
+        AppConfiguration,
+        ("first.yaml", "debug: true\ndatabase:\n  host: db.example.com\n"),
+        ("second.yaml", None),
+    )
+
+
+##########################################################################
+## Reloader Tests
+##########################################################################
+
+class TestReloader(object):
+
+    def test_initial_load(self, confs):
+        """
+        Test that the reloader publishes the loaded configuration
+        """
+        reloader = Reloader(AppConfiguration)
+        assert reloader.settings.debug is True
+        assert reloader.settings.database.host == "db.example.com"
+        assert reloader.check() is None
+
+    def test_reload_diff(self, confs):
+        """
+        Test that a change publishes a new configuration with a diff
+        """
+        first, second = confs
+        reloader = Reloader(AppConfiguration)
+        callback = reloader.subscribe(mock.MagicMock())
+        old = reloader.settings
+
+        touch(second, "database:\n  port: 6543\nworkers: 4\n")
+        delta = reloader.check()
+
+        assert reloader.settings is not old
+        assert delta.added == ["workers"]
+        assert delta.removed == []
+        assert delta.changed == ["database.port"]
+        callback.assert_called_once_with(reloader.settings, delta)
+
+        # The old snapshot is not modified by the reload
+        assert old.database.port == 5432
+        assert reloader.settings.database.port == 6543
+        assert reloader.settings.database.host == "db.example.com"
+
+    def test_reparse_changed_only(self, confs):
+        """
+        Test that only the modified file is reparsed
+        """
+        first, _ = confs
+        reloader = Reloader(AppConfiguration)
+
+        with mock.patch('confire.reload.load_path') as load_path:
+            load_path.return_value = {"debug": False}
+            touch(first, "debug: false\n")
+            reloader.check()
+            load_path.assert_called_once_with(str(first))
+
+        assert reloader.settings.debug is False
+
+    def test_removed_file(self, confs):
+        """
+        Test that deleting a configuration file reverts its options
+        """
+        first, _ = confs
+        reloader = Reloader(AppConfiguration)
+        first.remove()
+
+        delta = reloader.check()
+        assert delta.changed == ["database.host", "debug"]
+        assert reloader.settings.debug is False
+
+    def test_watcher_thread(self, confs):
+        """
+        Test that the watcher thread picks up changes
+        """
+        first, _ = confs
+        reloader = Reloader(AppConfiguration, interval=0.01)
+        reloader.start()
+
+        try:
+            touch(first, "debug: false\n")
+            for _ in range(500):
+                if reloader.settings.debug is False:
+                    break
+                time.sleep(0.01)
+            assert reloader.settings.debug is False
+        finally:
+            reloader.stop()
+
+    def test_reload_failed(self, confs):
+        """
+        Test that a parse error keeps the previous configuration
+        """
+        first, _ = confs
+        reloader = Reloader(AppConfiguration)
+        settings = reloader.settings
+
+        touch(first, "debug: [unclosed\n")
+        with pytest.warns(ReloadFailed):
+            reloader._reload()
+
+        assert reloader.settings is settings
+        assert file_key(str(first)) != reloader._keys[str(first)]
@@ -0,0 +1,163 @@
+# tests.test_render
+# Testing the rendering of configurations as text
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the rendering of configurations as text
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+import datetime
+
+from io import StringIO
+from collections import OrderedDict
+from confire import render
+from confire.config import Configuration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class Counted(object):
+    """
+    Counts the number of times it has been repr'd.
+    """
+
+    calls = 0
+
+    def __repr__(self):
+        Counted.calls += 1
+        return "<counted>"
+
+
+class NestedConfiguration(Configuration):
+
+    host = "localhost"
+    port = 5432
+
+
+class RenderConfiguration(Configuration):
+
+    debug  = True
+    name   = "a string   with\twhitespace"
+    nested = NestedConfiguration()
+
+
+def legacy_str(config):
+    """
+    The previous string concatenation implementation of __str__.
+    """
+    s = ""
+    for opt, val in config.options():
+        r = repr(val)
+        r = " ".join(r.split())
+        wlen = 76-max(len(opt),10)
+        if len(r) > wlen:
+            r = r[:wlen-3]+"..."
+        s += "%-10s = %s\n" % (opt, r)
+    return s[:-1]
+
+
+recursive = [1, 2]
+recursive.append(recursive)
+
+VALUES = [
+    None, 42, 3.14, "short", "x" * 200, "  padded  ", b"bytes",
+    [], [1], list(range(1000)), (), (1,), tuple(range(100)),
+    {}, {"a": 1, 2: [3, 4]}, {str(idx): idx for idx in range(500)},
+    set(), {1, 2, 3}, set(range(500)), frozenset(), frozenset(["a"]),
+    frozenset(range(500)), [[" a  b "] * 3] * 40, recursive,
+    datetime.date(2026, 10, 19), OrderedDict(a=1), [NestedConfiguration()] * 10,
+]
+
+
+##########################################################################
+## Rendering Tests
+##########################################################################
+
+class TestRender(object):
+
+    @pytest.mark.parametrize("value", VALUES)
+    @pytest.mark.parametrize("name", ["opt", "a_much_longer_option_name", "x" * 75])
+    def test_legacy_output(self, name, value):
+        """
+        Test that the output is identical to the previous implementation
+        """
+        config = RenderConfiguration()
+        setattr(config, name, value)
+        assert str(config) == legacy_str(config)
+
+    def test_nested_output(self):
+        """
+        Test that nested configurations render on a single line
+        """
+        config = RenderConfiguration()
+        assert str(config) == legacy_str(config)
+        assert "nested     = host = 'localhost' port = 5432" in str(config)
+
+    def test_bounded(self):
+        """
+        Test that only the items needed to fill the line are rendered
+        """
+        config = RenderConfiguration()
+        config.items = [Counted() for _ in range(10000)]
+
+        Counted.calls = 0
+        line = str(config).split("\n")[1]
+        assert line.startswith("items      = [<counted>, <counted>")
+        assert line.endswith("...")
+        assert len(line) == 79
+        assert Counted.calls < 10
+
+    def test_bounded_repr(self):
+        """
+        Test the bounded repr of values that fit and are truncated
+        """
+        assert render.bounded_repr([1, 2, 3], 10) == "[1, 2, 3]"
+        assert render.bounded_repr(list(range(100)), 10) == "[0, 1, ..."
+        assert render.bounded_repr({"a": " b  c "}, 76) == "{'a': ' b c '}"
+
+
+##########################################################################
+## Dump Tests
+##########################################################################
+
+class TestDump(object):
+
+    def test_dump(self):
+        """
+        Test dumping nested configurations as indented sections
+        """
+        config = RenderConfiguration()
+        config.nested = NestedConfiguration()
+        config.nested.items = list(range(1000))
+
+        fp = StringIO()
+        config.dump(fp)
+        lines = fp.getvalue().split("\n")
+
+        assert lines[0] == "debug      = True"
+        assert lines[1] == "name       = 'a string with\\twhitespace'"
+        assert lines[2] == "nested:"
+        assert lines[3] == "    host       = 'localhost'"
+        assert lines[4].startswith("    items      = [0, 1, 2")
+        assert len(lines[4]) == 79
+        assert lines[5] == "    port       = 5432"
+        assert lines[6] == ""
+
+    def test_dump_unbounded(self):
+        """
+        Test that no values are truncated without a width
+        """
+        config = RenderConfiguration()
+        config.items = list(range(1000))
+
+        fp = StringIO()
+        config.dump(fp, width=None)
+        assert "items      = {!r}\n".format(list(range(1000))) in fp.getvalue()
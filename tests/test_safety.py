@@ -18,6 +18,7 @@ Testing the paths descriptor
 ##########################################################################
 
 import os
+import yaml
 
 from unittest import mock
 
@@ -27,14 +28,34 @@ TESTDATA = os.path.join(os.path.dirname(__file__), "testdata")
 TESTCONF = os.path.join(TESTDATA, "testconf.yaml")
 
 
-@mock.patch('confire.config.yaml')
+SAFE_LOADERS = tuple(
+    getattr(yaml, name) for name in ('SafeLoader', 'CSafeLoader')
+    if hasattr(yaml, name)
+)
+
+
+@mock.patch('confire.loaders.yaml')
 def test_use_yaml_safe_load(mock_yaml):
     """
-    Ensure we're using yaml.safe_load not yaml.load
+    Ensure we're parsing with a safe loader, not the default yaml.load
     """
     from confire.config import Configuration
     Configuration.CONF_PATHS = [TESTCONF]
     Configuration.load()
 
-    mock_yaml.safe_load.assert_called_once()
-    mock_yaml.load.assert_not_called()
+    mock_yaml.load.assert_called_once()
+    _, kwargs = mock_yaml.load.call_args
+    assert kwargs['Loader'] in SAFE_LOADERS
+
+
+def test_fastest_safe_loader():
+    """
+    Ensure the libyaml loader is used when it is available
+    """
+    from confire.loaders import YAMLLoader, yaml_loader
+
+    assert YAMLLoader in SAFE_LOADERS
+    if yaml.__with_libyaml__:
+        assert yaml_loader() == "CSafeLoader"
+    else:
+        assert yaml_loader() == "SafeLoader"
@@ -0,0 +1,149 @@
+# tests.test_shared
+# Testing read-only configurations shared between processes
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing read-only configurations shared between processes
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import os
+import sys
+import pytest
+import datetime
+import subprocess
+
+from confire.config import Configuration
+from confire.shared import Segment, SharedConfiguration, serialize
+from tests.conftest import AppConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class SharedTestConfiguration(AppConfiguration):
+
+    debug    = True
+    name     = "shared"
+    hosts    = ["a", "b"]
+    started  = datetime.date(2014, 8, 11)
+
+
+@pytest.fixture
+def path(tmpdir):
+    return str(tmpdir.join("shared.conf"))
+
+
+##########################################################################
+## Shared Tests
+##########################################################################
+
+class TestShared(object):
+
+    def test_round_trip(self, path):
+        """
+        Test that shared options can be read from the mapped segment
+        """
+        assert SharedTestConfiguration().share(path) == 1
+        settings = Segment(path).settings
+
+        assert isinstance(settings, SharedConfiguration)
+        assert settings.debug is True
+        assert settings.hosts == ["a", "b"]
+        assert settings.started == datetime.date(2014, 8, 11)
+        assert settings.database.host == "localhost"
+        assert settings.database.pool.timeout == 30
+        assert settings["DATABASE"]["Port"] == 5432
+        assert settings.get("missing", 42) == 42
+        assert isinstance(settings.get("database"), SharedConfiguration)
+
+    def test_options(self, path):
+        """
+        Test that options and str match the original configuration
+        """
+        config = SharedTestConfiguration()
+        config.share(path)
+        settings = Segment(path).settings
+
+        assert [opt for opt, _ in settings.options()] == [opt for opt, _ in config.options()]
+        assert dict(settings.database.pool.options()) == {"size": 10, "timeout": 30}
+        assert str(settings) == str(config)
+
+    def test_missing(self, path):
+        """
+        Test that missing options raise key and attribute errors
+        """
+        SharedTestConfiguration().share(path)
+        settings = Segment(path).settings
+
+        with pytest.raises(KeyError):
+            settings["missing"]
+        with pytest.raises(AttributeError):
+            settings.missing
+        with pytest.raises(AttributeError):
+            settings.database.pool.missing
+
+    def test_read_only(self, path):
+        """
+        Test that shared configurations cannot be modified
+        """
+        SharedTestConfiguration().share(path)
+        settings = Segment(path).settings
+
+        with pytest.raises(AttributeError):
+            settings.debug = False
+        with pytest.raises(AttributeError):
+            del settings.database
+
+    def test_empty(self):
+        """
+        Test that serialization handles configurations without options
+        """
+        data = serialize(Configuration())
+        assert data.startswith(b"CONFIRE")
+        assert len(data) > 0
+
+    def test_refresh(self, path):
+        """
+        Test that refresh maps new versions without changing old views
+        """
+        config = SharedTestConfiguration()
+        config.share(path)
+        segment = Segment(path)
+        old = segment.settings
+        assert not segment.stale()
+        assert not segment.refresh()
+
+        config.debug = False
+        config.writable("database").host = "db1"
+        assert config.share(path) == 2
+        assert segment.stale()
+        assert segment.refresh()
+        assert not segment.stale()
+
+        assert segment.version == 2
+        assert segment.settings.debug is False
+        assert segment.settings.database.host == "db1"
+        assert old.debug is True
+        assert old.database.host == "localhost"
+
+    def test_worker(self, path):
+        """
+        Test that another process can read the shared configuration
+        """
+        SharedTestConfiguration().share(path)
+        script = (
+            "import sys\n"
+            "from confire.shared import Segment\n"
+            "settings = Segment(sys.argv[1]).settings\n"
+            "print(settings.database.pool.size, settings.name)\n"
+        )
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.check_output([sys.executable, "-c", script, path], cwd=root)
+        assert output.split() == [b"10", b"shared"]
@@ -0,0 +1,155 @@
+# tests.test_snapshot
+# Testing the atomic publication of configuration snapshots
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the atomic publication of configuration snapshots
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import threading
+
+from timeit import default_timer as timer
+
+from confire.snapshot import Published
+from tests.conftest import AppConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+class PublishedConfiguration(AppConfiguration):
+
+    name = "published"
+
+
+def make():
+    """
+    Returns a configuration whose database host matches its port.
+    """
+    config = PublishedConfiguration()
+    config.configure({"database": {"host": "db0", "port": 0}})
+    return config
+
+
+##########################################################################
+## Published Tests
+##########################################################################
+
+class TestPublished(object):
+
+    def test_update(self):
+        """
+        Test that updates publish a new version without modifying the old
+        """
+        published = Published(make())
+        pinned = published.pin()
+        assert pinned.version == 0
+
+        config = published.update({"database": {"host": "db1", "port": 1}})
+        assert published.current is config
+        assert published.version == 1
+        assert config.database.host == "db1"
+        assert config.database.pool.size == 10
+
+        assert pinned.config.database.host == "db0"
+        assert PublishedConfiguration.database.host == "localhost"
+
+    def test_update_paths(self, tmpdir):
+        """
+        Test that updates keep the path settings of nested configurations
+        """
+        config = PublishedConfiguration()
+        config.configure({"database": {"datadir": str(tmpdir)}})
+        published = Published(config)
+
+        new = published.update({"database": {"port": 2}})
+        assert new.database.datadir == str(tmpdir)
+        assert new.database.port == 2
+        assert config.database.datadir == str(tmpdir)
+
+    def test_set_many(self):
+        """
+        Test publishing a new version by dotted path
+        """
+        published = Published(make())
+        old = published.current
+        published.set_many({"database.pool.size": 20, "name": "new"})
+
+        assert published.current.database.pool.size == 20
+        assert published.current.name == "new"
+        assert old.database.pool.size == 10
+        assert old.name == "published"
+
+    def test_set_many_dicts(self):
+        """
+        Test that set_many does not modify dicts of the old version
+        """
+        published = Published(make())
+        old = published.current
+        old.configure({"limits": {"x": 1}})
+        published.set_many({"limits.x": 2})
+
+        assert published.current["limits"] == {"x": 2}
+        assert old["limits"] == {"x": 1}
+
+    def test_publish(self):
+        """
+        Test publishing a configuration built elsewhere
+        """
+        published = Published()
+        assert published.current is None
+
+        first, second = PublishedConfiguration(), PublishedConfiguration()
+        assert published.publish(first) is None
+        assert published.publish(second) is first
+        assert published.pin() == (2, second)
+
+    def test_stress(self):
+        """
+        Test that readers always see consistent versions during updates
+        """
+        published = Published(make())
+        stopped   = threading.Event()
+        errors    = []
+        reads     = []
+
+        def reader():
+            count = 0
+            while True:
+                settings = published.current
+                host, port = settings.database.host, settings.database.port
+                if host != "db{}".format(port):
+                    errors.append((host, port))
+                count += 1
+                if stopped.is_set():
+                    break
+            reads.append(count)
+
+        def writer():
+            for idx in range(1, 1001):
+                published.update({"database": {"host": "db{}".format(idx), "port": idx}})
+            stopped.set()
+
+        threads = [threading.Thread(target=reader) for _ in range(8)]
+        threads.append(threading.Thread(target=writer))
+
+        started = timer()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        elapsed = timer() - started
+
+        assert not errors
+        assert published.version == 1000
+        assert published.current.database.host == "db1000"
+        assert len(reads) == 8 and all(reads)
+
+        # Throughput depends on the machine, so it is reported, not checked
+        print("{:.0f} reads per second".format(sum(reads) / elapsed))
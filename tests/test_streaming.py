@@ -0,0 +1,242 @@
+# tests.test_streaming
+# Testing the streaming YAML ingestion
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the streaming YAML ingestion
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import yaml
+import pytest
+import datetime
+
+from confire.loaders import load_yaml
+from confire.streaming import stream_yaml
+from tests.conftest import AppConfiguration, DatabaseConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+LOADERS = [yaml.SafeLoader]
+if yaml.__with_libyaml__:
+    LOADERS.append(yaml.CSafeLoader)
+
+
+DOCUMENT = """
+debug: true
+port: 5432
+ratio: 0.5
+created: 2026-10-17
+items: [apples, bananas]
+Upper: case
+defaults: &defaults
+  retries: 3
+  timeout: 10
+database:
+  host: db.example.com
+  pool:
+    <<: *defaults
+    timeout: 20
+  extra: added
+ignored:
+  huge: [1, 2, 3]
+  nested: {a: b}
+"""
+
+
+class StreamDatabaseConfiguration(DatabaseConfiguration):
+
+    pool = None
+
+
+class StreamConfiguration(AppConfiguration):
+
+    IGNORE_OPTIONS = ("ignored",)
+
+    database = StreamDatabaseConfiguration()
+
+
+class StrictDatabaseConfiguration(StreamDatabaseConfiguration):
+
+    STRICT_OPTIONS = True
+
+
+class StrictConfiguration(StreamConfiguration):
+
+    STRICT_OPTIONS = True
+
+    port     = None
+    database = StrictDatabaseConfiguration()
+
+
+def fresh():
+    config = StreamConfiguration()
+    config.database = StreamDatabaseConfiguration()
+    return config
+
+
+##########################################################################
+## Streaming Tests
+##########################################################################
+
+@pytest.mark.parametrize("Loader", LOADERS)
+class TestStreaming(object):
+
+    def test_stream_matches_load(self, Loader):
+        """
+        Test that streaming produces the same configuration as configure
+        """
+        streamed = stream_yaml(DOCUMENT, fresh(), Loader)
+        loaded = fresh()
+        loaded.configure(load_yaml(DOCUMENT, Loader))
+
+        assert dict(streamed.options()).keys() == dict(loaded.options()).keys()
+        assert dict(streamed.database.options()) == dict(loaded.database.options())
+
+        assert streamed.debug is True
+        assert streamed.port == 5432
+        assert streamed.created == datetime.date(2026, 10, 17)
+        assert streamed.items == ["apples", "bananas"]
+        assert streamed.database.host == "db.example.com"
+        assert streamed.database.pool == {"retries": 3, "timeout": 20}
+        assert streamed.database.extra == "added"
+
+    def test_ignore_options(self, Loader):
+        """
+        Test that ignored options are skipped by both loading paths
+        """
+        streamed = stream_yaml(DOCUMENT, fresh(), Loader)
+        assert streamed.get("ignored") is None
+        assert streamed.get("defaults") is not None
+
+        loaded = fresh()
+        loaded.configure(load_yaml(DOCUMENT, Loader))
+        assert loaded.get("ignored") is None
+
+    @pytest.mark.parametrize("document", ["", "# only a comment\n", "~\n"])
+    def test_empty_documents(self, Loader, document):
+        """
+        Test that empty documents do not modify the configuration
+        """
+        config = stream_yaml(document, fresh(), Loader)
+        assert config.debug is False
+
+    def test_top_level_merge(self, Loader):
+        """
+        Test that a merge key at the streamed level is applied
+        """
+        document = "base: &base\n  debug: true\n<<: *base\n"
+        config = stream_yaml(document, fresh(), Loader)
+        assert config.debug is True
+
+    @pytest.mark.parametrize("document", [
+        "database:\n  host: explicit\n  <<: {host: merged, extra: merged}\n",
+        "debug: false\n<<: {debug: true, port: 1}\n",
+        "<<: [{port: 1}, {port: 2, debug: true}]\ndebug: false\n",
+        "database: {port: 1}\n<<: {database: {host: merged}}\n",
+    ])
+    def test_explicit_keys_override_merge(self, Loader, document):
+        """
+        Test that explicit keys win over merge keys that follow them
+        """
+        streamed = stream_yaml(document, fresh(), Loader)
+        loaded = fresh()
+        loaded.configure(load_yaml(document, Loader))
+
+        assert dict(streamed.options()).keys() == dict(loaded.options()).keys()
+        assert streamed.debug == loaded.debug
+        assert streamed.get("port") == loaded.get("port")
+        assert dict(streamed.database.options()) == dict(loaded.database.options())
+
+    @pytest.mark.parametrize("document", [
+        "database: {host: q}\ndatabase: {port: 9}\n",
+        "database: {host: q}\ndatabase: &db {port: 9}\n",
+        "database:\n  pool: {size: 1}\ndatabase:\n  pool: {timeout: 2}\n",
+        "database: {host: q}\ndebug: true\ndebug: false\ndatabase: ~\n",
+        "database: {port: 1}\n<<: {database: {host: merged}}\ndatabase: {port: 2}\n",
+    ])
+    def test_duplicate_keys(self, Loader, document):
+        """
+        Test that a duplicate key replaces the earlier value like safe_load
+        """
+        for owned in (False, True):
+            streamed, loaded = AppConfiguration(), AppConfiguration()
+            if owned:
+                streamed.configure({"database": {"host": "owned", "pool": {"size": 5}}})
+                loaded.configure({"database": {"host": "owned", "pool": {"size": 5}}})
+
+            stream_yaml(document, streamed, Loader)
+            loaded.configure(load_yaml(document, Loader))
+            assert not any(streamed.diff(loaded))
+
+        assert AppConfiguration.database.host == "localhost"
+        assert AppConfiguration.database.pool.size == 10
+
+    def test_multiple_documents(self, Loader):
+        """
+        Test that multiple documents are rejected like yaml.load
+        """
+        with pytest.raises(yaml.composer.ComposerError):
+            stream_yaml("debug: true\n---\ndebug: false\n", fresh(), Loader)
+
+    def test_load_streaming(self, Loader, conf_paths):
+        """
+        Test the streaming mode of load
+        """
+        conf_paths(StreamConfiguration, ("conf.yaml", DOCUMENT))
+        config = StreamConfiguration.load(streaming=True)
+        assert config.debug is True
+
+    def test_strict_options(self, Loader):
+        """
+        Test that undeclared options are skipped by strict configurations
+        """
+        config = StrictConfiguration()
+        config.database = StrictDatabaseConfiguration()
+        stream_yaml(DOCUMENT, config, Loader)
+
+        assert config.debug is True
+        assert config.port == 5432
+        assert config.get("items") is None
+        assert config.get("defaults") is None
+        assert config.database.host == "db.example.com"
+        assert config.database.pool == {"retries": 3, "timeout": 20}
+        assert config.database.get("extra") is None
+
+    def test_skipped_anchors(self, Loader):
+        """
+        Test that anchors defined inside skipped values can still be aliased
+        """
+        document = "ignored:\n  a: &a {debug: true}\n  b: [&b 1]\n<<: *a\nport: *b\n"
+        config = stream_yaml(document, fresh(), Loader)
+        assert config.debug is True
+        assert config.port == 1
+        assert config.get("ignored") is None
+
+    def test_strict_skips_parsing(self, Loader, conf_paths):
+        """
+        Test that strict classes stream by default, leaving undeclared values unparsed
+        """
+        conf_paths(StrictConfiguration, (
+            "conf.yaml", "debug: true\nundeclared: !!python/name:os.system\n"
+        ))
+        config = StrictConfiguration.load()
+        with pytest.raises(yaml.constructor.ConstructorError):
+            StrictConfiguration.load(streaming=False)
+        assert config.debug is True
+        assert config.get("undeclared") is None
+
+    def test_copy_on_write(self, Loader):
+        """
+        Test that streaming copies nested defaults before writing to them
+        """
+        config = stream_yaml(DOCUMENT, StreamConfiguration(), Loader)
+        assert config.database.host == "db.example.com"
+        assert StreamConfiguration.database.host == "localhost"
@@ -0,0 +1,74 @@
+# tests.test_views
+# Testing the read-only configuration views
+#
+# For license information, see LICENSE.txt
+
+"""
+Testing the read-only configuration views
+"""
+
+##########################################################################
+## Imports
+##########################################################################
+
+import pytest
+
+from confire.shared import Segment
+from confire.flat import FlatConfiguration
+from confire.views import ConfigurationView
+from tests.conftest import AppConfiguration
+
+
+##########################################################################
+## Fixtures
+##########################################################################
+
+@pytest.fixture(params=["frozen", "flat", "shared"])
+def view(request, tmpdir):
+    config = AppConfiguration()
+    if request.param == "frozen":
+        return config.freeze()
+    if request.param == "flat":
+        return FlatConfiguration.from_config(config)
+
+    path = str(tmpdir.join("shared.conf"))
+    config.share(path)
+    return Segment(path).settings
+
+
+##########################################################################
+## View Tests
+##########################################################################
+
+class TestConfigurationView(object):
+
+    def test_access(self, view):
+        """
+        Test the case insensitive item, get and attribute access of views
+        """
+        assert isinstance(view, ConfigurationView)
+        assert view["DEBUG"] is False
+        assert view.get("Debug") is False
+        assert view.database.port == 5432
+        assert view.get("missing", 1) == 1
+        assert str(view) == str(AppConfiguration())
+
+    def test_missing(self, view):
+        """
+        Test that missing options raise key and attribute errors
+        """
+        with pytest.raises(KeyError, match="has no configuration 'missing'"):
+            view["Missing"]
+
+        with pytest.raises(AttributeError, match="has no configuration 'missing'"):
+            view.missing
+
+        with pytest.raises(AttributeError):
+            view._private
+
+    def test_read_only(self, view):
+        """
+        Test that options cannot be deleted from views
+        """
+        with pytest.raises(AttributeError):
+            del view.debug